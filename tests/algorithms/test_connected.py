@@ -80,3 +80,19 @@ def test_largest_connected_hypergraph(edgelist1, edgelist2):
     xgi.largest_connected_hypergraph(H2, in_place=True)
     assert xgi.is_connected(H2)
     assert sorted(H2.nodes) == [3, 4, 5, 6]
+
+
+def test_connected_components_cache(edgelist1):
+    H = xgi.Hypergraph(edgelist1)
+    assert xgi.number_connected_components(H) == 3
+    cc = list(xgi.connected_components(H))
+    assert H.cache_info().hits == 1
+
+    # the components are copies
+    cc[0].add(100)
+    assert xgi.node_connected_component(H, 1) == {1, 2, 3}
+
+    H.add_edge([3, 4, 5])
+    assert xgi.number_connected_components(H) == 1
+    assert xgi.is_connected(H)
+    assert xgi.largest_connected_component(H) == set(H.nodes)
@@ -0,0 +1,148 @@
+import copy
+
+import numpy as np
+import pytest
+
+import xgi
+from xgi.classes.columnar import AttrRow, ColumnarAttrs
+from xgi.exception import IDNotFound, XGIError
+
+
+def test_columnar_attrs():
+    store = ColumnarAttrs([(1, {"w": 1}), (2, {"w": 2.5, "c": "red"}), (3, {})])
+    assert list(store) == [1, 2, 3]
+    assert len(store) == 3
+    assert 2 in store and 4 not in store
+    assert isinstance(store[2], AttrRow)
+    assert store[2] == {"w": 2.5, "c": "red"}
+    assert store[3] == {}
+    with pytest.raises(IDNotFound):
+        store[4]
+    with pytest.raises(XGIError):
+        store[None] = {}
+
+    # integers are promoted to floats, other types to objects
+    assert store._columns["w"].dtype == np.float64
+    assert store._columns["c"].dtype == object
+    assert store[1]["w"] == 1.0
+    store[3]["w"] = "x"
+    assert store._columns["w"].dtype == object
+    assert store[1]["w"] == 1.0 and store[3]["w"] == "x"
+
+    # assigning replaces all the attributes
+    store[2] = {"n": 3}
+    assert store[2] == {"n": 3}
+    store[2] = store[2]
+    assert store[2] == {"n": 3}
+
+
+def test_columnar_attrs_rows():
+    store = ColumnarAttrs([(1, {})])
+    row = store[1]
+    row["l"] = [1, 2]
+    row["b"] = True
+    row.update(x=1)
+    assert row == {"l": [1, 2], "b": True, "x": 1}
+    assert type(row["x"]) is int and type(row["b"]) is bool
+    assert row.get("y", 5) == 5
+    assert "l" in row and "y" not in row
+    assert len(row) == 3
+    del row["b"]
+    assert sorted(row) == ["l", "x"]
+    with pytest.raises(KeyError):
+        row["b"]
+    with pytest.raises(KeyError):
+        del row["b"]
+    assert repr(row) == "{'l': [1, 2], 'x': 1}"
+
+    d = row.copy()
+    assert type(d) is dict and d == row
+    assert type(copy.copy(row)) is dict
+    d = copy.deepcopy(row)
+    d["l"].append(3)
+    assert row["l"] == [1, 2]
+
+    del store[1]
+    with pytest.raises(IDNotFound):
+        row["l"]
+
+
+def test_columnar_attrs_columns():
+    store = ColumnarAttrs((i, {"w": i}) for i in range(10))
+    for i in range(0, 10, 2):
+        del store[i]
+    assert list(store) == [1, 3, 5, 7, 9]
+    store[10] = {"w": 10, "c": "blue"}
+
+    assert store.column("w").tolist() == [1, 3, 5, 7, 9, 10]
+    assert store.column("w").dtype == np.int64
+    assert store.column("c", default="").tolist() == [""] * 5 + ["blue"]
+    assert np.isnan(store.column("c")[0])
+    assert store.column("z", default=0).tolist() == [0] * 6
+    assert store.mask("c").tolist() == [False] * 5 + [True]
+    assert store.positions() == {1: 0, 3: 1, 5: 2, 7: 3, 9: 4, 10: 5}
+
+    store.set_column("w", np.arange(6, dtype=np.int32) / 2)
+    assert store[3]["w"] == 0.5
+    store.set_column("s", np.array(["a", "b", "c", "d", "e", "f"]))
+    assert type(store[1]["s"]) is str
+    with pytest.raises(XGIError):
+        store.set_column("w", [1, 2])
+
+    new = store.copy()
+    new[1]["w"] = 5
+    assert store[1]["w"] == 0.0
+    store.clear()
+    assert len(store) == 0 and len(new) == 6
+
+
+def test_set_attr_backend(edgelist1):
+    H = xgi.Hypergraph(edgelist1)
+    H.add_node(1, color="red")
+    H.add_edge([1, 2], id="a", weight=2)
+    assert H.attr_backend == "dict"
+
+    H.set_attr_backend("columnar")
+    assert H.attr_backend == "columnar"
+    assert isinstance(H.nodes[1], AttrRow)
+    assert H.nodes[1] == {"color": "red"}
+    assert H.edges["a"] == {"weight": 2}
+
+    # the structure can still be modified
+    H.add_node(9, color="blue")
+    H.add_edge([9, 1], id="b", weight=3)
+    H.add_node_to_edge("c", 9)
+    H.remove_node(2)
+    H.remove_edge(3)
+    assert list(H._node_attr) == list(H.nodes)
+    assert list(H._edge_attr) == list(H.edges)
+    assert xgi.get_node_attributes(H, "color") == {1: "red", 9: "blue"}
+    assert xgi.get_edge_attributes(H, "weight") == {"a": 2, "b": 3}
+
+    C = H.copy()
+    assert C.attr_backend == "columnar"
+    C.nodes[1]["color"] = "green"
+    assert H.nodes[1]["color"] == "red"
+    D = H.dual()
+    assert D.attr_backend == "columnar"
+    assert D.edges[9] == {"color": "blue"}
+
+    H.set_attr_backend("dict")
+    assert type(H.nodes[1]) is xgi.classes.hypergraph.IDDict
+    assert H.nodes[9] == {"color": "blue"}
+    assert H.edges["b"] == {"weight": 3}
+
+    with pytest.raises(XGIError):
+        H.set_attr_backend("arrow")
+    with pytest.raises(XGIError):
+        xgi.CompactHypergraph(H).set_attr_backend("columnar")
+
+
+def test_columnar_json(edgelist1, tmp_path):
+    H = xgi.Hypergraph(edgelist1)
+    H.set_attr_backend("columnar")
+    xgi.set_node_attributes(H, {1: "red"}, name="color")
+    fname = tmp_path / "test.json"
+    xgi.write_hypergraph_json(H, fname)
+    H2 = xgi.read_hypergraph_json(fname)
+    assert H2.nodes["1"] == {"color": "red"}
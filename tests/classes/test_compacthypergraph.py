@@ -0,0 +1,226 @@
+import pickle
+
+import numpy as np
+import pytest
+
+import xgi
+from xgi.exception import IDNotFound, XGIError
+
+
+def test_constructor(edgelist1, edgelist5, dict5, incidence5):
+    for data in [edgelist1, edgelist5, dict5, incidence5]:
+        H = xgi.Hypergraph(data)
+        C = xgi.CompactHypergraph(data)
+        assert list(C.nodes) == list(H.nodes)
+        assert list(C.edges) == list(H.edges)
+        assert C.edges.members(dtype=dict) == H.edges.members(dtype=dict)
+        assert C.nodes.memberships() == H.nodes.memberships()
+
+    C = xgi.CompactHypergraph(edgelist1, name="test")
+    assert C["name"] == "test"
+    assert xgi.CompactHypergraph(C).edges.members() == C.edges.members()
+    assert C.num_nodes == 8
+    assert C.num_edges == 4
+
+
+def test_arrays(edgelist1):
+    C = xgi.CompactHypergraph(edgelist1)
+    assert C._node_indptr.dtype == np.int32
+    assert C._edge_indptr.tolist() == [0, 3, 4, 6, 9]
+    assert C._edge_indices.tolist() == [0, 1, 2, 3, 4, 5, 5, 6, 7]
+    assert C._node_indptr.tolist() == [0, 1, 2, 3, 4, 5, 7, 8, 9]
+    assert C._node_indices.tolist() == [0, 0, 0, 1, 2, 2, 3, 3, 3]
+    assert not C._edge_indices.flags.writeable
+
+
+def test_freeze(edgelist1):
+    H = xgi.Hypergraph(edgelist1)
+    C = xgi.freeze(H, compact=True)
+    assert isinstance(C, xgi.CompactHypergraph)
+    assert xgi.is_frozen(C)
+    assert not xgi.is_frozen(H)
+
+    for method, args in [
+        (C.add_node, (10,)),
+        (C.add_nodes_from, ([8, 9],)),
+        (C.add_edge, ([1, 5],)),
+        (C.add_edges_from, ([[1, 7]],)),
+        (C.add_node_to_edge, (0, 10)),
+        (C.remove_node, (1,)),
+        (C.remove_nodes_from, ([1, 2],)),
+        (C.remove_edge, (1,)),
+        (C.remove_edges_from, ([0, 1],)),
+        (C.remove_node_from_edge, (0, 1)),
+        (C.clear, ()),
+    ]:
+        with pytest.raises(XGIError):
+            method(*args)
+
+
+def test_views(edgelist1, edgelist3):
+    H = xgi.Hypergraph(edgelist1)
+    C = xgi.CompactHypergraph(edgelist1)
+    assert C.nodes.memberships(6) == [2, 3]
+    assert C.edges.members(0) == [1, 2, 3]
+    assert 6 in C.nodes and 0 not in C.nodes
+    assert 3 in C.edges and 4 not in C.edges
+    assert 6 in C
+    with pytest.raises(IDNotFound):
+        C.nodes.memberships(0)
+    with pytest.raises(IDNotFound):
+        C.edges.members(4)
+
+    assert set(C.edges(order=2)) == set(H.edges(order=2))
+    assert set(C.nodes(degree=2)) == {6}
+    assert C.singleton_edges() == H.singleton_edges()
+
+    H = xgi.Hypergraph(edgelist3)
+    C = xgi.CompactHypergraph(edgelist3)
+    for n in H.nodes:
+        assert C.neighbors(n) == H.neighbors(n)
+    assert C.egonet(3) == H.egonet(3)
+    assert C.max_edge_order() == H.max_edge_order()
+    assert C.is_uniform() == H.is_uniform()
+    assert C.isolates() == H.isolates()
+
+
+def test_degree(edgelist1, edgelist4):
+    for el in [edgelist1, edgelist4]:
+        H = xgi.Hypergraph(el)
+        C = xgi.CompactHypergraph(el)
+        assert dict(C.degree()) == dict(H.degree())
+        assert dict(C.edge_size()) == dict(H.edge_size())
+        assert dict(C.degree(order=2)) == dict(H.degree(order=2))
+
+    H = xgi.Hypergraph(edgelist4)
+    xgi.set_edge_attributes(H, {0: {"weight": -2}, 1: {"weight": 4.0}})
+    C = xgi.CompactHypergraph(H)
+    assert C.degree(weight="weight")[C.nodes] == H.degree(weight="weight")[H.nodes]
+    assert C.degree(3) == 3
+
+
+def test_attributes(edgelist1):
+    H = xgi.Hypergraph(edgelist1)
+    H.add_node(1, color="red")
+    H.add_edge([1, 2], id="e", weight=2)
+    C = xgi.CompactHypergraph(H)
+    assert xgi.get_node_attributes(C, "color") == {1: "red"}
+    assert len(C._node_attr._attrs) == 1
+    assert C.nodes[1] == {"color": "red"}
+    assert C.nodes[2] == {}
+    assert C.edges["e"] == {"weight": 2}
+    # reading the attributes of IDs without any does not store dicts
+    assert xgi.get_node_attributes(C)[3] == {}
+    assert dict(C._node_attr.items())[3] == {}
+    assert len(C._node_attr._attrs) == 1
+    with pytest.raises(IDNotFound):
+        C.nodes[100]
+
+    xgi.set_node_attributes(C, {2: "blue"}, name="color")
+    assert C.nodes[2] == {"color": "blue"}
+    assert H.nodes[2] == {}
+
+
+def test_has_edge(edgelist1):
+    C = xgi.CompactHypergraph(edgelist1)
+    assert C.has_edge([1, 2, 3])
+    assert C.has_edge({3, 2, 1})
+    assert C.has_edge([4])
+    assert not C.has_edge([1, 2])
+    assert not C.has_edge([1, 100])
+    assert not C.has_edge([])
+    assert C.edges.find([7, 6, 8]) == [3]
+
+
+def test_dual(edgelist1, edgelist4):
+    for el in [edgelist1, edgelist4]:
+        H = xgi.Hypergraph(el)
+        C = xgi.CompactHypergraph(el)
+        D = C.dual()
+        assert D.edges.members(dtype=dict) == H.dual().edges.members(dtype=dict)
+        assert list(D.nodes) == list(H.edges)
+        assert D._node_indices is C._edge_indices
+
+
+def test_incidence_matrix(edgelist1, edgelist4):
+    for el in [edgelist1, edgelist4]:
+        H = xgi.Hypergraph(el)
+        C = xgi.CompactHypergraph(el)
+        for order in [None, 1, 2, 5]:
+            I1, r1, c1 = xgi.incidence_matrix(H, order=order, index=True)
+            I2, r2, c2 = xgi.incidence_matrix(C, order=order, index=True)
+            assert (r1, c1) == (r2, c2)
+            if I1.shape == (0,):
+                assert I2.shape == (0,)
+            else:
+                assert (I1 != I2).nnz == 0
+
+        I1 = xgi.incidence_matrix(H, sparse=False)
+        I2 = xgi.incidence_matrix(C, sparse=False)
+        assert np.all(I1 == I2)
+
+        A1 = xgi.adjacency_matrix(H)
+        A2 = xgi.adjacency_matrix(C)
+        assert (A1 != A2).nnz == 0
+
+    w = lambda node, edge, H: node
+    I1 = xgi.incidence_matrix(xgi.Hypergraph(edgelist1), weight=w)
+    I2 = xgi.incidence_matrix(xgi.CompactHypergraph(edgelist1), weight=w)
+    assert (I1 != I2).nnz == 0
+
+    H = xgi.Hypergraph(edgelist4)
+    L1, r1 = xgi.multiorder_laplacian(H, [1, 2], [1, 1], index=True)
+    L2, r2 = xgi.multiorder_laplacian(
+        xgi.freeze(H, compact=True), [1, 2], [1, 1], index=True
+    )
+    assert dict(r1) == dict(r2)
+    assert np.all(L1 == L2)
+
+
+def test_string_ids():
+    edges = {"a": ["x", "y"], "b": ["y", "z", "w"]}
+    C = xgi.CompactHypergraph(edges)
+    assert list(C.nodes) == ["x", "y", "z", "w"]
+    assert C.nodes.memberships("y") == ["a", "b"]
+    assert C.neighbors("x") == {"y"}
+    assert C.degree("y") == 2
+    assert C.has_edge(["w", "y", "z"])
+
+
+def test_subhypergraph(edgelist1):
+    C = xgi.CompactHypergraph(edgelist1)
+    S = xgi.subhypergraph(C, nodes=[1, 2, 3, 4, 5])
+    assert isinstance(S, xgi.SubHypergraphView)
+    assert list(S.nodes) == [1, 2, 3, 4, 5]
+    assert list(S.edges) == [0, 1]
+    assert S.degree(1) == 1
+    assert S.copy().edges.members(dtype=dict) == {0: [1, 2, 3], 1: [4]}
+
+    D = C.copy()
+    assert isinstance(D, xgi.CompactHypergraph)
+    assert D._edge_indices is C._edge_indices
+
+    H = xgi.Hypergraph(C)
+    assert H.edges.members(dtype=dict) == C.edges.members(dtype=dict)
+    H.add_node(10)
+    assert 10 in H
+
+
+def test_memory_usage(edgelist1):
+    C = xgi.CompactHypergraph(edgelist1)
+    usage = C.memory_usage()
+    assert "node_index" not in usage
+    assert usage["node"] > C._node_indptr.nbytes + C._node_indices.nbytes
+    assert usage["edge_sizes"] == 0
+    C.edges(order=1)
+    assert C.memory_usage()["edge_sizes"] > 0
+    assert sum(usage.values()) < sum(xgi.Hypergraph(edgelist1).memory_usage().values())
+
+
+def test_pickle(edgelist1):
+    C = xgi.CompactHypergraph(edgelist1)
+    C.nodes[1]["color"] = "red"
+    D = pickle.loads(pickle.dumps(C))
+    assert type(D) is xgi.CompactHypergraph
+    assert D.edges.members() == C.edges.members()
+    assert D.nodes[1] == {"color": "red"}
@@ -0,0 +1,214 @@
+import pickle
+import random
+
+import networkx as nx
+import pytest
+
+import xgi
+from xgi.exception import IDNotFound, XGIError
+
+
+def faces(S, order=None):
+    """The simplices of a complex as a set of frozensets."""
+    edges = S.edges if order is None else S.edges(order=order)
+    return {frozenset(m) for m in edges.members()}
+
+
+def random_complex(seed):
+    g = nx.gnm_random_graph(30, 150, seed=seed)
+    return [list(c) for c in nx.find_cliques(g)] + [[30], [31, 32]]
+
+
+def test_constructor():
+    facets = [[1, 2, 3, 4], [3, 4, 5], [2, 3], [5, 6], [7]]
+    F = xgi.FacetComplex(facets, name="test")
+    S = xgi.SimplicialComplex(facets)
+    assert F["name"] == "test"
+    assert F.facets() == [
+        frozenset({1, 2, 3, 4}),
+        frozenset({3, 4, 5}),
+        frozenset({5, 6}),
+        frozenset({7}),
+    ]
+    assert F.num_nodes == 7
+    assert F.num_edges == S.num_edges == 16
+    assert set(F.edges) == faces(S)
+    assert len(list(F.edges)) == len(F.edges)
+
+    assert xgi.FacetComplex(S).facets() == F.facets()
+    assert faces(xgi.SimplicialComplex(F)) == faces(S)
+    assert xgi.FacetComplex().facets() == []
+    assert not xgi.FacetComplex().edges
+
+
+def test_add_simplex():
+    F = xgi.FacetComplex()
+    F.add_simplex([1, 2])
+    F.add_simplex([1, 2, 3])
+    F.add_simplex([2, 3])
+    F.add_simplex([4], weight=2)
+    assert F.facets() == [frozenset({1, 2, 3}), frozenset({4})]
+    assert F.edges[frozenset({4})] == {"weight": 2}
+    assert F.max_edge_order() == 2
+
+    F.add_node(5)
+    assert 5 in F.nodes
+    assert not F.has_simplex([5])
+    F.add_simplex([4, 5])
+    assert F.facets() == [frozenset({1, 2, 3}), frozenset({4, 5})]
+    assert F.edges[frozenset({4})] == {"weight": 2}
+
+    with pytest.raises(XGIError):
+        F.add_simplex([])
+
+
+def test_faces_match_simplicial_complex():
+    for seed in range(3):
+        facets = random_complex(seed)
+        F = xgi.FacetComplex(facets)
+        S = xgi.SimplicialComplex(facets)
+        assert len(F.edges) == S.num_edges
+        for order in range(S.max_edge_order() + 1):
+            assert faces(F, order) == faces(S, order)
+            assert dict(F.degree(order=order)) == dict(S.degree(order=order))
+            I = xgi.incidence_matrix(F, order=order, sparse=False)
+            J = xgi.incidence_matrix(S, order=order, sparse=False)
+            assert sorted(map(tuple, I.T.tolist())) == sorted(map(tuple, J.T.tolist()))
+        assert dict(F.degree()) == dict(S.degree())
+        assert xgi.unique_edge_sizes(F) == xgi.unique_edge_sizes(S)
+        for n in F.nodes:
+            assert set(F.nodes.memberships(n)) == {
+                frozenset(S.edges.members(e)) for e in S.nodes.memberships(n)
+            }
+            assert F.neighbors(n) == S.neighbors(n)
+
+
+def test_has_simplex():
+    F = xgi.FacetComplex([[1, 2, 3, 4], [3, 4, 5], [6]])
+    assert F.has_simplex([1, 2, 3, 4])
+    assert F.has_simplex([4, 1])
+    assert F.has_simplex([3, 5])
+    assert F.has_simplex([6])
+    assert not F.has_simplex([1])
+    assert not F.has_simplex([1, 5])
+    assert not F.has_simplex([1, 8])
+    assert frozenset({2, 3}) in F.edges
+    with pytest.raises(IDNotFound):
+        F.edges.members(frozenset({1, 5}))
+
+
+def test_attributes():
+    F = xgi.FacetComplex([[1, 2, 3], [3, 4]])
+    assert F.edges[frozenset({1, 2})] == {}
+    assert len(F._edge_attr) == 0
+    F.edges[frozenset({1, 2})]["weight"] = 2.0
+    F.add_simplex([2, 3, 1], color="red")
+    F.add_simplex([5, 4, 3], color="blue")
+    assert F.edges[frozenset({1, 2})] == {"weight": 2.0}
+    assert F.edges[frozenset({1, 2, 3})] == {}
+    assert F.edges[frozenset({3, 4, 5})] == {"color": "blue"}
+    assert len(F._edge_attr) == 2
+    assert xgi.get_edge_attributes(F, "weight") == {frozenset({1, 2}): 2.0}
+
+    F.remove_node(2)
+    assert len(F._edge_attr) == 1
+    F.remove_simplex_id(frozenset({3, 4}))
+    assert len(F._edge_attr) == 0
+
+    with pytest.raises(IDNotFound):
+        F.edges[frozenset({1, 4})]["weight"] = 1
+
+
+def test_remove_simplex_id():
+    F = xgi.FacetComplex([[1, 2, 3, 4], [3, 4, 5], [5, 6], [7]])
+    F.remove_simplex_id(frozenset({3, 4}))
+    assert set(F.facets()) == {
+        frozenset({1, 2, 3}),
+        frozenset({1, 2, 4}),
+        frozenset({3, 5}),
+        frozenset({4, 5}),
+        frozenset({5, 6}),
+        frozenset({7}),
+    }
+    F.remove_simplex_id(frozenset({7}))
+    assert not F.has_simplex([7])
+    assert 7 in F.nodes
+    with pytest.raises(XGIError):
+        F.remove_simplex_id(frozenset({3, 4}))
+
+    F.remove_node(5)
+    assert 5 not in F.nodes
+    assert set(F.facets()) == {frozenset({1, 2, 3}), frozenset({1, 2, 4})}
+    with pytest.raises(IDNotFound):
+        F.remove_node(5)
+
+    for seed in range(3):
+        facets = random_complex(seed)
+        F = xgi.FacetComplex(facets)
+        S = xgi.SimplicialComplex(facets)
+        removed = random.Random(seed).sample(sorted(S.edges), 20)
+        members = [frozenset(S.edges.members(e)) for e in removed]
+        for id in removed:
+            if id in S.edges:
+                S.remove_simplex_id(id)
+        F.remove_simplex_ids_from(members)
+        assert set(F.edges) == faces(S)
+        assert set(F.facets()) == faces(S) - {
+            f for f in faces(S) for g in faces(S) if f < g
+        }
+
+
+def test_unsupported_edits():
+    F = xgi.FacetComplex([[1, 2, 3], [3, 4]])
+    with pytest.raises(XGIError, match="only stores its facets"):
+        F.add_node_to_edge(frozenset({3, 4}), 5)
+    with pytest.raises(XGIError, match="only stores its facets"):
+        F.remove_node_from_edge(frozenset({1, 2, 3}), 1)
+    assert F.facets() == [frozenset({1, 2, 3}), frozenset({3, 4})]
+
+
+def test_star_link():
+    F = xgi.FacetComplex([[1, 2, 3, 4], [3, 4, 5]])
+    assert set(F.star([3, 4])) == {
+        frozenset({3, 4}),
+        frozenset({1, 3, 4}),
+        frozenset({2, 3, 4}),
+        frozenset({3, 4, 5}),
+        frozenset({1, 2, 3, 4}),
+    }
+    assert set(F.link([3, 4])) == {
+        frozenset({1}),
+        frozenset({2}),
+        frozenset({5}),
+        frozenset({1, 2}),
+    }
+
+
+def test_copy_pickle():
+    F = xgi.FacetComplex([[1, 2, 3], [3, 4], [5]], name="test")
+    F.edges[frozenset({1, 2})]["weight"] = 2.0
+    xgi.set_node_attributes(F, {1: {"color": "red"}})
+    for G in [F.copy(), pickle.loads(pickle.dumps(F))]:
+        assert G.facets() == F.facets()
+        assert G["name"] == "test"
+        assert G.edges[frozenset({1, 2})] == {"weight": 2.0}
+        assert G.nodes[1] == {"color": "red"}
+        G.remove_node(3)
+        G.edges[frozenset({1, 2})]["weight"] = 3.0
+        assert F.has_simplex([3, 4])
+        assert F.edges[frozenset({1, 2})] == {"weight": 2.0}
+
+    F.clear_edges()
+    assert F.num_edges == 0
+    assert F.num_nodes == 5
+    F.clear()
+    assert F.num_nodes == 0
+    assert "name" not in F._hypergraph
+
+
+def test_memory():
+    facets = [list(range(k, k + 12)) for k in range(0, 120, 12)]
+    F = xgi.FacetComplex(facets)
+    S = xgi.SimplicialComplex(facets)
+    assert F.num_edges == S.num_edges == 10 * (2**12 - 1 - 12)
+    assert sum(F.memory_usage().values()) * 50 < sum(S.memory_usage().values())
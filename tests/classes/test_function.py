@@ -1,3 +1,7 @@
+import inspect
+import json
+
+import numpy as np
 import pytest
 
 import xgi
@@ -69,8 +73,19 @@ def test_freeze(edgelist1):
     with pytest.raises(XGIError):
         H.remove_node_from_edge(0, 1)
 
+    with pytest.raises(XGIError):
+        H.remove_isolates()
+
     assert xgi.is_frozen(H)
 
+    # the frozen classes reject the same methods
+    from xgi.classes.function import _FROZEN_METHODS, frozen
+
+    for F in [H, xgi.CompactHypergraph(edgelist1), xgi.subhypergraph(H)]:
+        assert xgi.is_frozen(F)
+        for name in _FROZEN_METHODS:
+            assert inspect.getattr_static(F, name) is frozen
+
 
 def test_create_empty_copy(edgelist1):
     H = xgi.Hypergraph(edgelist1, name="test", timestamp="Nov. 20")
@@ -177,6 +192,25 @@ def test_get_node_attributes(edgelist1):
     assert xgi.get_node_attributes(H1, "weight") == dict()
 
 
+def test_get_attributes_copies(edgelist1):
+    for backend in ["dict", "columnar"]:
+        H = xgi.Hypergraph(edgelist1)
+        H.set_attr_backend(backend)
+        H.nodes[1]["color"] = "red"
+        H.edges[0]["weight"] = 2
+        nodes = xgi.get_node_attributes(H)
+        edges = xgi.get_edge_attributes(H)
+        assert all(type(d) is dict for d in [*nodes.values(), *edges.values()])
+        assert json.loads(json.dumps(nodes))["1"] == {"color": "red"}
+        assert json.loads(json.dumps(edges))["1"] == {}
+        nodes[1]["color"] = "blue"
+        nodes[2]["color"] = "blue"
+        edges[0]["weight"] = 3
+        assert H.nodes[1] == {"color": "red"}
+        assert H.nodes[2] == {}
+        assert H.edges[0] == {"weight": 2}
+
+
 def test_set_edge_attributes(edgelist1):
     H1 = xgi.Hypergraph(edgelist1)
     attr_dict1 = {
@@ -234,3 +268,45 @@ def test_is_empty():
     assert xgi.is_empty(H1)
     assert xgi.is_empty(H2)
     assert not xgi.is_empty(H3)
+
+
+def test_maximal_simplices(edgelist5):
+    S = xgi.SimplicialComplex([[1, 2, 3], [2, 3], [3, 4], [4]])
+    assert xgi.maximal_simplices(S) == [0, 4]
+
+    S = xgi.SimplicialComplex(edgelist5)
+    assert [S.edges.members(e) for e in xgi.maximal_simplices(S)] == [
+        {0, 1, 2, 3},
+        {4},
+        {5, 6},
+        {8, 6, 7},
+    ]
+    H = xgi.from_simplicial_complex_to_hypergraph(S)
+    assert H.edges.members() == [[0, 1, 2, 3], [4], [5, 6], [8, 6, 7]]
+
+    with pytest.raises(XGIError):
+        xgi.maximal_simplices(xgi.Hypergraph(edgelist5))
+
+
+def test_attributes_as_arrays(edgelist1):
+    for backend in ["dict", "columnar"]:
+        H = xgi.Hypergraph(edgelist1)
+        H.set_attr_backend(backend)
+        xgi.set_node_attributes(H, np.arange(8) / 2, name="x")
+        xgi.set_edge_attributes(H, np.array([1, 2, 3, 4]), name="w")
+        assert H.nodes[3]["x"] == 1.0
+        assert H.edges[1]["w"] == 2
+
+        x = xgi.get_node_attributes(H, "x", as_array=True)
+        assert np.array_equal(x, np.arange(8) / 2)
+        del H.edges[2]["w"]
+        w = xgi.get_edge_attributes(H, "w", as_array=True, default=0)
+        assert w.tolist() == [1, 2, 0, 4]
+        assert np.isnan(xgi.get_edge_attributes(H, "w", as_array=True)[2])
+
+        with pytest.raises(XGIError):
+            xgi.set_node_attributes(H, np.arange(3), name="x")
+        with pytest.raises(XGIError):
+            xgi.set_node_attributes(H, np.arange(8))
+        with pytest.raises(XGIError):
+            xgi.get_node_attributes(H, as_array=True)
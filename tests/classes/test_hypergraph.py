@@ -1,3 +1,6 @@
+import pickle
+
+import numpy as np
 import pytest
 
 import xgi
@@ -96,6 +99,51 @@ def test_dual(edgelist1, edgelist2, edgelist4):
     assert (D2.num_nodes, D2.num_edges) == (3, 6)
     assert (D3.num_nodes, D3.num_edges) == (3, 5)
 
+    assert D1.edges.members(dtype=dict) == {
+        1: [0],
+        2: [0],
+        3: [0],
+        4: [1],
+        5: [2],
+        6: [2, 3],
+        7: [3],
+        8: [3],
+    }
+    assert D1.nodes.memberships() == {0: [1, 2, 3], 1: [4], 2: [5, 6], 3: [6, 7, 8]}
+    assert D1.has_edge([2, 3]) and not D1.has_edge([1, 2])
+    assert D1.edges.find([3, 2]) == [6]
+    assert xgi.incidence_matrix(D1).shape == (4, 8)
+
+    # the dual is independent
+    D1.remove_edge(6)
+    D1.add_node_to_edge(1, 3)
+    assert H1.nodes.memberships(6) == [2, 3]
+    assert H1.edges.members(3) == [6, 7, 8]
+    H1.remove_node(1)
+    assert D1.edges.members(1) == [0, 3]
+
+
+def test_dual_attrs(edgelist1):
+    H = xgi.Hypergraph(edgelist1, name="test")
+    H.add_node(1, color=["red"])
+    H.add_edge([1, 2], id="a", weight=2)
+    D = H.dual()
+    assert D.edges[1] == {"color": ["red"]}
+    assert D.nodes["a"] == {"weight": 2}
+    assert D["name"] == "test"
+
+    D.edges[1]["size"] = 2
+    assert H.nodes[1] == {"color": ["red"]}
+    D.edges[1]["color"].append("blue")
+    assert H.nodes[1] == {"color": ["red", "blue"]}
+
+    D = H.dual(deepcopy_attrs=True)
+    D.edges[1]["color"].append("green")
+    assert H.nodes[1] == {"color": ["red", "blue"]}
+
+    with pytest.raises(XGIError):
+        xgi.SimplicialComplex([[1, 2, 3]]).dual()
+
 
 def test_max_edge_order(edgelist1, edgelist4, edgelist5):
     H0 = xgi.empty_hypergraph()
@@ -216,6 +264,49 @@ def test_has_edge(edgelist1):
     assert not H.has_edge([1, 2])
 
 
+def test_has_edge_after_mutation(edgelist1):
+    H = xgi.Hypergraph(edgelist1)
+    H.add_node_to_edge(1, 5)
+    assert H.has_edge([4, 5])
+    assert not H.has_edge([4])
+
+    H.remove_node_from_edge(1, 5)
+    assert H.has_edge([4])
+    assert not H.has_edge([4, 5])
+
+    H.remove_node(6)
+    assert H.has_edge([5])
+    assert H.has_edge([7, 8])
+    assert not H.has_edge([6, 7, 8])
+
+    H.remove_edge(0)
+    assert not H.has_edge([1, 2, 3])
+    H.add_edges_from({"a": [3, 2, 1]})
+    assert H.has_edge([1, 2, 3])
+
+    H.clear_edges()
+    assert not H.has_edge([1, 2, 3])
+    assert H.nodes.memberships(1) == []
+
+
+def test_remove_node_from_edge(edgelist1):
+    H = xgi.Hypergraph(edgelist1)
+    H.remove_node_from_edge(0, 1)
+    assert H.edges.members(0) == [2, 3]
+    assert H.nodes.memberships(1) == []
+
+    H.remove_node_from_edge(1, 4)
+    assert 1 not in H.edges
+    assert H.nodes.memberships(4) == []
+
+    with pytest.raises(XGIError):
+        H.remove_node_from_edge(0, 8)
+    with pytest.raises(XGIError):
+        H.remove_node_from_edge(0, 100)
+    with pytest.raises(XGIError):
+        H.remove_node_from_edge(100, 2)
+
+
 def test_egonet(edgelist3):
     H = xgi.Hypergraph(edgelist3)
     assert H.neighbors(3) == {1, 2, 4}
@@ -411,6 +502,65 @@ def test_add_edges_from_wrong_format():
         xgi.Hypergraph().add_edges_from(edges)
 
 
+def test_add_edges_from_arrays(edgelist1):
+    H = xgi.Hypergraph()
+    H.add_edges_from_arrays([0, 3, 4, 6, 9], [1, 2, 3, 4, 5, 6, 6, 7, 8])
+    assert H.edges.members() == edgelist1
+    assert H.nodes.memberships() == xgi.Hypergraph(edgelist1).nodes.memberships()
+    assert H.has_edge([6, 7, 8])
+    assert list(H._edge_index.ids()) == [0, 1, 2, 3]
+
+    H.add_edge([1, 2])
+    assert list(H.edges) == [0, 1, 2, 3, 4]
+
+    H = xgi.Hypergraph()
+    H.add_node("c")
+    H.add_edges_from_arrays(
+        np.array([0, 2, 3]),
+        np.array([2, 0, 1]),
+        node_labels=["a", "b", "c"],
+        edge_ids=["x", "y"],
+        edge_attrs={"weight": np.array([1.5, 2.5])},
+    )
+    assert list(H.nodes) == ["c", "a", "b"]
+    assert H.edges.members(dtype=dict) == {"x": ["c", "a"], "y": ["b"]}
+    assert H.edges["y"] == {"weight": 2.5}
+    assert type(H.edges["y"]["weight"]) is float
+
+    # adding no edges is allowed
+    H.add_edges_from_arrays([0], [])
+    assert H.num_edges == 2
+
+
+def test_add_edges_from_arrays_wrong_input():
+    H = xgi.Hypergraph()
+    for indptr, indices in [
+        ([1, 2], [0, 1]),
+        ([0, 3], [0, 1]),
+        ([0, 2, 1], [0, 1]),
+        ([0, 2, 2], [0, 1]),
+        ([0, 2], [0, -1]),
+        ([0, 2], [0.5, 1.0]),
+        ([[0, 2]], [0, 1]),
+    ]:
+        with pytest.raises(XGIError):
+            H.add_edges_from_arrays(indptr, indices)
+
+    with pytest.raises(XGIError):
+        H.add_edges_from_arrays([0, 2], [0, 2], node_labels=["a", "b"])
+    with pytest.raises(XGIError):
+        H.add_edges_from_arrays([0, 2], [0, 1], edge_ids=[0, 1])
+    with pytest.raises(XGIError):
+        H.add_edges_from_arrays([0, 1, 2], [0, 1], edge_ids=[0, 0])
+    with pytest.raises(XGIError):
+        H.add_edges_from_arrays([0, 2], [0, 1], edge_attrs={"w": [1, 2]})
+    assert H.num_nodes == 0 and H.num_edges == 0
+
+    H.add_edge([0, 1], id="a")
+    with pytest.raises(XGIError):
+        H.add_edges_from_arrays([0, 1], [0], edge_ids=["a"])
+
+
 def test_copy(edgelist1):
     H = xgi.Hypergraph(edgelist1)
     copy = H.copy()
@@ -424,3 +574,369 @@ def test_copy(edgelist1):
 
     H.add_edge([1, 3, 5])
     assert list(copy.edges) != list(H.edges)
+
+    # the copy is mutable and independent
+    H = xgi.Hypergraph(edgelist1, name="test")
+    H.add_node(1, color="red")
+    H.add_edge([1, 2], id="a", weight=2)
+    copy = H.copy()
+    assert not xgi.is_frozen(copy)
+    assert copy.edges.members(dtype=dict) == H.edges.members(dtype=dict)
+    assert copy.nodes.memberships() == H.nodes.memberships()
+    assert copy.nodes[1] == {"color": "red"}
+    assert copy.edges["a"] == {"weight": 2}
+    assert copy["name"] == "test"
+
+    copy.remove_node(2)
+    copy.add_edge([1, 8])
+    copy.nodes[1]["color"] = "blue"
+    copy["name"] = "copy"
+    assert H.edges.members(0) == [1, 2, 3]
+    assert H.nodes.memberships(1) == [0, "a"]
+    assert H.nodes[1] == {"color": "red"}
+    assert H["name"] == "test"
+    assert H.has_edge([1, 2])
+    assert not H.has_edge([1, 8])
+    assert list(xgi.incidence_matrix(H, index=True)[2].values()) == list(H.edges)
+
+    # new edge IDs continue from the original ones
+    assert copy.edges.members(4) == [1, 8]
+
+
+def test_copy_on_write(edgelist1):
+    H = xgi.Hypergraph(edgelist1)
+    C1 = H.copy(copy_on_write=True)
+    C2 = H.copy(copy_on_write=True)
+    assert C1._node[6] is H._node[6]
+
+    C1.remove_node(6)
+    assert C1._node[5] is not H._node[5]
+    assert C1.edges.members(2) == [5]
+    assert H.edges.members(2) == [5, 6]
+    assert C2.edges.members(2) == [5, 6]
+
+    H.add_node_to_edge(1, 5)
+    assert H.nodes.memberships(5) == [2, 1]
+    assert C2.nodes.memberships(5) == [2]
+    assert C2.has_edge([4])
+    assert not C2.has_edge([4, 5])
+
+    # the last copy sharing the containers does not copy them
+    members = C2._edge[0]
+    C2.add_node_to_edge(0, 4)
+    assert C2._edge[0] is members
+    assert H.edges.members(0) == [1, 2, 3]
+
+    S = xgi.SimplicialComplex([[1, 2, 3]])
+    C = S.copy(copy_on_write=True)
+    C.remove_simplex_id(0)
+    assert S.has_simplex([1, 2, 3])
+    assert not C.has_simplex([1, 2, 3])
+
+
+def test_id_index(edgelist1):
+    H = xgi.Hypergraph(edgelist1)
+    assert H._node_index.ids() == tuple(H.nodes)
+    assert H._edge_index.ids() == tuple(H.edges)
+
+    H.remove_node(4)
+    H.remove_edge(0)
+    H.add_node(4)
+    H.add_edge([1, 8], id="a")
+    assert H._node_index.ids() == tuple(H.nodes)
+    assert H._edge_index.ids() == tuple(H.edges)
+    pos = H._node_index.positions()
+    assert [pos[n] for n in H.nodes] == list(range(H.num_nodes))
+
+    H.clear_edges()
+    assert H._edge_index.ids() == ()
+    H.clear()
+    assert H._node_index.ids() == ()
+
+
+def test_id_index_compaction():
+    index = xgi.classes.hypergraph.IDIndex(range(10))
+    for i in range(5):
+        index.remove(i)
+    assert index._holes == 5
+    index.remove(5)
+    assert index._holes == 0
+    assert index.positions() == {6: 0, 7: 1, 8: 2, 9: 3}
+    index.add(0)
+    assert index.ids() == (6, 7, 8, 9, 0)
+
+
+def test_size_index(edgelist1):
+    def check(H):
+        expected = {}
+        for e, members in H._edge.items():
+            expected.setdefault(len(members), set()).add(e)
+        sizes = H._edges_by_size()
+        assert set(sizes.sizes()) == set(expected)
+        assert sizes.counts() == {size: len(ids) for size, ids in expected.items()}
+        for size, ids in expected.items():
+            assert set(sizes.ids(size)) == ids
+            assert sizes.ids(size, H._edge_index) == [e for e in H.edges if e in ids]
+
+    H = xgi.Hypergraph(edgelist1)
+    check(H)
+    assert set(H.edges(order=2)) == {0, 3}
+    assert not H.edges(order=5)
+
+    H.add_edge([1, 4], id="a")
+    H.add_node_to_edge(2, 1)
+    H.add_node_to_edge("b", 1)
+    H.remove_node(3)
+    H.remove_node_from_edge(0, 1)
+    H.add_edges_from({"c": [2, 7]})
+    H.add_edges_from_arrays([0, 2, 5], [1, 2, 4, 5, 6])
+    check(H)
+    assert set(H.edges(order=1)) == {"a", "c", 4}
+    assert list(xgi.incidence_matrix(H, order=1, index=True)[2].values()) == [
+        "a",
+        "c",
+        4,
+    ]
+
+    C = H.copy(copy_on_write=True)
+    C.remove_edge(1)
+    check(C)
+    check(H)
+    assert 1 in H.edges(order=0) and 1 not in C.edges(order=0)
+    D = H.dual()
+    check(D)
+    H.remove_singleton_edges()
+    check(H)
+    assert not H.edges(order=0)
+    H.clear_edges()
+    check(H)
+
+
+def test_duplicate_edges():
+    H = xgi.Hypergraph([[1, 2, 3], [3, 2, 1], [4], [1, 2], [2, 1, 3], [4]])
+    assert H.duplicate_edges() == [(1, 2, 3), (4,)]
+    assert set(H.duplicate_edges(ids=True)) == {0, 1, 2, 4, 5}
+    H.add_edge([1, 1, 2], id="a")
+    assert H.duplicate_edges() == [(1, 2, 3), (4,), (1, 2)]
+    assert "a" in H.duplicate_edges(ids=True)
+    assert "a" not in H.duplicate_edges(multisets=True, ids=True)
+    assert set(H.duplicate_edges(multisets=True, ids=True)) == {0, 1, 2, 4, 5}
+    assert not xgi.Hypergraph([[1, 2], [2, 3]]).duplicate_edges()
+
+
+def test_remove_duplicate_edges():
+    edges = [[1, 2, 3], [3, 2, 1], [4], [1, 2], [2, 1, 3], [4]]
+    H = xgi.Hypergraph(edges)
+    for e in H.edges:
+        H.edges[e]["w"] = e
+    H.remove_duplicate_edges()
+    assert H.edges.members(dtype=dict) == {0: [1, 2, 3], 2: [4], 3: [1, 2]}
+    assert H.edges[0] == {"w": 0}
+    assert not H.duplicate_edges()
+
+    H = xgi.Hypergraph(edges)
+    for e in H.edges:
+        H.edges[e]["w"] = e
+    H.remove_duplicate_edges(
+        keep="last", merge_attrs=lambda attrs: {"w": [a["w"] for a in attrs]}
+    )
+    assert list(H.edges) == [3, 4, 5]
+    assert H.edges[4] == {"w": [0, 1, 4]}
+    assert H.edges[5] == {"w": [2, 5]}
+    assert H.edges[3] == {"w": 3}
+
+    H = xgi.Hypergraph([[1, 2], [2, 1], [1, 1, 2]])
+    H.remove_duplicate_edges(multisets=True)
+    assert H.num_edges == 2
+    with pytest.raises(XGIError):
+        H.remove_duplicate_edges(keep="middle")
+    with pytest.raises(XGIError):
+        xgi.CompactHypergraph(H).remove_duplicate_edges()
+
+
+def test_batch(edgelist1):
+    H1 = xgi.Hypergraph(edgelist1)
+    H2 = xgi.Hypergraph(edgelist1)
+
+    def changes(H):
+        H.add_edge([1, 4], id="a")
+        for n in range(10, 20):
+            H.add_node_to_edge("b", n)
+        H.remove_node(6)
+        H.remove_node_from_edge(0, 1)
+        H.add_edges_from([[2, 3], [8]])
+
+    changes(H1)
+    with H2.batch():
+        changes(H2)
+        assert H2._edge_lookup is None and H2._edge_sizes is None
+        with H2.batch():
+            H2.add_edge([30, 31], id="c")
+        assert H2._edge_lookup is None
+        # queries inside the block rebuild the indices they need
+        assert H2.has_edge([1, 4])
+        H2.remove_edge("c")
+    assert H2._edge_lookup == H1._edge_lookup
+    assert H2._edge_sizes._buckets == H1._edge_sizes._buckets
+    assert H2.edges.members(dtype=dict) == H1.edges.members(dtype=dict)
+
+    # the indices are rebuilt if the block raises
+    with pytest.raises(XGIError):
+        with H2.batch():
+            H2.add_edge([])
+    assert H2._edge_lookup is not None and H2._edge_sizes is not None
+
+    with pytest.raises(XGIError):
+        with xgi.CompactHypergraph(H1).batch():
+            pass
+
+
+def test_index_view():
+    view = xgi.classes.hypergraph.IndexView(("a", "b"))
+    assert view == {0: "a", 1: "b"}
+    assert view[1] == "b"
+    for i in [2, -1, True, "a", 1.0]:
+        with pytest.raises(KeyError):
+            view[i]
+
+
+def test_id_list():
+    ids = xgi.classes.hypergraph.IDList([3, 1, 2])
+    assert list(ids) == [3, 1, 2]
+    assert ids == [3, 1, 2]
+    assert [3, 1, 2] == ids
+    assert ids != [1, 2, 3]
+    assert 1 in ids and 4 not in ids
+    ids.remove(1)
+    ids.append(1)
+    assert ids == [3, 2, 1]
+    assert ids.copy() == [3, 2, 1] and type(ids.copy()) is list
+
+    # repeated IDs keep their order, and the first copy is removed
+    ids.extend([2, 4, 2])
+    assert list(ids) == [3, 2, 1, 2, 4, 2]
+    assert len(ids) == 6
+    assert ids.view() == (3, 2, 1, 2, 4, 2)
+    ids.remove(2)
+    assert ids == [3, 1, 2, 4, 2]
+    ids.remove(2)
+    assert ids == [3, 1, 4, 2]
+    ids.remove(2)
+    assert ids == [3, 1, 4]
+    assert 2 not in ids
+    with pytest.raises(ValueError):
+        ids.remove(2)
+    assert not xgi.classes.hypergraph.IDList()
+
+    # views follow the IDs without copying them
+    view = ids.view()
+    assert list(view) == [3, 1, 4]
+    ids.append(5)
+    assert list(view) == [3, 1, 4, 5]
+    ids.append(5)
+    assert ids.view() == (3, 1, 4, 5, 5)
+
+
+def test_members_are_copies(edgelist1):
+    H = xgi.Hypergraph(edgelist1)
+    members = H.edges.members(dtype=dict)
+    members[0].append(100)
+    H.nodes.memberships()[1].append(100)
+    assert H.edges.members(0) == [1, 2, 3]
+    assert H.nodes.memberships(1) == [0]
+    assert type(H.edges.members()[0]) is list
+
+
+def test_memory_usage(edgelist1):
+    H = xgi.Hypergraph(edgelist1)
+    usage = H.memory_usage()
+    assert set(usage) == {
+        "node",
+        "edge",
+        "edge_lookup",
+        "edge_sizes",
+        "node_index",
+        "edge_index",
+        "node_attr",
+        "edge_attr",
+        "hypergraph",
+        "cache",
+    }
+    assert all(isinstance(v, int) and v > 0 for v in usage.values())
+
+    shallow = H.memory_usage(deep=False)
+    assert shallow.keys() == usage.keys()
+    assert all(shallow[k] <= usage[k] for k in usage)
+    assert shallow["node"] < usage["node"]
+
+    # attribute values are only counted when deep
+    xgi.set_node_attributes(H, {1: {"name": "x" * 1000}})
+    assert H.memory_usage()["node_attr"] > usage["node_attr"] + 1000
+    assert H.memory_usage(deep=False)["node_attr"] < usage["node_attr"] + 1000
+
+    # cached results
+    xgi.incidence_matrix(H)
+    assert H.memory_usage()["cache"] > usage["cache"]
+    H.cache_clear()
+
+    # lazily built indexes
+    with H.batch():
+        assert H.memory_usage()["edge_lookup"] == 0
+        assert H.memory_usage()["edge_sizes"] == 0
+
+    H.set_attr_backend("columnar")
+    assert H.memory_usage()["node_attr"] > 0
+
+
+def test_pickle(edgelist1):
+    def check(H, G):
+        assert type(G) is type(H)
+        assert list(G.nodes) == list(H.nodes)
+        assert G.edges.members(dtype=dict) == H.edges.members(dtype=dict)
+        assert G.nodes.memberships() == H.nodes.memberships()
+        assert xgi.get_node_attributes(G) == xgi.get_node_attributes(H)
+        assert xgi.get_edge_attributes(G) == xgi.get_edge_attributes(H)
+        assert G._hypergraph == H._hypergraph
+        assert G.attr_backend == H.attr_backend
+        assert G._node_index.ids() == H._node_index.ids()
+        assert G._edge_index.ids() == H._edge_index.ids()
+
+    H = xgi.Hypergraph(edgelist1, name="test")
+    state = H._pickle_state()
+    assert state["nodes"].tolist() == [1, 2, 3, 4, 5, 6, 7, 8]
+    assert state["edges"] == range(4)
+    assert state["node_indptr"] is None  # the memberships follow the edges
+    check(H, pickle.loads(pickle.dumps(H)))
+
+    # memberships out of the order of the edges, repeated members, removals
+    H.add_node_to_edge(0, 6)
+    H.add_edge(["a", "a", "b"], id="e")
+    H.add_node("isolated")
+    H.remove_node(2)
+    H.remove_edge(1)
+    assert H._pickle_state()["node_indptr"] is not None
+    check(H, pickle.loads(pickle.dumps(H)))
+
+    # attributes of all types, in both backends
+    xgi.set_node_attributes(H, {1: {"x": 1.5}, 3: {"x": 2.5, "label": "three"}})
+    xgi.set_node_attributes(H, {5: {"big": 2**70, "list": [1, 2]}, 6: {"big": 1}})
+    xgi.set_edge_attributes(H, {0: {"weight": 2}, "e": {"weight": 3}})
+    xgi.set_edge_attributes(H, {e: np.float32(1.5) for e in H.edges}, name="np")
+    G = pickle.loads(pickle.dumps(H))
+    check(H, G)
+    assert type(G.edges[0]["weight"]) is int
+    assert type(G.edges[0]["np"]) is np.float32
+    H.set_attr_backend("columnar")
+    H.remove_node(6)
+    check(H, pickle.loads(pickle.dumps(H)))
+    H.set_attr_backend("dict")
+
+    G = pickle.loads(pickle.dumps(H))
+    G.add_edge([1, 4])
+    assert G.has_edge([1, 4])
+    assert G.edges.members(list(G.edges)[-1]) == [1, 4]
+    assert len(G.edges(order=1)) == len(H.edges(order=1)) + 1
+    assert not H.has_edge([1, 4])
+
+    for C in [H.copy(copy_on_write=True), H.dual(), xgi.Hypergraph()]:
+        check(C, pickle.loads(pickle.dumps(C)))
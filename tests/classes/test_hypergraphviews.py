@@ -1,7 +1,9 @@
+import pickle
+
 import pytest
 
 import xgi
-from xgi.exception import XGIError
+from xgi.exception import IDNotFound, XGIError
 
 
 def test_subhypergraph(edgelist1):
@@ -69,3 +71,114 @@ def test_subhypergraph(edgelist1):
     assert list(new_H.nodes) == [3, 4, 5, 6]
     assert list(new_H.edges) == [2]
     assert new_H.isolates(ignore_singletons=False) == {3, 4}
+
+
+def test_view_follows_parent(edgelist1):
+    H = xgi.Hypergraph(edgelist1)
+    S = xgi.subhypergraph(H, nodes=[1, 2, 3, 4, 5])
+    assert isinstance(S, xgi.SubHypergraphView)
+    assert S._parent is H
+    assert S.edges.members(dtype=dict) == {0: [1, 2, 3], 1: [4]}
+
+    H.add_edge([1, 5], id="a")
+    H.add_edge([1, 6], id="b")
+    H.remove_node(2)
+    assert list(S.nodes) == [1, 3, 4, 5]
+    assert S.edges.members(dtype=dict) == {0: [1, 3], 1: [4], "a": [1, 5]}
+    assert S.nodes.memberships(1) == [0, "a"]
+    assert S.num_edges == 3
+    assert S.degree(1) == 2
+    assert 6 not in S
+    assert "b" not in S.edges
+
+
+def test_view_structure(edgelist1):
+    H = xgi.Hypergraph(edgelist1)
+    S = xgi.subhypergraph(H, nodes=[8, 6, 7, 5], edges=[2, 3])
+    assert list(S.nodes) == [5, 6, 7, 8]
+    assert list(S.edges) == [2, 3]
+    assert S.neighbors(6) == {5, 7, 8}
+    assert S.has_edge([6, 5])
+    assert not S.has_edge([1, 2, 3])
+    assert S.edges.find([5, 6]) == [2]
+    assert list(S.edges(2)) == [3]
+    assert S.max_edge_order() == 2
+    assert not S.is_uniform()
+
+    S = xgi.subhypergraph(H, edges=[0, 2])
+    assert S.nodes.memberships(6) == [2]
+    assert S.nodes.memberships(4) == []
+    assert S.isolates() == {4, 7, 8}
+
+    I, rows, cols = xgi.incidence_matrix(S, index=True)
+    assert I.shape == (8, 2)
+    assert dict(rows) == dict(enumerate(H.nodes))
+    assert dict(cols) == {0: 0, 1: 2}
+    assert I.sum() == 5
+
+
+def test_view_of_view(edgelist1):
+    H = xgi.Hypergraph(edgelist1)
+    S = xgi.subhypergraph(H, nodes=[1, 2, 3, 5, 6, 7, 8])
+    T = xgi.subhypergraph(S, nodes=[5, 6, 7, 8, 1], edges=[2, 3])
+    assert list(T.nodes) == [1, 5, 6, 7, 8]
+    assert T.edges.members(dtype=dict) == {2: [5, 6], 3: [6, 7, 8]}
+    H.remove_edge(2)
+    assert list(T.edges) == [3]
+
+
+def test_view_attributes(edgelist1):
+    H = xgi.Hypergraph(edgelist1, name="test")
+    xgi.set_node_attributes(H, {1: "a", 5: "b"}, "name")
+    xgi.set_edge_attributes(H, {0: 2.0, 3: 3.0}, "weight")
+    S = xgi.subhypergraph(H, nodes=[1, 2, 3, 4])
+    assert S["name"] == "test"
+    assert S.nodes[1] == {"name": "a"}
+    assert xgi.get_node_attributes(S, "name") == {1: "a"}
+    assert xgi.get_edge_attributes(S, "weight") == {0: 2.0}
+    assert S.degree(1, weight="weight") == 2.0
+    assert list(S.nodes.filterby_attr("name", "a")) == [1]
+    with pytest.raises(IDNotFound):
+        S.nodes[5]
+
+    # attributes are those of the parent
+    xgi.set_node_attributes(S, {2: "c"}, "name")
+    assert H.nodes[2] == {"name": "c"}
+
+
+def test_view_copy(edgelist1):
+    H = xgi.Hypergraph(edgelist1)
+    xgi.set_node_attributes(H, {1: "a"}, "name")
+    S = xgi.subhypergraph(H, nodes=[1, 2, 3, 5, 6])
+    C = S.copy()
+    assert type(C) is xgi.Hypergraph
+    assert not xgi.is_frozen(C)
+    assert C.edges.members(dtype=dict) == {0: [1, 2, 3], 2: [5, 6]}
+    assert C.nodes.memberships() == S.nodes.memberships()
+    assert C.nodes[1] == {"name": "a"}
+    C.add_edge([1, 5])
+    C.nodes[1]["name"] = "b"
+    assert H.num_edges == 4
+    assert H.nodes[1] == {"name": "a"}
+    assert C.dual().num_nodes == S.dual().num_nodes + 1
+
+    SC = xgi.SimplicialComplex([[1, 2, 3], [3, 4]])
+    C = xgi.subhypergraph(SC, nodes=[1, 2, 3]).copy()
+    assert type(C) is xgi.SimplicialComplex
+    assert C.num_edges == 4
+
+
+def test_view_pickle(edgelist1):
+    H = xgi.Hypergraph(edgelist1)
+    S = xgi.subhypergraph(H, nodes=[1, 2, 3, 4, 5])
+    T = pickle.loads(pickle.dumps(S))
+    assert isinstance(T, xgi.SubHypergraphView)
+    assert T.edges.members(dtype=dict) == S.edges.members(dtype=dict)
+    assert list(T.nodes) == list(S.nodes)
+
+
+def test_view_memory_usage(edgelist1):
+    H = xgi.Hypergraph(edgelist1)
+    S = xgi.subhypergraph(H, nodes=[1, 2, 3, 4, 5])
+    assert sum(S.memory_usage().values()) < sum(H.memory_usage().values())
+    assert S.memory_usage(deep=False)["node_attr"] > 0
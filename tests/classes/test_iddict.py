@@ -1,6 +1,11 @@
+import copy
+import json
+import pickle
+
 import pytest
 
 import xgi
+from xgi.classes.hypergraph import IDDict, LazyAttrs
 from xgi.exception import IDNotFound
 
 
@@ -26,3 +31,95 @@ def test_neighbors():
         H.remove_node(0)
     with pytest.raises(IDNotFound):
         H.remove_edge(0)
+
+
+def test_lazy_attrs(edgelist1):
+    H = xgi.Hypergraph(edgelist1)
+    H.add_node(10, color="red")
+    H.add_edge([1, 10], id="a", weight=2)
+    assert dict(H._node_attr) == {10: {"color": "red"}}
+    assert dict(H._edge_attr) == {"a": {"weight": 2}}
+
+    attrs = H.nodes[1]
+    assert isinstance(attrs, LazyAttrs)
+    assert isinstance(attrs, dict)
+    assert json.dumps(attrs) == "{}"
+    assert attrs == {} and len(attrs) == 0 and "color" not in attrs
+    assert attrs.get("color") is None
+    with pytest.raises(KeyError):
+        attrs["color"]
+    with pytest.raises(KeyError):
+        del attrs["color"]
+    assert repr(attrs) == "{}"
+    assert type(attrs.copy()) is dict
+    assert 1 not in H._node_attr
+
+    # the dict is created on the first write
+    attrs["color"] = "blue"
+    attrs.update(size=3)
+    assert H.nodes[1] is attrs
+    assert H.nodes[1] == attrs == {"color": "blue", "size": 3}
+    del attrs["size"]
+    assert H.nodes[1] == {"color": "blue"}
+
+    xgi.set_edge_attributes(H, {0: 1, 100: 2}, name="weight")
+    assert dict(H._edge_attr) == {0: {"weight": 1}, "a": {"weight": 2}}
+    assert xgi.get_edge_attributes(H) == {
+        0: {"weight": 1},
+        1: {},
+        2: {},
+        3: {},
+        "a": {"weight": 2},
+    }
+
+    assert json.dumps(H.nodes[1]) == '{"color": "blue"}'
+    assert pickle.loads(pickle.dumps(attrs)) == {"color": "blue"}
+
+    # the views of an ID without attributes are one dict
+    first, second = H.nodes[3], H.nodes[3]
+    assert first is second
+    first["color"] = "green"
+    assert second.setdefault("color", "blue") == "green"
+    assert H.nodes[3] is first
+    assert json.dumps(second) == '{"color": "green"}'
+
+    # writes go to the dict the ID got after the view was taken
+    attrs = H.nodes[4]
+    H._node_attr[4] = {"color": "red"}
+    attrs["size"] = 1
+    assert H.nodes[4] == {"color": "red", "size": 1}
+
+    # the views of removed IDs cannot be written
+    attrs = H.nodes[2]
+    H.remove_node(2)
+    with pytest.raises(IDNotFound):
+        attrs["color"] = "green"
+    assert 2 not in H._node_attr
+    with pytest.raises(IDNotFound):
+        H._node_attr[2]
+
+
+def test_lazy_attrs_copies(edgelist1):
+    H = xgi.Hypergraph(edgelist1)
+    H.nodes[1]["color"] = "red"
+    for C in [H.copy(), H.dual().dual(), pickle.loads(pickle.dumps(H))]:
+        assert dict(C._node_attr) == {1: {"color": "red"}}
+        assert C._node_attr._ids is C._node
+        assert C._edge_attr._ids is C._edge
+        C.nodes[2]["color"] = "blue"
+        assert H.nodes[2] == {}
+
+    # with views of IDs without attributes in use
+    attrs = H.nodes[3]
+    for store in [
+        copy.deepcopy(H._node_attr),
+        pickle.loads(pickle.dumps(H._node_attr)),
+    ]:
+        assert dict(store) == {1: {"color": "red"}}
+        store[3]["color"] = "blue"
+        assert attrs == {}
+
+    H.set_attr_backend("columnar")
+    H.set_attr_backend("dict")
+    assert dict(H._node_attr) == {1: {"color": "red"}}
+    assert H.nodes[2] == {}
@@ -1,3 +1,5 @@
+import pickle
+
 import numpy as np
 import pytest
 
@@ -129,6 +131,30 @@ def test_edge_members(edgelist3):
         H.edges.members("test")
 
 
+def test_members_without_copy(edgelist3):
+    H = xgi.Hypergraph(edgelist3)
+    members = H.edges.members(0, copy=False)
+    assert list(members) == [1, 2, 3]
+    assert len(members) == 3 and 2 in members
+    assert not hasattr(members, "append")
+    H.add_node_to_edge(0, 7)
+    assert list(members) == [1, 2, 3, 7]
+
+    assert [list(m) for m in H.edges.members(copy=False)] == H.edges.members()
+    members = H.edges.members(dtype=dict, copy=False)
+    assert {e: list(m) for e, m in members.items()} == H.edges.members(dtype=dict)
+    assert list(H.nodes.memberships(4, copy=False)) == [1, 2]
+    memberships = H.nodes.memberships(copy=False)
+    assert {n: list(m) for n, m in memberships.items()} == H.nodes.memberships()
+    with pytest.raises(IDNotFound):
+        H.edges.members("test", copy=False)
+
+    SC = xgi.SimplicialComplex([[1, 2, 3]])
+    assert SC.edges.members(0, copy=False) is SC._edge[0]
+    C = xgi.CompactHypergraph(edgelist3)
+    assert C.edges.members(1, copy=False) == [3, 4]
+
+
 def test_view_len(edgelist2):
     H = xgi.Hypergraph(edgelist2)
     nodes = H.nodes
@@ -148,3 +174,159 @@ def test_bunch_view(edgelist1):
     assert bunch_view.members(dtype=dict) == {1: [4], 2: [5, 6]}
     with pytest.raises(IDNotFound):
         bunch_view.members(0)
+
+
+def test_find(edgelist1):
+    H = xgi.Hypergraph(edgelist1)
+    assert H.edges.find([1, 2, 3]) == [0]
+    assert H.edges.find({3, 2, 1}) == [0]
+    assert H.edges.find([1, 2]) == []
+    assert H.edges.find([[1, 2]]) == []
+
+    H.add_edge([8, 7, 6], id="dup")
+    assert H.edges.find([6, 7, 8]) == [3, "dup"]
+    assert H.edges(order=2).find([6, 7, 8]) == [3, "dup"]
+    assert H.edges.from_view(H.edges, bunch=["dup"]).find([6, 7, 8]) == ["dup"]
+
+    H.remove_edge(3)
+    assert H.edges.find([6, 7, 8]) == ["dup"]
+
+
+def test_containing(edgelist1):
+    H = xgi.Hypergraph(edgelist1)
+    H.add_edge([6, 7], id="a")
+    H.add_edge([6, 6, 8], id="b")
+    assert H.edges.containing([6]) == [2, 3, "a", "b"]
+    assert H.edges.containing([7, 6]) == [3, "a"]
+    assert H.edges.containing({6, 7, 8}) == [3]
+    assert H.edges.containing([1, 6]) == []
+    assert H.edges.containing([]) == list(H.edges)
+    assert H.edges(order=1).containing([6]) == [2, "a"]
+    with pytest.raises(IDNotFound):
+        H.edges.containing([6, 10])
+
+    C = xgi.CompactHypergraph(H)
+    assert C.edges.containing([6, 7]) == [3, "a"]
+
+
+def test_within(edgelist1):
+    H = xgi.Hypergraph(edgelist1)
+    H.add_edge([6, 6, 8], id="b")
+    assert sorted(H.edges.within([1, 2, 3, 4])) == [0, 1]
+    assert sorted(H.edges.within({5, 6, 7, 8, 9}), key=str) == [2, 3, "b"]
+    assert H.edges.within([6, 8]) == ["b"]
+    assert H.edges.within([1, 2]) == []
+    assert H.edges.within([]) == []
+    assert sorted(H.edges(order=2).within(range(1, 9)), key=str) == [0, 3, "b"]
+    assert H.edges.from_view(H.edges, [0, 1]).within([1, 2, 3]) == [0]
+
+    C = xgi.CompactHypergraph(H)
+    assert sorted(C.edges.within([5, 6, 7, 8]), key=str) == [2, 3, "b"]
+
+
+def test_degree_view_cache(edgelist1):
+    H = xgi.Hypergraph(edgelist1)
+
+    # single lookups do not compute all the degrees
+    assert H.degree()[6] == 2
+    assert H.degree(6) == 2
+    assert len(H._cache) == 0
+
+    degrees = dict(H.degree())
+    cached = H._cache.get(("degree", None), H.version)
+    assert cached == degrees
+    assert dict(H.degree()) == degrees
+    assert H._cache.get(("degree", None), H.version) is cached
+    assert H.cache_info().hits == 1
+    assert H.degree()[6] == 2
+
+    assert dict(H.degree(order=2)) == {1: 1, 2: 1, 3: 1, 4: 0, 5: 0, 6: 1, 7: 1, 8: 1}
+    assert H._cache.get(("degree", 2), H.version) is not None
+    assert dict(H.edge_size()) == {0: 3, 1: 1, 2: 2, 3: 3}
+
+    # any change to the structure invalidates the cache
+    for mutate, node, degree in [
+        (lambda: H.add_edge([1, 6]), 6, 3),
+        (lambda: H.add_node_to_edge(1, 6), 6, 4),
+        (lambda: H.remove_node_from_edge(1, 6), 6, 3),
+        (lambda: H.remove_edge(4), 6, 2),
+        (lambda: H.remove_node(8), 7, 1),
+        (lambda: H.add_edges_from([[7, 9]]), 7, 2),
+        (lambda: H.clear_edges(), 7, 0),
+    ]:
+        dict(H.degree())
+        dict(H.edge_size())
+        mutate()
+        assert H.degree()[node] == degree
+        assert dict(H.degree())[node] == degree
+        assert dict(H.edge_size()) == {e: len(H.edges.members(e)) for e in H.edges}
+
+    # weighted degrees are not cached because attributes can change at any time
+    H = xgi.Hypergraph(edgelist1)
+    xgi.set_edge_attributes(H, 2, name="weight")
+    assert dict(H.degree(weight="weight"))[6] == 4
+    H.edges[3]["weight"] = 5
+    assert dict(H.degree(weight="weight"))[6] == 7
+    assert H.degree(6, weight="weight") == 7
+    assert len(H._cache) == 0
+
+
+def test_degree_view_bunch(edgelist1):
+    H = xgi.Hypergraph([["a", "ab"], ["ab", "b"]])
+    assert H.degree("ab") == 2
+    assert dict(H.degree(["a", "b"])) == {"a": 1, "b": 1}
+
+    H = xgi.Hypergraph(edgelist1)
+    dict(H.degree())
+    view = H.degree([6, 1, 100])
+    assert len(view) == 2
+    assert dict(view) == {1: 1, 6: 2}
+    with pytest.raises(XGIError):
+        view[2]
+    assert H.degree(dtype="list")[[1, 6]] == [1, 2]
+
+
+def test_filterby_attr(edgelist1):
+    for backend in ["dict", "columnar"]:
+        H = xgi.Hypergraph(edgelist1)
+        H.set_attr_backend(backend)
+        xgi.set_edge_attributes(H, {0: 1, 1: 2, 2: 3}, name="w")
+        xgi.set_node_attributes(H, {1: "a", 2: "b"}, name="c")
+
+        assert list(H.edges.filterby_attr("w", 2)) == [1]
+        assert list(H.edges.filterby_attr("w", 2, "neq")) == [0, 2]
+        assert list(H.edges.filterby_attr("w", 2, "lt")) == [0]
+        assert list(H.edges.filterby_attr("w", 2, "gt")) == [2]
+        assert list(H.edges.filterby_attr("w", 2, "leq")) == [0, 1]
+        assert list(H.edges.filterby_attr("w", 2, "geq")) == [1, 2]
+        assert list(H.edges.filterby_attr("w", (2, 3), "between")) == [1, 2]
+        assert list(H.nodes.filterby_attr("c", "b")) == [2]
+        assert list(H.nodes.filterby_attr("d", "b")) == []
+        with pytest.raises(XGIError):
+            H.edges.filterby_attr("w", 2, "ge")
+
+
+def test_columnar_weighted_degree(edgelist1):
+    H = xgi.Hypergraph(edgelist1)
+    xgi.set_edge_attributes(H, {0: 0.5, 1: 2, 3: 4}, name="w")
+    degrees = dict(H.degree(weight="w"))
+    assert degrees[1] == 0.5 and degrees[5] == 1
+    H.set_attr_backend("columnar")
+    H.cache_clear()
+    assert dict(H.degree(weight="w")) == degrees
+
+
+def test_pickle_views(edgelist1):
+    H = xgi.Hypergraph(edgelist1)
+    H.nodes[1]["color"] = "red"
+    for view in [
+        H.nodes,
+        H.edges,
+        H.edges(order=2),
+        H.nodes.filterby_attr("color", "red"),
+    ]:
+        V = pickle.loads(pickle.dumps(view))
+        assert type(V) is type(view)
+        assert set(V) == set(view)
+        assert V._id_dict in (V._net._node, V._net._edge)
+    assert pickle.loads(pickle.dumps(H.nodes))[1] == {"color": "red"}
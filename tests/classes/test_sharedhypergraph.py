@@ -0,0 +1,97 @@
+import multiprocessing as mp
+import pickle
+import sys
+
+import pytest
+
+import xgi
+from xgi.classes.compacthypergraph import _RangePositions
+from xgi.exception import XGIError
+
+
+def _summary(handle):
+    C = xgi.attach(handle)
+    return (
+        C.edges.members(dtype=dict),
+        C.nodes.memberships(),
+        dict(C.degree()),
+        xgi.incidence_matrix(C).toarray().tolist(),
+    )
+
+
+def test_share(edgelist1):
+    H = xgi.Hypergraph(edgelist1)
+    xgi.set_node_attributes(H, {1: "a"}, "name")
+    H["name"] = "test"
+    with xgi.share(H) as handle:
+        C = xgi.attach(handle)
+        assert isinstance(C, xgi.CompactHypergraph)
+        assert list(C.nodes) == list(H.nodes)
+        assert C.edges.members(dtype=dict) == H.edges.members(dtype=dict)
+        assert C.nodes.memberships() == H.nodes.memberships()
+        assert dict(C.degree()) == dict(H.degree())
+        assert C.nodes[1] == {"name": "a"}
+        assert C["name"] == "test"
+        assert not C._edge_indices.flags.writeable
+        with pytest.raises(XGIError):
+            C.add_node(10)
+
+        # the snapshot does not follow the hypergraph
+        H.add_edge([1, 8])
+        assert C.num_edges == 4
+
+
+def test_attach_copy():
+    H = xgi.Hypergraph()
+    H.add_nodes_from(range(4))
+    H.add_edges_from([[0, 1, 2], [1, 3]])
+    with xgi.share(H) as handle:
+        copy = pickle.loads(pickle.dumps(handle))
+        C = xgi.attach(copy)
+        assert C.edges.members() == [[0, 1, 2], [1, 3]]
+        assert C._edge_indices.base is not None
+        # IDs 0, ..., n-1 are not mapped with a dict
+        assert isinstance(C._node._pos, _RangePositions)
+        assert isinstance(C._edge._pos, _RangePositions)
+        assert pickle.loads(pickle.dumps(C)).edges.members() == C.edges.members()
+        del C
+        copy.close()
+
+    with pytest.raises(XGIError):
+        xgi.attach(pickle.loads(pickle.dumps(handle)))
+
+
+def test_string_ids():
+    H = xgi.Hypergraph({"e1": ["a", "b"], "e2": ["b", "c"]})
+    with xgi.share(H) as handle:
+        C = xgi.attach(pickle.loads(pickle.dumps(handle)))
+        assert C.edges.members(dtype=dict) == {"e1": ["a", "b"], "e2": ["b", "c"]}
+        assert C.nodes.memberships("b") == ["e1", "e2"]
+
+
+def test_empty():
+    with xgi.share(xgi.Hypergraph()) as handle:
+        C = xgi.attach(handle)
+        assert C.num_nodes == 0
+        assert C.num_edges == 0
+
+
+def test_workers(edgelist1):
+    H = xgi.Hypergraph(edgelist1)
+    expected = (
+        H.edges.members(dtype=dict),
+        H.nodes.memberships(),
+        dict(H.degree()),
+        xgi.incidence_matrix(H).toarray().tolist(),
+    )
+    with xgi.share(H) as handle:
+        with mp.get_context("fork").Pool(1) as pool:
+            assert pool.map(_summary, [handle, handle]) == [expected, expected]
+
+
+def test_no_shared_memory(edgelist1, monkeypatch):
+    # as on Python 3.7, where the module does not exist
+    monkeypatch.setitem(sys.modules, "multiprocessing.shared_memory", None)
+    monkeypatch.delattr(mp, "shared_memory", raising=False)
+    with pytest.raises(XGIError):
+        xgi.share(xgi.Hypergraph(edgelist1))
@@ -1,7 +1,9 @@
+import pickle
+
 import pytest
 
 import xgi
-from xgi.exception import XGIError
+from xgi.exception import IDNotFound, XGIError
 
 
 def test_constructor(edgelist5, dict5, incidence5, dataframe5):
@@ -17,6 +19,30 @@ def test_constructor(edgelist5, dict5, incidence5, dataframe5):
     assert list(S_list.edges) == list(S_df.edges)
     assert list(S_list.edges.members(0)) == list(S_df.edges.members(0))
 
+    S_list.edges[0]["weight"] = 2
+    S_copy = xgi.SimplicialComplex(S_list)
+    assert set(S_copy.edges.members()) == set(S_list.edges.members())
+    assert xgi.get_edge_attributes(S_copy, "weight") == {0: 2}
+
+
+def test_copy_constructor():
+    S = xgi.SimplicialComplex([[1, 2], [3, 4], [5, 6, 7]], name="test")
+    S.remove_simplex_id(0)
+    S.edges[4]["weight"] = 2
+    S.nodes[5]["color"] = "red"
+    for T in [xgi.SimplicialComplex(S), xgi.convert_to_simplicial_complex(S)]:
+        assert isinstance(T, xgi.SimplicialComplex)
+        assert list(T.edges) == [1, 2, 3, 4, 5]
+        assert T.edges.members(dtype=dict) == S.edges.members(dtype=dict)
+        assert T.edges[4] == {"weight": 2}
+        assert T.nodes[5] == {"color": "red"}
+        assert T["name"] == "test"
+        assert T.facets() == S.facets()
+        T.add_simplex([8, 9])
+        assert 6 in T.edges
+        T.edges[4]["weight"] = 3
+        assert S.edges[4] == {"weight": 2}
+
 
 def test_add_simplex():
     S = xgi.SimplicialComplex()
@@ -40,6 +66,8 @@ def test_add_edge():
     S = xgi.SimplicialComplex()
     with pytest.raises(XGIError):
         S.add_edge([1, 2, 3])
+    with pytest.raises(XGIError):
+        S.add_edges_from_arrays([0, 3], [1, 2, 3])
 
 
 def test_add_simplices_from(edgelist5):
@@ -58,6 +86,65 @@ def test_add_simplices_from(edgelist5):
     assert set(S1.edges(order=2).members()) == set(S2.edges(order=2).members())
 
 
+def test_add_simplex_faces():
+    S = xgi.SimplicialComplex()
+    S.add_simplex([1, 2, 3, 4], color="red")
+    assert S._edge == {
+        0: frozenset({1, 2, 3, 4}),
+        1: frozenset({1, 2, 3}),
+        2: frozenset({1, 2}),
+        3: frozenset({1, 3}),
+        4: frozenset({2, 3}),
+        5: frozenset({1, 2, 4}),
+        6: frozenset({1, 4}),
+        7: frozenset({2, 4}),
+        8: frozenset({1, 3, 4}),
+        9: frozenset({3, 4}),
+        10: frozenset({2, 3, 4}),
+    }
+    assert S.edges[0] == {"color": "red"}
+    assert S.edges[1] == {}
+
+    # only the missing faces are added
+    S.add_simplices_from([[3, 4, 5], [2, 3, 4, 5]])
+    assert S.num_edges == 18
+    assert S.edges.members(11) == {3, 4, 5}
+    assert S.edges.members(14) == {2, 3, 4, 5}
+    assert sorted(S.nodes.memberships(5)) == [11, 12, 13, 14, 15, 16, 17]
+
+    with pytest.raises(XGIError):
+        S.add_simplex([])
+    with pytest.raises(XGIError):
+        S.add_simplex([[1], [2]])
+
+
+def test_has_simplex():
+    S = xgi.SimplicialComplex([[1, 2, 3], [4]])
+    assert S.has_simplex([3, 2, 1])
+    assert S.has_simplex({1, 3})
+    assert S.has_simplex([4])
+    assert not S.has_simplex([1])
+    assert not S.has_simplex([1, 4])
+    assert not S.has_simplex([[1, 2]])
+
+    S.remove_simplex_id(1)  # {1, 2}
+    assert not S.has_simplex([1, 2])
+    assert not S.has_simplex([1, 2, 3])
+    assert S.has_simplex([1, 3])
+
+    with S.batch():
+        S.add_simplex([1, 2])
+        assert S.has_simplex([2, 1])
+    assert S.has_simplex([1, 2])
+
+
+def test_close():
+    S = xgi.SimplicialComplex([[1, 2, 3, 4]])
+    edges = S.edges.members(dtype=dict)
+    S.close()
+    assert S.edges.members(dtype=dict) == edges
+
+
 def test_remove_simplex_id(edgelist6):
     S = xgi.SimplicialComplex()
     S.add_simplices_from(edgelist6)
@@ -74,3 +161,61 @@ def test_remove_simplex_id(edgelist6):
         9: frozenset({3, 4}),
     }
     assert S._edge == edge_dict
+    assert set(S.edges(order=1)) == {1, 2, 3, 5, 8, 9}
+    assert S.max_edge_order() == 2
+
+
+def test_star():
+    S = xgi.SimplicialComplex([[1, 2, 3], [2, 3, 4], [4], [4, 5]])
+    assert S.star([2, 3]) == [3, 0, 4]
+    assert S.star([4])[0] == 7
+    assert sorted(S.star([4])) == [4, 5, 6, 7, 8]
+    assert sorted(S.star([2])) == [0, 1, 3, 4, 5]
+    assert S.star([1, 4]) == []
+    with pytest.raises(IDNotFound):
+        S.star([1, 10])
+
+    # the Hasse diagram is kept up to date
+    S.remove_simplex_id(5)  # {2, 4}, and {2, 3, 4} with it
+    assert sorted(S.star([4])) == [6, 7, 8]
+    assert S.star([2, 3]) == [3, 0]
+    S.add_simplex([2, 4, 5])
+    assert sorted(S.star([4])) == [6, 7, 8, 9, 10]
+    assert S.star([2, 4]) == [10, 9]
+    assert S._cofaces == S.copy()._cofaces_index()
+
+
+def test_link():
+    S = xgi.SimplicialComplex([[1, 2, 3], [2, 3, 4], [3, 5]])
+    assert sorted(map(sorted, S.link([2, 3]))) == [[1], [4]]
+    assert sorted(map(sorted, S.link([2]))) == [[1], [1, 3], [3], [3, 4], [4]]
+    assert S.link([3, 5]) == []
+    assert S.link([1, 5]) == []
+
+
+def test_facets():
+    S = xgi.SimplicialComplex([[1, 2, 3], [3, 4], [5]])
+    assert S.facets() == [0, 4, 5]
+    assert S.cache_info().currsize == 1
+
+    # the facets are recomputed after changes
+    S.add_simplex([2, 3, 4])
+    assert S.facets() == [0, 5, 6]
+    S.remove_simplex_id(2)  # {1, 3}
+    assert S.facets() == [1, 5, 6]
+
+    # same facets from the Hasse diagram
+    S._cofaces_index()
+    S.add_simplex([5, 6])
+    assert S.facets() == [1, 6, 8]
+
+
+def test_pickle(edgelist1):
+    S = xgi.SimplicialComplex(edgelist1)
+    T = pickle.loads(pickle.dumps(S))
+    assert type(T) is xgi.SimplicialComplex
+    assert T.edges.members(dtype=dict) == S.edges.members(dtype=dict)
+    assert T.nodes.memberships() == S.nodes.memberships()
+    T.add_simplex([3, 4])
+    assert T.has_simplex([3, 4])
+    assert not S.has_simplex([3, 4])
@@ -0,0 +1,158 @@
+from itertools import combinations
+
+import networkx as nx
+import numpy as np
+import pytest
+
+import xgi
+import xgi.linalg.homology as homology
+from xgi.exception import XGIError
+
+sphere = list(combinations(range(4), 3))
+torus = [[i, (i + 1) % 7, (i + 3) % 7] for i in range(7)] + [
+    [i, (i + 2) % 7, (i + 3) % 7] for i in range(7)
+]
+projective_plane = [
+    [0, 1, 2],
+    [0, 2, 3],
+    [0, 3, 4],
+    [0, 4, 5],
+    [0, 5, 1],
+    [1, 2, 4],
+    [2, 3, 5],
+    [3, 4, 1],
+    [4, 5, 2],
+    [5, 1, 3],
+]
+
+
+def random_complexes():
+    for seed in range(4):
+        G = nx.gnm_random_graph(20, 90, seed=seed)
+        yield xgi.flag_complex(G, max_order=4)
+
+
+def gf2_rank(A):
+    A = A % 2
+    rank = 0
+    for j in range(A.shape[1]):
+        hits = np.flatnonzero(A[rank:, j])
+        if not len(hits):
+            continue
+        pivot = rank + hits[0]
+        A[[rank, pivot]] = A[[pivot, rank]]
+        others = np.flatnonzero(A[:, j])
+        others = others[others != rank]
+        A[others] ^= A[rank]
+        rank += 1
+        if rank == len(A):
+            break
+    return rank
+
+
+def test_boundary_matrix():
+    S = xgi.SimplicialComplex([[1, 2, 3], [3, 4]])
+    B1, rowdict, coldict = xgi.boundary_matrix(S, 1, index=True)
+    assert B1.shape == (4, 4)
+    assert dict(rowdict) == {0: 1, 1: 2, 2: 3, 3: 4}
+    for k, e in coldict.items():
+        u, v = sorted(S.edges.members(e))
+        col = B1[:, k].toarray().ravel()
+        assert col[u - 1] == -1
+        assert col[v - 1] == 1
+        assert np.abs(col).sum() == 2
+
+    B2, rowdict2, coldict2 = xgi.boundary_matrix(S, 2, index=True)
+    assert B2.shape == (4, 1)
+    assert dict(rowdict2) == dict(coldict)
+    assert abs(B2).sum() == 3
+
+    assert xgi.boundary_matrix(S, 0).shape == (0, 4)
+    assert xgi.boundary_matrix(S, 3).shape == (1, 0)
+
+    for S in random_complexes():
+        for k in range(1, 4):
+            B = xgi.boundary_matrix(S, k)
+            assert B.shape == (
+                xgi.boundary_matrix(S, k - 1).shape[1],
+                xgi.boundary_matrix(S, k + 1).shape[0],
+            )
+            assert (B @ xgi.boundary_matrix(S, k + 1)).nnz == 0
+
+    with pytest.raises(XGIError):
+        xgi.boundary_matrix(S, -1)
+    with pytest.raises(XGIError):
+        xgi.boundary_matrix(xgi.Hypergraph([[1, 2, 3]]), 1)
+
+    # a hypergraph forced into a simplicial complex without its faces
+    S = xgi.SimplicialComplex()
+    xgi.Hypergraph.add_edge(S, [1, 2, 3])
+    with pytest.raises(XGIError):
+        xgi.boundary_matrix(S, 2)
+
+
+def test_boundary_matrix_facet_complex():
+    F = xgi.FacetComplex(torus)
+    S = xgi.SimplicialComplex(torus)
+    for k in range(3):
+        B, rowdict, coldict = xgi.boundary_matrix(F, k, index=True)
+        C, rowdict2, coldict2 = xgi.boundary_matrix(S, k, index=True)
+        assert B.shape == C.shape
+        rows = [
+            frozenset(S.edges.members(e)) if k > 1 else e for e in rowdict2.values()
+        ]
+        cols = [frozenset(S.edges.members(e)) if k else e for e in coldict2.values()]
+        rows = [list(rowdict.values()).index(r) for r in rows]
+        cols = [list(coldict.values()).index(c) for c in cols]
+        assert (B[rows][:, cols] != C).nnz == 0
+    assert xgi.betti_numbers(F) == [1, 2, 1]
+
+
+def test_hodge_laplacian():
+    S = xgi.SimplicialComplex([[1, 2, 3], [3, 4]])
+    L0 = xgi.hodge_laplacian(S, 0)
+    G = nx.Graph([S.edges.members(e) for e in S.edges(order=1)])
+    assert np.all(L0.toarray() == nx.laplacian_matrix(G, nodelist=[1, 2, 3, 4]))
+    L1, rowdict = xgi.hodge_laplacian(S, 1, index=True)
+    assert len(rowdict) == 4
+    assert np.all(L1.toarray() == L1.toarray().T)
+
+    for S in random_complexes():
+        betti = xgi.betti_numbers(S, max_order=3, field="R")
+        for k in range(4):
+            L = xgi.hodge_laplacian(S, k).toarray()
+            B = xgi.boundary_matrix(S, k).toarray()
+            C = xgi.boundary_matrix(S, k + 1).toarray()
+            assert np.all(L == B.T @ B + C @ C.T)
+            assert len(L) - np.linalg.matrix_rank(L) == betti[k]
+
+
+def test_betti_numbers():
+    assert xgi.betti_numbers(xgi.SimplicialComplex(sphere)) == [1, 0, 1]
+    assert xgi.betti_numbers(xgi.SimplicialComplex(torus)) == [1, 2, 1]
+    S = xgi.SimplicialComplex(projective_plane)
+    assert xgi.betti_numbers(S) == [1, 1, 1]
+    assert xgi.betti_numbers(S, field="R") == [1, 0, 0]
+
+    S = xgi.SimplicialComplex([[1, 2], [2, 3], [1, 3], [4, 5, 6]])
+    S.add_node(7)
+    assert xgi.betti_numbers(S) == [3, 1, 0]
+    assert xgi.betti_numbers(S, max_order=0) == [3]
+    assert xgi.betti_numbers(S, max_order=3) == [3, 1, 0, 0]
+    assert xgi.betti_numbers(xgi.SimplicialComplex()) == []
+
+    with pytest.raises(XGIError):
+        xgi.betti_numbers(S, field="Q")
+    with pytest.raises(XGIError):
+        xgi.betti_numbers(xgi.Hypergraph([[1, 2]]))
+
+
+@pytest.mark.parametrize("dense_weight", [0, 2, 64])
+def test_rank(dense_weight, monkeypatch):
+    monkeypatch.setattr(homology, "_DENSE_WEIGHT", dense_weight)
+    for S in random_complexes():
+        for k in range(2, 5):
+            B = xgi.boundary_matrix(S, k)
+            A = B.toarray()
+            assert homology._rank(B, 2) == gf2_rank(A.copy())
+            assert homology._rank(B, homology._PRIME) == np.linalg.matrix_rank(A)
@@ -5,6 +5,7 @@ from scipy.sparse import csr_matrix
 from scipy.sparse.linalg import norm as spnorm
 
 import xgi
+from xgi.exception import XGIError
 
 
 def test_incidence_matrix(edgelist1, edgelist3, edgelist4):
@@ -407,3 +408,106 @@ def test_empty():
     assert xgi.adjacency_matrix(H).shape == (0, 0)
     assert xgi.laplacian(H).shape == (0, 0)
     assert xgi.clique_motif_matrix(H).shape == (0,)
+
+
+def test_incidence_matrix_after_removal(edgelist1):
+    H = xgi.Hypergraph(edgelist1)
+    H.remove_node(2)
+    H.remove_edge(1)
+    H.add_node(9)
+    H.add_edge([9, 1], id="a")
+
+    I, rowdict, coldict = xgi.incidence_matrix(H, index=True)
+    assert I.shape == (H.num_nodes, H.num_edges)
+    assert list(rowdict.values()) == list(H.nodes)
+    assert list(coldict.values()) == list(H.edges)
+    for j, e in coldict.items():
+        members = {rowdict[i] for i in I[:, j].nonzero()[0]}
+        assert members == set(H.edges.members(e))
+
+    _, rowdict, coldict = xgi.incidence_matrix(H, order=1, index=True)
+    assert list(rowdict.values()) == list(H.nodes)
+    assert list(coldict.values()) == [0, 2, "a"]
+    assert coldict[2] == "a"
+
+
+def test_matrix_cache(edgelist1):
+    H = xgi.Hypergraph(edgelist1)
+    I1, rowdict, coldict = xgi.incidence_matrix(H, index=True)
+    I2 = xgi.incidence_matrix(H)
+    assert H.cache_info().misses == 2
+    assert xgi.incidence_matrix(H) is not I2
+    assert H.cache_info().hits == 1
+    assert (I1 != I2).nnz == 0
+
+    # results are copies, so they can be modified
+    I2[0, 0] = 5
+    assert xgi.incidence_matrix(H)[0, 0] == 1
+
+    # the arguments are part of the key
+    assert xgi.incidence_matrix(H, order=1).shape == (8, 1)
+    assert xgi.adjacency_matrix(H, s=2).sum() == 0
+    assert xgi.adjacency_matrix(H).sum() == 14
+
+    # changes to the structure invalidate the cache
+    H.add_edge([1, 4])
+    assert xgi.incidence_matrix(H).shape == (8, 5)
+    assert xgi.adjacency_matrix(H).sum() == 16
+
+    # weight functions are not cached
+    misses = H.cache_info().misses
+    w = lambda node, edge, H: 2
+    assert xgi.incidence_matrix(H, weight=w).sum() == 22
+    assert xgi.incidence_matrix(H, weight=w).sum() == 22
+    assert H.cache_info().misses == misses
+
+    H.cache_clear()
+    assert H.cache_info().currsize == 0
+    H.cache_resize(maxsize=0)
+    xgi.incidence_matrix(H)
+    assert H.cache_info().currsize == 0
+
+
+def test_incidence_matrix_weight_attr(edgelist1):
+    H = xgi.Hypergraph(edgelist1)
+    xgi.set_edge_attributes(H, {0: 0.5, 2: 3}, name="w")
+    expected = xgi.incidence_matrix(
+        H, weight=lambda n, e, H: H.edges[e].get("w", 1)
+    ).toarray()
+
+    assert np.array_equal(xgi.incidence_matrix(H, weight="w").toarray(), expected)
+    assert np.array_equal(xgi.incidence_matrix(H, sparse=False, weight="w"), expected)
+    H.set_attr_backend("columnar")
+    assert np.array_equal(xgi.incidence_matrix(H, weight="w").toarray(), expected)
+    assert xgi.incidence_matrix(H, order=1, weight="w").toarray().sum() == 6
+    C = xgi.CompactHypergraph(H)
+    assert np.array_equal(xgi.incidence_matrix(C, weight="w").toarray(), expected)
+
+    # attribute changes are seen, since attribute weights are not cached
+    H.edges[0]["w"] = 2
+    assert xgi.incidence_matrix(H, weight="w").toarray()[0, 0] == 2
+
+
+def test_estimate_matrix_memory(edgelist1):
+    H = xgi.Hypergraph(edgelist1)
+    n = H.num_nodes
+
+    I = xgi.incidence_matrix(H)
+    est = xgi.estimate_matrix_memory(H)
+    assert est >= I.data.nbytes + I.indices.nbytes + I.indptr.nbytes
+    assert xgi.estimate_matrix_memory(H, sparse=False) == 8 * n * H.num_edges
+    assert xgi.estimate_matrix_memory(H, order=1) < est
+    assert xgi.estimate_matrix_memory(H, order=5) == 0
+
+    A = xgi.adjacency_matrix(H)
+    assert xgi.estimate_matrix_memory(H, "adjacency") >= A.data.nbytes
+    assert xgi.estimate_matrix_memory(H, "laplacian") >= 3 * 8 * n**2
+    assert xgi.estimate_matrix_memory(xgi.Hypergraph(), "laplacian") == 0
+
+    C = xgi.CompactHypergraph(edgelist1)
+    assert xgi.estimate_matrix_memory(C, "adjacency") == xgi.estimate_matrix_memory(
+        H, "adjacency"
+    )
+
+    with pytest.raises(XGIError):
+        xgi.estimate_matrix_memory(H, "hessian")
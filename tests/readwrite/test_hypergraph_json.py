@@ -112,3 +112,13 @@ def test_write_hypergraph_json(edgelist1):
     assert H2.nodes[2] == {"name": "Ilya"}
     assert H2.edges[1] == {"weight": 2}
     assert H2["name"] == "test"
+
+
+def test_json_repeated_members():
+    _, filename = tempfile.mkstemp()
+    edges = [[1, 2, 1], [3, 1, 3, 2]]
+    H1 = xgi.Hypergraph(edges)
+    assert H1.edges.members() == edges
+    xgi.write_hypergraph_json(H1, filename)
+    H2 = xgi.read_hypergraph_json(filename, nodetype=int, edgetype=int)
+    assert H2.edges.members() == edges
@@ -1,4 +1,7 @@
+import numpy as np
+import pandas as pd
 import pytest
+from scipy.sparse import csr_matrix
 
 import xgi
 from xgi.exception import XGIError
@@ -81,3 +84,52 @@ def test_from_bipartite_graph(
     # not bipartite
     with pytest.raises(XGIError):
         H = xgi.from_bipartite_graph(bipartite_graph4, dual=True)
+
+
+def test_from_incidence_matrix(edgelist5, incidence5):
+    H = xgi.from_incidence_matrix(incidence5)
+    assert list(H.nodes) == list(range(9))
+    assert H.edges.members() == edgelist5
+
+    I = incidence5.copy()
+    I[:, 1] = 0
+    H = xgi.from_incidence_matrix(
+        csr_matrix(I), nodelabels="abcdefghi", edgelabels=["w", "x", "y", "z"]
+    )
+    assert list(H.edges) == ["w", "y", "z"]
+    assert H.edges.members("z") == ["g", "h", "i"]
+    assert "e" not in H.nodes
+
+    with pytest.raises(XGIError):
+        xgi.from_incidence_matrix(incidence5, nodelabels=range(3))
+    with pytest.raises(XGIError):
+        xgi.from_incidence_matrix(incidence5, edgelabels=range(3))
+
+
+def test_from_bipartite_pandas_dataframe(dataframe5, edgelist5):
+    H = xgi.from_bipartite_pandas_dataframe(dataframe5)
+    assert list(H.nodes) == list(range(9))
+    assert H.edges.members() == edgelist5
+
+    df = dataframe5.rename(columns={0: "node", 1: "edge"})
+    df["node"] = [f"n{i}" for i in df["node"]]
+    H = xgi.from_bipartite_pandas_dataframe(df, node_column="node", edge_column="edge")
+    assert H.edges.members(3) == ["n6", "n7", "n8"]
+    assert H.nodes.memberships("n6") == [2, 3]
+
+    with pytest.raises(XGIError):
+        xgi.from_bipartite_pandas_dataframe(dataframe5, node_column="a")
+
+
+def test_from_bipartite_pandas_dataframe_old_pandas(dataframe5, edgelist5, monkeypatch):
+    # pandas.factorize before pandas 1.5, without use_na_sentinel
+    factorize = pd.factorize
+    monkeypatch.setattr(pd, "factorize", lambda values, sort=False: factorize(values))
+    H = xgi.from_bipartite_pandas_dataframe(dataframe5)
+    assert list(H.nodes) == list(range(9))
+    assert H.edges.members() == edgelist5
+
+    df = pd.DataFrame({"node": [1, None, 2, 1], "edge": ["a", "a", "b", np.nan]})
+    H = xgi.from_bipartite_pandas_dataframe(df, node_column="node", edge_column="edge")
+    assert H.num_nodes == 3
+    assert H.num_edges == 3
@@ -1,6 +1,9 @@
+import numpy as np
 import pytest
 
-from xgi.utils import XGICounter, get_dual, load_xgi_data
+from xgi.exception import XGIError
+from xgi.utils import XGICounter, get_dual, load_xgi_data, unique_edges
+from xgi.utils.utilities import ResultCache
 
 
 @pytest.mark.webtest
@@ -31,3 +34,74 @@ def test_xgi_counter():
     count = XGICounter()
     assert count() == 0
     assert count() == 1
+
+
+def test_result_cache():
+    cache = ResultCache(maxsize=2)
+    calls = []
+
+    def compute(value):
+        calls.append(value)
+        return value
+
+    assert cache.lookup("a", 0, lambda: compute(1)) == 1
+    assert cache.lookup("a", 0, lambda: compute(2)) == 1
+    assert cache.lookup("b", 0, lambda: compute(3)) == 3
+    assert calls == [1, 3]
+    assert cache.info()[:4] == (1, 2, 2, 2)
+
+    # least recently used entries are evicted first
+    cache.lookup("a", 0, lambda: compute(4))
+    cache.lookup("c", 0, lambda: compute(5))
+    assert cache.get("a", 0) == 1
+    assert cache.get("b", 0) is None
+    assert len(cache) == 2
+
+    # a new version invalidates all the entries
+    assert cache.get("a", 1) is None
+    assert cache.lookup("a", 1, lambda: compute(6)) == 6
+    assert len(cache) == 1
+
+    cache.clear()
+    assert cache.info()[:4] == (0, 0, 2, 0)
+
+    with pytest.raises(XGIError):
+        cache.resize(maxsize=-1)
+
+    # nothing is cached with maxsize 0
+    cache.resize(maxsize=0)
+    cache.lookup("a", 1, lambda: compute(7))
+    assert len(cache) == 0
+
+
+def test_result_cache_maxbytes():
+    cache = ResultCache(maxbytes=1000)
+    small = np.zeros(50)
+    cache.lookup("small", 0, lambda: small)
+    assert cache.info().nbytes >= small.nbytes
+    cache.lookup("large", 0, lambda: np.zeros(1000))
+    assert cache.get("large", 0) is None
+    cache.lookup("small2", 0, lambda: np.zeros(50))
+    assert len(cache) == 2
+    cache.lookup("small3", 0, lambda: np.zeros(50))
+    assert cache.info().nbytes <= 1000
+    assert cache.get("small", 0) is None
+
+    cache.resize(maxbytes=None)
+    cache.lookup("large", 0, lambda: np.zeros(1000))
+    assert cache.get("large", 0) is not None
+
+
+def test_unique_edges():
+    edges = [[1, 2], (2, 1), [1, 1, 2], {3}, [2, 3], [3]]
+    assert list(unique_edges(edges)) == [[1, 2], {3}, [2, 3]]
+    assert list(unique_edges(edges, multisets=True)) == [[1, 2], [1, 1, 2], {3}, [2, 3]]
+
+    records = [([1, 2], "a"), ([2, 1], "b"), ([3], "c")]
+    assert list(unique_edges(records, key=lambda r: r[0])) == [records[0], records[2]]
+
+    # edges are consumed lazily
+    stream = iter(edges)
+    first = next(unique_edges(stream))
+    assert first == [1, 2]
+    assert next(stream) == (2, 1)
@@ -3,6 +3,7 @@ import random
 
 import xgi
 from xgi.exception import XGIError
+from xgi.utils.decorators import cached
 
 __all__ = [
     "is_connected",
@@ -43,7 +44,7 @@ def is_connected(H):
     True
 
     """
-    return len(_plain_bfs(H, list(H.nodes)[0])) == len(H)
+    return len(_connected_components(H)) == 1
 
 
 def connected_components(H):
@@ -75,12 +76,8 @@ def connected_components(H):
     [50]
 
     """
-    seen = set()
-    for v in H:
-        if v not in seen:
-            c = _plain_bfs(H, v)
-            seen.update(c)
-            yield c
+    for c in _connected_components(H):
+        yield set(c)
 
 
 def number_connected_components(H):
@@ -112,14 +109,7 @@ def number_connected_components(H):
     1
 
     """
-    num_cc = 0
-    seen = set()
-    for v in H:
-        if v not in seen:
-            c = _plain_bfs(H, v)
-            seen.update(c)
-            num_cc += 1
-    return num_cc
+    return len(_connected_components(H))
 
 
 def largest_connected_component(H):
@@ -151,7 +141,7 @@ def largest_connected_component(H):
     1
 
     """
-    return max(connected_components(H), key=len)
+    return set(max(_connected_components(H), key=len))
 
 
 def node_connected_component(H, n):
@@ -186,22 +176,51 @@ def node_connected_component(H, n):
 
     """
     if n in H:
-        return _plain_bfs(H, n)
+        return next(set(c) for c in _connected_components(H) if n in c)
     else:
         raise XGIError("Specified node is not in the hypergraph!")
 
 
-def _plain_bfs(H, source):
-    """A fast BFS node generator"""
+@cached
+def _connected_components(H):
+    """The connected components of a hypergraph as a tuple of frozensets.
+
+    The components are cached on the hypergraph until its structure changes.
+
+    """
+    components = []
     seen = set()
-    nextlevel = {source}
+    for v in H:
+        if v not in seen:
+            c = _plain_bfs(H, v)
+            seen.update(c)
+            components.append(frozenset(c))
+    return tuple(components)
+
+
+def _plain_bfs(H, source):
+    """A fast BFS node generator
+
+    Each edge is visited once, from the first of its members reached, and the
+    memberships and members are read without copying them.
+
+    """
+    memberships = H.nodes.memberships
+    members = H.edges.members
+    seen = {source}
+    seen_edges = set()
+    nextlevel = [source]
     while nextlevel:
         thislevel = nextlevel
-        nextlevel = set()
+        nextlevel = []
         for v in thislevel:
-            if v not in seen:
-                seen.add(v)
-                nextlevel.update(H.neighbors(v))
+            for e in memberships(v, copy=False):
+                if e not in seen_edges:
+                    seen_edges.add(e)
+                    for u in members(e, copy=False):
+                        if u not in seen:
+                            seen.add(u)
+                            nextlevel.append(u)
     return seen
 
 
@@ -240,7 +259,7 @@ def largest_connected_hypergraph(H, in_place=False):
     1
 
     """
-    connected_nodes = max(connected_components(H), key=len)
+    connected_nodes = largest_connected_component(H)
     if not in_place:
         return xgi.subhypergraph(H, nodes=connected_nodes).copy()
     else:
@@ -2,5 +2,8 @@ from xgi.classes import hypergraphviews, reportviews
 
 from .function import *
 from .hypergraph import Hypergraph
-from .hypergraphviews import subhypergraph
+from .compacthypergraph import CompactHypergraph
+from .sharedhypergraph import SharedHypergraph, attach, share
+from .hypergraphviews import SubHypergraphView, subhypergraph
 from .simplicialcomplex import SimplicialComplex
+from .facetcomplex import FacetComplex
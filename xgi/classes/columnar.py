@@ -0,0 +1,409 @@
+"""Node and edge attributes stored in one NumPy array per attribute name.
+
+By default, the attributes of each node and edge are stored in their own dict.  The
+ColumnarAttrs class is an alternative store, selected with
+`Hypergraph.set_attr_backend("columnar")`, in which the values of each attribute are
+stored in a typed NumPy array with one entry per node or edge, in the order of
+`H.nodes` or `H.edges`.  The attributes of a single node or edge are still read and
+written through a dict-like `AttrRow`, while weighted degrees, weighted incidence
+matrices, attribute filtering and the array forms of `set_node_attributes` and
+`get_node_attributes` work on whole arrays at once.
+"""
+from collections.abc import Mapping, MutableMapping
+from copy import deepcopy
+
+import numpy as np
+
+from xgi.exception import IDNotFound, XGIError
+
+__all__ = ["ColumnarAttrs", "AttrRow"]
+
+_OBJECT = np.dtype(object)
+_NUMERIC = {"b": np.dtype(bool), "i": np.dtype(np.int64), "f": np.dtype(np.float64)}
+
+
+def _dtype_of(value):
+    """The dtype of the column able to hold `value`."""
+    if isinstance(value, (bool, np.bool_)):
+        return _NUMERIC["b"]
+    if isinstance(value, (int, np.integer)):
+        return _NUMERIC["i"] if -(2**63) <= value < 2**63 else _OBJECT
+    if isinstance(value, (float, np.floating)):
+        return _NUMERIC["f"]
+    return _OBJECT
+
+
+def _common_dtype(dtype, other):
+    """The dtype of a column of dtype `dtype` after storing values of dtype `other`."""
+    if dtype == other or dtype == _OBJECT:
+        return dtype
+    if {dtype.kind, other.kind} == {"i", "f"}:
+        return _NUMERIC["f"]
+    return _OBJECT
+
+
+def _array_of(values):
+    """The list `values` as an array with the dtype of a column holding them."""
+    dtype = _dtype_of(values[0]) if values else _NUMERIC["f"]
+    for value in values:
+        dtype = _common_dtype(dtype, _dtype_of(value))
+        if dtype == _OBJECT:
+            break
+    array = np.empty(len(values), dtype=dtype)
+    if dtype == _OBJECT:
+        for i, value in enumerate(values):
+            array[i] = value
+    else:
+        array[:] = values
+    return array
+
+
+def _canonical(values):
+    """The values of a 1D array converted to the dtype of a column."""
+    values = np.asarray(values)
+    if values.ndim != 1:
+        raise XGIError("Attribute arrays must be one-dimensional")
+    if values.dtype.kind == "u":
+        dtype = _NUMERIC["i"] if values.dtype.itemsize < 8 else _OBJECT
+    else:
+        dtype = _NUMERIC.get(values.dtype.kind, _OBJECT)
+    if dtype == _OBJECT and values.dtype != _OBJECT:
+        return values.astype(object)  # e.g. strings become Python str
+    return values.astype(dtype, copy=True)
+
+
+class ColumnarAttrs(MutableMapping):
+    """Mapping from node or edge IDs to their attributes, stored by attribute name.
+
+    Each attribute name maps to a NumPy array with one entry per ID, and a boolean mask
+    of the IDs which have a value for it.  Columns are `bool`, `int64` or `float64`
+    when all the values stored allow it, and `object` otherwise.  The rows of the
+    arrays are in the order in which the IDs were added.  Removing an ID leaves a hole,
+    and holes are removed, keeping the order, when a whole column is requested or when
+    they outnumber the IDs.
+
+    Indexing with an ID returns an :class:`AttrRow`, a dict-like view of its
+    attributes.  Assigning a mapping to an ID replaces all its attributes.
+
+    Parameters
+    ----------
+    rows : iterable of (ID, mapping) pairs, optional
+        The initial IDs and their attributes.
+
+    """
+
+    def __init__(self, rows=()):
+        self._pos = {}  # id -> row
+        self._ids = []  # row -> id, None for removed ids
+        self._holes = 0
+        self._capacity = 0
+        self._columns = {}  # name -> array of values
+        self._masks = {}  # name -> boolean array, True where a value is set
+        for id, attrs in rows:
+            self[id] = attrs
+
+    def __getitem__(self, id):
+        if id not in self._pos:
+            raise IDNotFound(f"ID {id} not found")
+        return AttrRow(self, id)
+
+    def __setitem__(self, id, attrs):
+        if id is None:
+            raise XGIError("None cannot be a node or edge")
+        row = self._pos.get(id)
+        if row is None:
+            row = len(self._ids)
+            if row == self._capacity:
+                self._grow(row + 1)
+            self._pos[id] = row
+            self._ids.append(id)
+        else:
+            attrs = dict(attrs)  # `attrs` may be a view of this row
+            self._unset_row(row)
+        for name, value in attrs.items():
+            self._set(row, name, value)
+
+    def __delitem__(self, id):
+        try:
+            row = self._pos.pop(id)
+        except KeyError as e:
+            raise IDNotFound(f"ID {id} not found") from e
+        self._unset_row(row)
+        self._ids[row] = None
+        self._holes += 1
+        if self._holes > len(self._pos):
+            self.compact()
+
+    def __iter__(self):
+        if not self._holes:
+            return iter(self._ids)
+        return (id for id in self._ids if id is not None)
+
+    def __len__(self):
+        return len(self._pos)
+
+    def __contains__(self, id):
+        return id in self._pos
+
+    def __repr__(self):
+        return f"{type(self).__name__}({dict((id, dict(r)) for id, r in self.items())})"
+
+    def clear(self):
+        """Remove all IDs and attributes."""
+        self._pos = {}
+        self._ids = []
+        self._holes = 0
+        self._capacity = 0
+        self._columns = {}
+        self._masks = {}
+
+    def copy(self, deep=False):
+        """A copy of the store.
+
+        Parameters
+        ----------
+        deep : bool, default: False
+            Whether to deep copy the values of the `object` columns, which are
+            otherwise shared.
+
+        """
+        self.compact()
+        new = ColumnarAttrs()
+        new._ids = self._ids.copy()
+        new._pos = self._pos.copy()
+        new._capacity = n = len(self._ids)
+        for name, column in self._columns.items():
+            column = column[:n].copy()
+            if deep and column.dtype == _OBJECT:
+                for i, value in enumerate(column):
+                    column[i] = deepcopy(value)
+            new._columns[name] = column
+            new._masks[name] = self._masks[name][:n].copy()
+        return new
+
+    @classmethod
+    def _from_columns(cls, ids, columns):
+        """A store of the `ids` with the (column, mask) pairs of `columns` by name.
+
+        The arrays are used as they are, with one row per ID, in order.
+
+        """
+        new = cls()
+        new._ids = list(ids)
+        new._pos = {id: i for i, id in enumerate(new._ids)}
+        new._capacity = len(new._ids)
+        for name, (column, mask) in columns.items():
+            new._columns[name] = column
+            new._masks[name] = mask
+        return new
+
+    def compact(self):
+        """Remove the holes left by removed IDs, and the columns without values."""
+        if not self._holes:
+            return
+        n = len(self._ids)
+        for name in [name for name, mask in self._masks.items() if not mask.any()]:
+            del self._columns[name]
+            del self._masks[name]
+        keep = np.fromiter((id is not None for id in self._ids), dtype=bool, count=n)
+        for name, column in self._columns.items():
+            self._columns[name] = column[:n][keep]
+            self._masks[name] = self._masks[name][:n][keep]
+        self._ids = [id for id in self._ids if id is not None]
+        self._pos = {id: i for i, id in enumerate(self._ids)}
+        self._capacity = len(self._ids)
+        self._holes = 0
+
+    def positions(self):
+        """The dict mapping each ID to its row in the arrays returned by `column`.
+
+        The dict is owned by the store and must not be modified.
+
+        """
+        self.compact()
+        return self._pos
+
+    def names(self):
+        """The names of the attributes stored."""
+        return list(self._columns)
+
+    def column(self, name, default=np.nan):
+        """The values of an attribute for all IDs, in order, as a new array.
+
+        Parameters
+        ----------
+        name : hashable
+            The name of the attribute.
+        default : optional
+            The value for the IDs without this attribute, by default NaN.
+
+        Returns
+        -------
+        numpy.ndarray
+            The values, with dtype `object` unless all values, including `default`
+            when used, are booleans, integers or floats.
+
+        """
+        self.compact()
+        n = len(self._ids)
+        column = self._columns.get(name)
+        if column is None:
+            values = np.empty(n, dtype=_dtype_of(default))
+            values[:] = [default] * n if values.dtype == _OBJECT else default
+            return values
+        values = column[:n].copy()
+        missing = ~self._masks[name][:n]
+        if missing.any():
+            values = values.astype(_common_dtype(values.dtype, _dtype_of(default)))
+            for i in np.flatnonzero(missing).tolist():
+                values[i] = default
+        return values
+
+    def mask(self, name):
+        """Boolean array of the IDs, in order, which have a value for `name`."""
+        self.compact()
+        n = len(self._ids)
+        mask = self._masks.get(name)
+        return np.zeros(n, dtype=bool) if mask is None else mask[:n].copy()
+
+    def set_column(self, name, values):
+        """Set the values of an attribute for all IDs at once.
+
+        Parameters
+        ----------
+        name : hashable
+            The name of the attribute.
+        values : array-like
+            One value per ID, in order.
+
+        Raises
+        ------
+        XGIError
+            If there is not one value per ID.
+
+        """
+        values = _canonical(values)
+        self.compact()
+        if len(values) != len(self._ids):
+            raise XGIError(
+                f"Expected {len(self._ids)} values for attribute {name}, "
+                f"got {len(values)}"
+            )
+        self._columns[name] = values
+        self._masks[name] = np.ones(len(values), dtype=bool)
+        self._capacity = len(values)
+        self._resize(self._capacity)
+
+    def _grow(self, size):
+        self._resize(max(size, 2 * self._capacity, 8))
+
+    def _resize(self, capacity):
+        """Make all the arrays of length `capacity`, keeping the rows in use."""
+        n = len(self._ids)
+        for name, column in self._columns.items():
+            if len(column) != capacity:
+                new = np.zeros(capacity, dtype=column.dtype)
+                new[:n] = column[:n]
+                self._columns[name] = new
+                mask = np.zeros(capacity, dtype=bool)
+                mask[:n] = self._masks[name][:n]
+                self._masks[name] = mask
+        self._capacity = capacity
+
+    def _set(self, row, name, value):
+        column = self._columns.get(name)
+        dtype = _dtype_of(value)
+        if column is None:
+            column = np.zeros(self._capacity, dtype=dtype)
+            self._masks[name] = np.zeros(self._capacity, dtype=bool)
+        elif _common_dtype(column.dtype, dtype) != column.dtype:
+            column = column.astype(_common_dtype(column.dtype, dtype))
+        column[row] = value
+        self._columns[name] = column
+        self._masks[name][row] = True
+
+    def _unset(self, row, name):
+        mask = self._masks.get(name)
+        if mask is None or not mask[row]:
+            raise KeyError(name)
+        mask[row] = False
+        column = self._columns[name]
+        if column.dtype == _OBJECT:
+            column[row] = None  # do not keep a reference to the value
+
+    def _unset_row(self, row):
+        for name, mask in self._masks.items():
+            if mask[row]:
+                self._unset(row, name)
+
+    def _get(self, row, name):
+        mask = self._masks.get(name)
+        if mask is None or not mask[row]:
+            raise KeyError(name)
+        value = self._columns[name][row]
+        return value if self._columns[name].dtype == _OBJECT else value.item()
+
+
+class AttrRow(MutableMapping):
+    """Dict-like view of the attributes of one ID in a :class:`ColumnarAttrs`.
+
+    Reading and writing the view reads and writes the arrays of the store.  Copies,
+    made with `copy`, `copy.copy` or `copy.deepcopy`, are plain dicts.
+
+    Parameters
+    ----------
+    store : ColumnarAttrs
+        The store.
+    id : hashable
+        The ID.
+
+    """
+
+    __slots__ = ("_store", "_id")
+
+    def __init__(self, store, id):
+        self._store = store
+        self._id = id
+
+    def _row(self):
+        try:
+            return self._store._pos[self._id]
+        except KeyError as e:
+            raise IDNotFound(f"ID {self._id} not found") from e
+
+    def __getitem__(self, name):
+        return self._store._get(self._row(), name)
+
+    def __setitem__(self, name, value):
+        self._store._set(self._row(), name, value)
+
+    def __delitem__(self, name):
+        self._store._unset(self._row(), name)
+
+    def __iter__(self):
+        row = self._row()
+        return iter([name for name, mask in self._store._masks.items() if mask[row]])
+
+    def __len__(self):
+        row = self._row()
+        return sum(bool(mask[row]) for mask in self._store._masks.values())
+
+    def __eq__(self, other):
+        if isinstance(other, Mapping):
+            return dict(self) == dict(other)
+        return NotImplemented
+
+    __hash__ = None
+
+    def __repr__(self):
+        return repr(dict(self))
+
+    def copy(self):
+        """The attributes as a new dict."""
+        return dict(self)
+
+    def __copy__(self):
+        return dict(self)
+
+    def __deepcopy__(self, memo):
+        return deepcopy(dict(self), memo)
@@ -0,0 +1,494 @@
+"""Read-only hypergraphs stored in compressed sparse row (CSR) arrays.
+
+Most hypergraphs are never modified after they have been loaded.  The
+CompactHypergraph class stores the node-to-edge and edge-to-node incidences of such
+hypergraphs as two pairs of `indptr`/`indices` NumPy arrays instead of one Python list
+per node and per edge.  The usual views, degrees and matrices are served directly from
+these arrays.
+"""
+import copyreg
+from collections.abc import Mapping
+from copy import deepcopy
+from operator import index as as_index
+from types import MappingProxyType
+
+import numpy as np
+
+from xgi.classes.function import _frozen_class
+from xgi.classes.hypergraph import AttrStore, Hypergraph, SizeIndex, _index_dtype
+from xgi.classes.reportviews import EdgeView, NodeView
+from xgi.exception import IDNotFound
+from xgi.utils import XGICounter
+from xgi.utils.utilities import ResultCache
+
+__all__ = ["CompactHypergraph"]
+
+
+def _object_array(ids):
+    """A 1D object array of IDs (avoids NumPy unpacking tuple IDs)."""
+    arr = np.empty(len(ids), dtype=object)
+    for i, id in enumerate(ids):
+        arr[i] = id
+    return arr
+
+
+def _positions(ids):
+    """Map each ID to its position, without a dict when the IDs are 0, ..., n-1."""
+    if all(type(id) is int and id == i for i, id in enumerate(ids)):
+        return _RangePositions(len(ids))
+    return {id: i for i, id in enumerate(ids)}
+
+
+class _RangePositions(Mapping):
+    """Identity map from the integers 0, ..., n-1 to their positions."""
+
+    __slots__ = ("_n",)
+
+    def __init__(self, n):
+        self._n = n
+
+    def __getitem__(self, id):
+        try:
+            i = as_index(id)
+        except TypeError:
+            raise KeyError(id)
+        if isinstance(id, bool) or not 0 <= i < self._n:
+            raise KeyError(id)
+        return i
+
+    def __iter__(self):
+        return iter(range(self._n))
+
+    def __len__(self):
+        return self._n
+
+
+class CompactIDDict(Mapping):
+    """A read-only IDDict of bipartite neighbors backed by CSR arrays.
+
+    Maps each ID to the list of IDs of its neighbors in the bipartite representation
+    (the edges of a node, or the members of an edge).  Lists are only created when an
+    item is requested.
+
+    Parameters
+    ----------
+    ids : numpy.ndarray
+        The IDs, in order of position.
+    positions : mapping
+        Map from each ID to its position.
+    indptr : numpy.ndarray
+        The neighbors of the ID at position `i` are at positions
+        `indices[indptr[i]:indptr[i + 1]]`.
+    indices : numpy.ndarray
+        Positions of the neighbors.
+    neighbor_ids : numpy.ndarray
+        The IDs of the neighbors, in order of position.
+
+    """
+
+    __slots__ = ("_ids", "_pos", "_indptr", "_indices", "_neighbor_ids")
+
+    def __init__(self, ids, positions, indptr, indices, neighbor_ids):
+        self._ids = ids
+        self._pos = positions
+        self._indptr = indptr
+        self._indices = indices
+        self._neighbor_ids = neighbor_ids
+
+    def __getitem__(self, id):
+        try:
+            i = self._pos[id]
+        except KeyError as e:
+            raise IDNotFound(f"ID {id} not found") from e
+        return self._neighbor_ids[self.positions(i)].tolist()
+
+    def __iter__(self):
+        return iter(self._pos)
+
+    def __len__(self):
+        return len(self._pos)
+
+    def __contains__(self, id):
+        return id in self._pos
+
+    def copy(self):
+        """A dict of lists with the same items."""
+        return {id: self[id] for id in self}
+
+    def positions(self, i):
+        """Positions of the neighbors of the ID at position `i`."""
+        return self._indices[self._indptr[i] : self._indptr[i + 1]]
+
+    def sizes(self):
+        """Number of neighbors of each ID, in order of position."""
+        return np.diff(self._indptr)
+
+
+# the attributes of the IDs without any, shared and read-only
+_NO_ATTRS = MappingProxyType({})
+
+
+class _CompactAttrDict(Mapping):
+    """Attributes of the IDs of a CompactIDDict.
+
+    Only the attribute dicts that are not empty are stored, in an
+    :class:`~xgi.classes.hypergraph.AttrStore`, so that reading the attributes of an
+    ID without any does not store a dict for it.
+
+    """
+
+    __slots__ = ("_id_dict", "_attrs")
+
+    def __init__(self, id_dict, attrs):
+        self._id_dict = id_dict
+        self._attrs = AttrStore(id_dict, attrs)
+
+    def __getitem__(self, id):
+        return self._attrs[id]
+
+    def __iter__(self):
+        return iter(self._id_dict)
+
+    def __len__(self):
+        return len(self._id_dict)
+
+    def items(self):
+        """Iterate over (ID, attributes) pairs without storing empty dicts."""
+        attrs = self._attrs
+        return ((id, dict.get(attrs, id, _NO_ATTRS)) for id in self._id_dict)
+
+
+class _CompactEdgeLookup:
+    """Find edges by their set of members in a CompactHypergraph.
+
+    Offers the part of the interface of `Hypergraph._edge_lookup` used to find edges,
+    by intersecting the memberships of the given nodes instead of storing one frozenset
+    per edge.
+
+    """
+
+    __slots__ = ("_net",)
+
+    def __init__(self, net):
+        self._net = net
+
+    def get(self, members, default=None):
+        H = self._net
+        try:
+            nodes = {H._node._pos[n] for n in members}
+        except KeyError:
+            return default
+        if not nodes:
+            return default
+        # candidates are the edges of the member with the fewest memberships
+        sizes = H._node.sizes()
+        rarest = min(nodes, key=lambda i: sizes[i])
+        ids = [
+            H._edge._ids[e]
+            for e in np.unique(H._node.positions(rarest))
+            if set(H._edge.positions(e).tolist()) == nodes
+        ]
+        return ids if ids else default
+
+    def __contains__(self, members):
+        return self.get(members) is not None
+
+
+@_frozen_class
+class CompactHypergraph(Hypergraph):
+    r"""A read-only hypergraph stored in compressed sparse row (CSR) arrays.
+
+    The incidences between nodes and edges are stored twice, once grouped by node and
+    once grouped by edge, each time as a pair of integer `indptr`/`indices` NumPy
+    arrays.  Node and edge IDs are stored in one array each, in order of position.
+    Node and edge attribute dicts are only stored when they are not empty.
+
+    Nodes, edges, memberships, degrees and matrices are accessed in the same way as in
+    a :class:`~xgi.classes.hypergraph.Hypergraph`, but no method that modifies the
+    structure can be used.
+
+    Parameters
+    ----------
+    incoming_data : input hypergraph data (optional, default: None)
+        Data to initialize the hypergraph, in any of the formats accepted by
+        :class:`~xgi.classes.hypergraph.Hypergraph`.
+    **attr : dict, optional, default: None
+        Attributes to add to the hypergraph as key, value pairs.
+
+    See Also
+    --------
+    ~xgi.classes.function.freeze
+
+    Notes
+    -----
+    The arrays are stored in the attributes `_node_indptr`, `_node_indices`,
+    `_edge_indptr` and `_edge_indices`, and the IDs in `_node_ids` and `_edge_ids`.
+    The indices are int32 unless there are too many incidences, in which case they are
+    int64.
+
+    Examples
+    --------
+    >>> import xgi
+    >>> H = xgi.CompactHypergraph([[1, 2, 3], [4], [5, 6], [6, 7, 8]])
+    >>> H.nodes
+    NodeView((1, 2, 3, 4, 5, 6, 7, 8))
+    >>> H.edges.members(3)
+    [6, 7, 8]
+    >>> H.degree(6)
+    2
+    >>> H.add_node(9)
+    Traceback (most recent call last):
+    xgi.exception.XGIError: Frozen hypergraph can't be modified
+
+    """
+
+    def __init__(self, incoming_data=None, **attr):
+        if isinstance(incoming_data, CompactHypergraph):
+            self._from_arrays(
+                incoming_data._node_ids,
+                incoming_data._edge_ids,
+                incoming_data._node_indptr,
+                incoming_data._node_indices,
+                incoming_data._edge_indptr,
+                incoming_data._edge_indices,
+                incoming_data._node._pos,
+                incoming_data._edge._pos,
+            )
+            self._set_attrs(
+                incoming_data._node_attr._attrs,
+                incoming_data._edge_attr._attrs,
+                incoming_data._hypergraph,
+            )
+        else:
+            if not isinstance(incoming_data, Hypergraph):
+                incoming_data = Hypergraph(incoming_data)
+            self._from_hypergraph(incoming_data)
+        self._hypergraph.update(attr)
+
+    def _from_hypergraph(self, H):
+        node_ids = list(H._node)
+        edge_ids = list(H._edge)
+        node_pos = _positions(node_ids)
+        edge_pos = _positions(edge_ids)
+
+        num_incidences = sum(len(members) for members in H._edge.values())
+        dtype = _index_dtype(max(num_incidences, len(node_ids), len(edge_ids)))
+
+        node_indptr = np.zeros(len(node_ids) + 1, dtype=dtype)
+        node_indptr[1:] = np.cumsum([len(H._node[n]) for n in node_ids])
+        node_indices = np.fromiter(
+            (edge_pos[e] for n in node_ids for e in H._node[n]),
+            dtype=dtype,
+            count=int(node_indptr[-1]),
+        )
+        edge_indptr = np.zeros(len(edge_ids) + 1, dtype=dtype)
+        edge_indptr[1:] = np.cumsum([len(H._edge[e]) for e in edge_ids])
+        edge_indices = np.fromiter(
+            (node_pos[n] for e in edge_ids for n in H._edge[e]),
+            dtype=dtype,
+            count=num_incidences,
+        )
+
+        self._from_arrays(
+            _object_array(node_ids),
+            _object_array(edge_ids),
+            node_indptr,
+            node_indices,
+            edge_indptr,
+            edge_indices,
+            node_pos,
+            edge_pos,
+        )
+        self._set_attrs(H._node_attr, H._edge_attr, H._hypergraph)
+
+    def _from_arrays(
+        self,
+        node_ids,
+        edge_ids,
+        node_indptr,
+        node_indices,
+        edge_indptr,
+        edge_indices,
+        node_pos=None,
+        edge_pos=None,
+    ):
+        arrays = (
+            node_ids,
+            edge_ids,
+            node_indptr,
+            node_indices,
+            edge_indptr,
+            edge_indices,
+        )
+        for arr in arrays:
+            arr.flags.writeable = False
+        self._node_ids = node_ids
+        self._edge_ids = edge_ids
+        self._node_indptr = node_indptr
+        self._node_indices = node_indices
+        self._edge_indptr = edge_indptr
+        self._edge_indices = edge_indices
+
+        if node_pos is None:
+            node_pos = _positions(node_ids.tolist())
+        if edge_pos is None:
+            edge_pos = _positions(edge_ids.tolist())
+
+        self._edge_uid = XGICounter()
+        self._node = CompactIDDict(
+            node_ids, node_pos, node_indptr, node_indices, edge_ids
+        )
+        self._edge = CompactIDDict(
+            edge_ids, edge_pos, edge_indptr, edge_indices, node_ids
+        )
+        self._edge_lookup = _CompactEdgeLookup(self)
+        self._edge_sizes = None  # built from the CSR arrays when first needed
+        self._version = 0
+        self._cache = ResultCache()
+        self._shared = None
+
+    def _set_attrs(self, node_attr, edge_attr, hypergraph_attr):
+        self._node_attr = _CompactAttrDict(
+            self._node, {n: deepcopy(a) for n, a in node_attr.items() if a}
+        )
+        self._edge_attr = _CompactAttrDict(
+            self._edge, {e: deepcopy(a) for e, a in edge_attr.items() if a}
+        )
+        self._hypergraph = deepcopy(hypergraph_attr)
+
+        self.nodes = NodeView(self)
+        """A :class:`~xgi.classes.reportviews.NodeView` of the hypergraph."""
+
+        self.edges = EdgeView(self)
+        """An :class:`~xgi.classes.reportviews.EdgeView` of the hypergraph."""
+
+    def neighbors(self, n):
+        """Find the neighbors of a node.
+
+        The neighbors of a node are those nodes that appear in at least one edge with
+        said node.
+
+        Parameters
+        ----------
+        n : node
+            Node to find neighbors of.
+
+        Returns
+        -------
+        set
+            A set of the neighboring nodes
+
+        """
+        try:
+            i = self._node._pos[n]
+        except KeyError as e:
+            raise IDNotFound(f"ID {n} not found") from e
+        edges = self._node.positions(i)
+        if not len(edges):
+            return set()
+        starts = self._edge_indptr[edges]
+        stops = self._edge_indptr[edges + 1]
+        nbrs = np.unique(
+            np.concatenate([self._edge_indices[a:b] for a, b in zip(starts, stops)])
+        )
+        return set(self._node_ids[nbrs[nbrs != i]].tolist())
+
+    def copy(self, copy_on_write=False):
+        """A copy of the hypergraph.
+
+        Since a compact hypergraph cannot be modified, the incidence arrays are always
+        shared with the copy and only the attributes are copied.  Use
+        `xgi.Hypergraph(H)` to get a copy that can be modified.
+
+        Parameters
+        ----------
+        copy_on_write : bool, default: False
+            Ignored, for compatibility with `Hypergraph.copy`.
+
+        Returns
+        -------
+        CompactHypergraph
+            A copy of the hypergraph.
+
+        """
+        return self.__class__(self)
+
+    def dual(self):
+        """The dual of the hypergraph.
+
+        In the dual, nodes become edges and edges become nodes.  The incidence arrays
+        are shared with this hypergraph, only the attributes are copied.
+
+        Returns
+        -------
+        CompactHypergraph
+            The dual of the hypergraph.
+
+        """
+        dual = self.__class__.__new__(self.__class__)
+        dual._from_arrays(
+            self._edge_ids,
+            self._node_ids,
+            self._edge_indptr,
+            self._edge_indices,
+            self._node_indptr,
+            self._node_indices,
+            self._edge._pos,
+            self._node._pos,
+        )
+        dual._set_attrs(
+            self._edge_attr._attrs, self._node_attr._attrs, self._hypergraph
+        )
+        return dual
+
+    def __reduce__(self):
+        # the arrays are already compact, so they are pickled as they are
+        state = {
+            k: v
+            for k, v in self.__dict__.items()
+            if k not in ("nodes", "edges", "_shared_memory")
+        }
+        return copyreg.__newobj__, (self.__class__,), state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self.nodes = NodeView(self)
+        self.edges = EdgeView(self)
+
+    def _structures(self):
+        return {
+            "node": (
+                self._node_ids,
+                self._node_indptr,
+                self._node_indices,
+                self._node._pos,
+            ),
+            "edge": (
+                self._edge_ids,
+                self._edge_indptr,
+                self._edge_indices,
+                self._edge._pos,
+            ),
+            "edge_lookup": (self._edge_lookup,),
+            "edge_sizes": (self._edge_sizes,),
+        }
+
+    def _edges_by_size(self):
+        if self._edge_sizes is None:
+            self._edge_sizes = SizeIndex(
+                zip(self._edge_ids.tolist(), self._edge.sizes().tolist())
+            )
+        return self._edge_sizes
+
+    def max_edge_order(self):
+        """The maximum order of edges in the hypergraph.
+
+        Returns
+        -------
+        int
+            Maximum order of edges in hypergraph.
+
+        """
+        if len(self._edge_ids):
+            return int(self._edge.sizes().max()) - 1
+        return 0 if len(self._node_ids) else None
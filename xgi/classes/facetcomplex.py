@@ -0,0 +1,618 @@
+"""Simplicial complexes that only store their facets.
+
+A simplicial complex stores every face of its facets: a facet with k nodes brings up
+to 2^k - 1 simplices, each with its own ID, members and memberships.  The
+FacetComplex class only stores the facets, the maximal simplices, and generates the
+other faces when they are needed.  The ID of a face is the frozenset of its nodes,
+so that faces need no storage until they get attributes.
+"""
+from collections.abc import Mapping
+from contextlib import contextmanager
+from copy import deepcopy
+from itertools import combinations
+
+from xgi import convert
+from xgi.classes.hypergraph import AttrStore, Hypergraph, _copy_attrs
+from xgi.classes.reportviews import EdgeView, NodeView
+from xgi.classes.simplicialcomplex import SimplicialComplex
+from xgi.exception import IDNotFound, XGIError
+from xgi.utils import XGICounter
+from xgi.utils.utilities import ResultCache
+
+__all__ = ["FacetComplex"]
+
+
+class _Faces(Mapping):
+    """The faces of a FacetComplex, mapping each face to its members, itself.
+
+    Faces are enumerated from the facets when iterating, and checked against the
+    facets when looked up.
+
+    """
+
+    __slots__ = ("_net",)
+
+    def __init__(self, net):
+        self._net = net
+
+    def __getitem__(self, face):
+        if face in self:
+            return face
+        raise IDNotFound(f"ID {face} not found")
+
+    def __contains__(self, face):
+        return self._net._is_face(face)
+
+    def __iter__(self):
+        return self._net._iter_faces()
+
+    def __len__(self):
+        return self._net._num_faces()
+
+    def __bool__(self):
+        return bool(self._net._facets._edge or self._net._vertices)
+
+
+class _FaceMemberships(Mapping):
+    """The nodes of a FacetComplex, mapping each node to the faces that contain it."""
+
+    __slots__ = ("_net",)
+
+    def __init__(self, net):
+        self._net = net
+
+    def __getitem__(self, node):
+        return self._net._faces_containing(node)
+
+    def __contains__(self, node):
+        return node in self._net._facets._node
+
+    def __iter__(self):
+        return iter(self._net._facets._node)
+
+    def __len__(self):
+        return len(self._net._facets._node)
+
+
+class _FaceLookup:
+    """Find the faces of a FacetComplex by their set of members.
+
+    Offers the part of the interface of `Hypergraph._edge_lookup` used to find edges.
+
+    """
+
+    __slots__ = ("_net",)
+
+    def __init__(self, net):
+        self._net = net
+
+    def get(self, members, default=None):
+        face = frozenset(members)
+        return [face] if self._net._is_face(face) else default
+
+    def __contains__(self, members):
+        return self._net._is_face(frozenset(members))
+
+
+class _FaceSizes:
+    """The faces of a FacetComplex grouped by size, enumerated when requested.
+
+    Offers the interface of :class:`~xgi.classes.hypergraph.SizeIndex` used to find
+    edges by size.
+
+    """
+
+    __slots__ = ("_net",)
+
+    def __init__(self, net):
+        self._net = net
+
+    def sizes(self):
+        """The distinct sizes of the faces, in increasing order."""
+        net = self._net
+        sizes = [1] if net._vertices else []
+        if net._facets._edge:
+            sizes.extend(range(2, net._facets.max_edge_order() + 2))
+        return sizes
+
+    def counts(self):
+        """Dict mapping each size to the number of faces of that size."""
+        counts = {}
+        for face in self._net._iter_faces():
+            counts[len(face)] = counts.get(len(face), 0) + 1
+        return counts
+
+    def ids(self, size, index=None):
+        """The faces with `size` nodes, in the order of the faces."""
+        return list(self._net._iter_faces(size))
+
+
+class _FaceIndex:
+    """The positions of the faces of a FacetComplex, enumerated when requested.
+
+    Offers the interface of :class:`~xgi.classes.hypergraph.IDIndex` used to build
+    matrices.
+
+    """
+
+    __slots__ = ("_net",)
+
+    def __init__(self, net):
+        self._net = net
+
+    def __len__(self):
+        return len(self._net._edge)
+
+    def ids(self):
+        """The faces, in order of position."""
+        return tuple(self._net._iter_faces())
+
+    def positions(self):
+        """Dict mapping each face to its position."""
+        return {face: i for i, face in enumerate(self._net._iter_faces())}
+
+
+class FacetComplex(SimplicialComplex):
+    r"""A simplicial complex that only stores its facets.
+
+    The facets, the simplices that are not faces of other simplices, are stored as
+    the edges of a :class:`~xgi.classes.hypergraph.Hypergraph`, along with the nodes
+    which were added as simplices of their own.  The other faces are generated from
+    the facets when they are needed, so that the memory used is proportional to the
+    size of the facets rather than to the number of faces, which grows exponentially
+    with the dimension of the facets.
+
+    The complex is used like a :class:`~xgi.classes.simplicialcomplex.SimplicialComplex`,
+    except that the ID of each simplex is the frozenset of its nodes.  `edges`,
+    `has_simplex`, `degree`, `star`, `link` and the matrix functions generate the
+    faces they need, and a face only takes memory when it gets attributes.
+
+    Parameters
+    ----------
+    incoming_data : input simplicial complex data (optional, default: None)
+        Data to initialize the complex, in any of the formats accepted by
+        :class:`~xgi.classes.simplicialcomplex.SimplicialComplex`, or a simplicial
+        complex, whose attributes are copied.
+    **attr : dict, optional, default: None
+        Attributes to add to the complex as key, value pairs.
+
+    See Also
+    --------
+    ~xgi.classes.simplicialcomplex.SimplicialComplex
+
+    Notes
+    -----
+    Removing a simplex removes the simplices that contain it, as in a simplicial
+    complex: each facet containing it is replaced by its faces with one node of the
+    simplex less.  `remove_simplex_ids_from` does so for every simplex it is given.
+
+    Looking up a face intersects it with the facets of one of its nodes, and
+    enumerating the faces, e.g. to count them or to build a matrix, takes time
+    proportional to the number of faces.  The number of faces is cached until the
+    complex changes.
+
+    Examples
+    --------
+    >>> import xgi
+    >>> S = xgi.FacetComplex([[1, 2, 3], [3, 4]])
+    >>> S.facets()
+    [frozenset({1, 2, 3}), frozenset({3, 4})]
+    >>> S.num_edges
+    5
+    >>> S.has_simplex([2, 3])
+    True
+    >>> S.edges[frozenset({2, 3})]["weight"] = 2.0
+    >>> S.degree(3, order=1)
+    3
+
+    """
+
+    def __init__(self, incoming_data=None, **attr):
+        self._edge_uid = XGICounter()
+        self._hypergraph = self._hypergraph_attr_dict_factory()
+        self._node = _FaceMemberships(self)
+        self._set_facets(Hypergraph())
+        self._vertices = {}  # the nodes that are simplices, as dict keys
+        self._edge = _Faces(self)
+        self._edge_attr = AttrStore(self._edge)
+        self._edge_lookup = _FaceLookup(self)
+        self._edge_sizes = _FaceSizes(self)
+        self._edge_index = _FaceIndex(self)
+        self._version = 0  # bumped by every change to the structure
+        self._cache = ResultCache()
+        self._shared = None
+        self._cofaces = None
+
+        self.edges = EdgeView(self)
+
+        if isinstance(incoming_data, SimplicialComplex):
+            self._from_simplicial_complex(incoming_data)
+        elif incoming_data is not None:
+            convert.convert_to_simplicial_complex(incoming_data, create_using=self)
+        self._hypergraph.update(attr)
+
+    def _set_facets(self, facets):
+        """Use the hypergraph `facets` to store the facets, its nodes and their
+        attributes."""
+        self._facets = facets
+        self._node_attr = facets._node_attr
+        self._node_index = facets._node_index
+        self.nodes = NodeView(self)
+
+    def _from_simplicial_complex(self, S):
+        self._facets.add_nodes_from(
+            (n, deepcopy(attrs)) for n, attrs in S.nodes.items()
+        )
+        self.add_simplices_from(list(S.edges.members(e)) for e in S.facets())
+        for e, attrs in S._edge_attr.items():
+            if attrs:
+                self._edge_attr[frozenset(S.edges.members(e))] = deepcopy(dict(attrs))
+        self._hypergraph.update(deepcopy(S._hypergraph))
+
+    def _is_face(self, face):
+        """Whether `face`, a frozenset of nodes, is a simplex of the complex."""
+        if not isinstance(face, frozenset) or not face:
+            return False
+        if len(face) == 1:
+            return next(iter(face)) in self._vertices
+        facets = self._facets
+        try:
+            # look in the facets of the node with the fewest of them
+            node = min(face, key=lambda n: len(facets._node[n]))
+        except IDNotFound:
+            return False
+        return any(face.issubset(facets._edge[f]) for f in facets._node[node])
+
+    def _iter_faces(self, size=None):
+        """Iterate over the faces with `size` nodes, or all the faces, each once.
+
+        The faces are given facet by facet, from the largest to the smallest, and
+        then the nodes which are simplices of their own.  A face is given with the
+        first facet that contains it: the faces of a facet which are in its
+        intersection with an earlier facet are skipped.
+
+        """
+        facets = self._facets
+        members = facets._edge
+        for id, facet in members.items():
+            if size is None:
+                sizes = range(len(facet), 1, -1)
+            elif 2 <= size <= len(facet):
+                sizes = (size,)
+            else:
+                continue
+            earlier = set()
+            for node in facet:
+                # the memberships of a node are in the order of the facets
+                for other in facets._node[node]:
+                    if other >= id:
+                        break
+                    earlier.add(other)
+            shared = []
+            for other in earlier:
+                common = frozenset(members[other]).intersection(facet)
+                if len(common) >= sizes[-1]:
+                    shared.append(common)
+            for k in sizes:
+                for face in map(frozenset, combinations(facet, k)):
+                    if not any(face <= common for common in shared):
+                        yield face
+        if size is None or size == 1:
+            for node in self._vertices:
+                yield frozenset([node])
+
+    def _num_faces(self):
+        return self._cache.lookup(
+            (__name__, "num_faces"),
+            self._version,
+            lambda: sum(1 for _ in self._iter_faces()),
+        )
+
+    def _faces_containing(self, node):
+        """The faces that contain a node, facet by facet."""
+        facets = self._facets
+        faces = {}
+        if node in self._vertices:
+            faces[frozenset([node])] = None
+        for id in facets._node[node]:
+            others = [n for n in facets._edge[id] if n != node]
+            for k in range(len(others), 0, -1):
+                for face in combinations(others, k):
+                    faces[frozenset((node, *face))] = None
+        return list(faces)
+
+    def _supfaces_id(self, simplex):
+        """Returns list of IDs of simplices that contain simplex
+
+        They are generated from the facets that contain the simplex.
+
+        """
+        simplex = frozenset(simplex)
+        facets = self._facets
+        faces = {}
+        for id in facets.edges.containing(simplex):
+            others = [n for n in facets._edge[id] if n not in simplex]
+            for k in range(len(others), 0, -1):
+                for face in combinations(others, k):
+                    faces[simplex.union(face)] = None
+        return list(faces)
+
+    def _add_simplex(self, simplex, attr):
+        """Add a simplex with attributes `attr`, unless it is already in the complex.
+
+        If it is not a face of a facet, it becomes a facet and the facets that it
+        contains are removed.
+
+        """
+        try:
+            key = frozenset(simplex)
+        except TypeError:
+            raise XGIError("The simplex cannot be cast to a frozenset.")
+        if self._is_face(key):
+            return
+        if None in key:
+            raise ValueError("None cannot be a node")
+        if len(key) == 1:
+            (node,) = key
+            if node not in self._facets._node:
+                self._facets.add_node(node)
+            self._vertices[node] = None
+        else:
+            self._add_facet(list(dict.fromkeys(simplex)))
+        if attr:
+            self._edge_attr[key] = self._hyperedge_attr_dict_factory(attr)
+
+    def _add_facet(self, members):
+        """Add a set of at least two nodes as a facet, unless it is a face."""
+        facets = self._facets
+        key = frozenset(members)
+        if self._is_face(key):
+            return
+        facets.remove_edges_from(facets.edges.within(key))
+        facets.add_edge(members)
+
+    def _remove_star(self, simplex):
+        """Remove a simplex and the simplices that contain it."""
+        facets = self._facets
+        if len(simplex) == 1:
+            self._vertices.pop(next(iter(simplex)), None)
+        removed = facets.edges.containing(simplex)
+        # the faces of the removed facets which do not contain the simplex
+        faces = [
+            [n for n in facets._edge[id] if n != node]
+            for id in removed
+            for node in simplex
+        ]
+        facets.remove_edges_from(removed)
+        for face in faces:
+            if len(face) > 1:
+                self._add_facet(face)
+        store = self._edge_attr
+        for face in [face for face in store if simplex <= face]:
+            del store[face]
+
+    def add_node(self, node, **attr):
+        """Add one node with optional attributes.
+
+        Parameters
+        ----------
+        node : node
+            A node can be any hashable Python object except None.
+        attr : keyword arguments, optional
+            Set or change node attributes using key=value.
+
+        """
+        self._bump_version()
+        self._facets.add_node(node, **attr)
+
+    def add_nodes_from(self, nodes_for_adding, **attr):
+        """Add multiple nodes with optional attributes.
+
+        Parameters
+        ----------
+        nodes_for_adding : iterable
+            An iterable of nodes, or of (node, attribute dict) tuples.
+        attr : keyword arguments, optional (default= no attributes)
+            Update attributes for all nodes in nodes.  Node attributes specified in
+            nodes as a tuple take precedence over attributes specified via keyword
+            arguments.
+
+        """
+        self._bump_version()
+        self._facets.add_nodes_from(nodes_for_adding, **attr)
+
+    def remove_node(self, n):
+        """Remove a single node and all the simplices that contain it.
+
+        Parameters
+        ----------
+        n : node
+            A node in the complex.
+
+        Raises
+        ------
+        IDNotFound
+            If `n` is not in the complex.
+
+        """
+        self._bump_version()
+        self._remove_star(frozenset([n]))
+        self._facets.remove_node(n)
+
+    def remove_simplex_id(self, id):
+        """Remove a simplex and all the simplices that contain it.
+
+        Parameters
+        ----------
+        id : frozenset
+            The simplex to remove.
+
+        Raises
+        ------
+        XGIError
+            If there is no such simplex.
+
+        """
+        if id not in self._edge:
+            raise XGIError(f"Simplex {id} is not in the Simplicialcomplex")
+        self._bump_version()
+        self._remove_star(id)
+
+    def remove_simplex_ids_from(self, ebunch):
+        """Remove the given simplices and all the simplices that contain them.
+
+        Parameters
+        ----------
+        ebunch: iterable of frozensets
+            The simplices to remove.  The ones which are not in the complex, e.g.
+            because they were removed with a previous one, are skipped.
+
+        """
+        self._bump_version()
+        for id in ebunch:
+            if id in self._edge:
+                self._remove_star(id)
+
+    def close(self):
+        """Does nothing, since the faces of the facets are always in the complex."""
+
+    def facets(self):
+        """The maximal simplices of the complex.
+
+        Returns
+        -------
+        list of frozenset
+            The facets, followed by the nodes which are simplices of their own and
+            are in no other simplex.
+
+        """
+        facets = self._facets
+        return [frozenset(m) for m in facets._edge.values()] + [
+            frozenset([n]) for n in self._vertices if not facets._node[n]
+        ]
+
+    def neighbors(self, n):
+        """Find the neighbors of a node, the nodes that share a simplex with it.
+
+        Parameters
+        ----------
+        n : node
+            Node to find neighbors of.
+
+        Returns
+        -------
+        set
+            A set of the neighboring nodes
+
+        """
+        return self._facets.neighbors(n)
+
+    def max_edge_order(self):
+        """The maximum order of the simplices of the complex.
+
+        Returns
+        -------
+        int
+            The order of the largest facet, or None if the complex is empty.
+
+        """
+        if self._facets._edge:
+            return self._facets.max_edge_order()
+        return 0 if self._facets._node else None
+
+    def clear(self, hypergraph_attr=True):
+        """Remove all nodes and simplices from the complex.
+
+        Parameters
+        ----------
+        hypergraph_attr : bool, default True
+            Whether to remove the attributes of the complex as well
+
+        """
+        self._bump_version()
+        self._facets.clear()
+        self._vertices.clear()
+        self._edge_attr.clear()
+        if hypergraph_attr:
+            self._hypergraph.clear()
+
+    def clear_edges(self):
+        """Remove all simplices from the complex without altering any nodes."""
+        self._bump_version()
+        self._facets.clear_edges()
+        self._vertices.clear()
+        self._edge_attr.clear()
+
+    @contextmanager
+    def batch(self):
+        """Context manager to make many changes to the structure at once.
+
+        See :meth:`~xgi.classes.hypergraph.Hypergraph.batch`; the indices are those
+        of the hypergraph of the facets.
+
+        """
+        with self._facets.batch():
+            yield self
+
+    def add_node_to_edge(self, edge, node):
+        """Cannot `add_node_to_edge` to FacetComplex, which only stores its facets,
+        use `add_simplex` instead"""
+        raise XGIError(
+            "Cannot add_node_to_edge to FacetComplex, which only stores its facets, "
+            "use add_simplex instead"
+        )
+
+    def remove_node_from_edge(self, edge, node):
+        """Cannot `remove_node_from_edge` from FacetComplex, which only stores its
+        facets, use `remove_simplex_id` instead"""
+        raise XGIError(
+            "Cannot remove_node_from_edge from FacetComplex, which only stores its "
+            "facets, use remove_simplex_id instead"
+        )
+
+    def set_attr_backend(self, backend):
+        """Only the "dict" attribute backend is supported."""
+        if backend != "dict":
+            raise XGIError("FacetComplex only supports the dict attribute backend")
+
+    def copy(self, copy_on_write=False):
+        """A copy of the complex.
+
+        Parameters
+        ----------
+        copy_on_write : bool, default: False
+            Whether the hypergraph of the facets shares its containers with the copy
+            until either is modified, see
+            :meth:`~xgi.classes.hypergraph.Hypergraph.copy`.
+
+        Returns
+        -------
+        FacetComplex
+            A copy of the complex, whose attribute dicts are copied.
+
+        """
+        new = self.__class__()
+        new._set_facets(self._facets.copy(copy_on_write))
+        new._vertices.update(self._vertices)
+        new._edge_attr.update(_copy_attrs(self._edge_attr))
+        new._hypergraph = self._hypergraph.copy()
+        return new
+
+    def _pickle_state(self):
+        return {
+            "facets": self._facets,
+            "vertices": list(self._vertices),
+            "edge_attr": dict(self._edge_attr),
+            "hypergraph": self._hypergraph,
+        }
+
+    def _set_pickle_state(self, state):
+        self._set_facets(state["facets"])
+        self._vertices.update(dict.fromkeys(state["vertices"]))
+        self._edge_attr.update(state["edge_attr"])
+        self._hypergraph.update(state["hypergraph"])
+
+    def _structures(self):
+        structures = self._facets._structures()
+        structures["edge"] += (self._vertices,)
+        return structures
@@ -3,7 +3,10 @@
 
 from collections import Counter
 
+import numpy as np
+
 import xgi
+from xgi.classes.columnar import ColumnarAttrs, _array_of
 from xgi.exception import XGIError
 
 __all__ = [
@@ -98,10 +101,36 @@ def unique_edge_sizes(H):
 
     Returns
     -------
-    list()
-        The unique edge sizes
+    list of int
+        The unique edge sizes, in increasing order.
+
     """
-    return list({len(H.edges.members(edge)) for edge in H.edges})
+    return sorted(H._edges_by_size().sizes())
+
+
+# the methods which modify a hypergraph, replaced by `frozen` in frozen hypergraphs
+_FROZEN_METHODS = (
+    "add_node",
+    "add_nodes_from",
+    "remove_node",
+    "remove_nodes_from",
+    "add_edge",
+    "add_edges_from",
+    "add_edges_from_arrays",
+    "add_weighted_edges_from",
+    "remove_edge",
+    "remove_edges_from",
+    "add_node_to_edge",
+    "remove_node_from_edge",
+    "remove_isolates",
+    "remove_singleton_edges",
+    "remove_duplicate_edges",
+    "update",
+    "batch",
+    "clear",
+    "clear_edges",
+    "set_attr_backend",
+)
 
 
 def frozen(*args, **kwargs):
@@ -126,24 +155,29 @@ def frozen(*args, **kwargs):
     raise XGIError("Frozen hypergraph can't be modified")
 
 
-def freeze(H):
+def freeze(H, compact=False):
     """Method for freezing a hypergraph which prevents it from being modified
 
     Parameters
     ----------
     H : Hypergraph object
         The hypergraph to freeze
+    compact : bool, default: False
+        If False, `H` itself is frozen.  If True, `H` is left untouched and a frozen
+        copy of it is returned, in which the incidences are stored in compressed
+        sparse row arrays rather than in Python lists.
 
     Returns
     -------
     Hypergraph object
         The hypergraph with all the functions that can modify the hypergraph
-        set to the frozen method
+        set to the frozen method, or a CompactHypergraph if `compact` is True.
 
     See Also
     --------
     frozen : Method that raises an error when a user tries to modify the hypergraph
     is_frozen : Check whether a hypergraph is frozen
+    ~xgi.classes.compacthypergraph.CompactHypergraph
 
     Examples
     --------
@@ -155,23 +189,27 @@ def freeze(H):
     >>> H.add_node(5)
     Traceback (most recent call last):
     xgi.exception.XGIError: Frozen hypergraph can't be modified
+    >>> C = xgi.freeze(xgi.Hypergraph(hyperedge_list), compact=True)
+    >>> C.edges.members(1)
+    [2, 3, 4]
     """
-    H.add_node = frozen
-    H.add_nodes_from = frozen
-    H.remove_node = frozen
-    H.remove_nodes_from = frozen
-    H.add_edge = frozen
-    H.add_edges_from = frozen
-    H.add_weighted_edges_from = frozen
-    H.remove_edge = frozen
-    H.remove_edges_from = frozen
-    H.add_node_to_edge = frozen
-    H.remove_node_from_edge = frozen
-    H.clear = frozen
+    if compact:
+        return xgi.CompactHypergraph(H)
+
+    for name in _FROZEN_METHODS:
+        setattr(H, name, frozen)
     H.frozen = True
     return H
 
 
+def _frozen_class(cls):
+    """Class decorator making the hypergraphs of a class frozen, see `freeze`."""
+    for name in _FROZEN_METHODS:
+        setattr(cls, name, frozen)
+    cls.frozen = True
+    return cls
+
+
 def is_frozen(H):
     """Checks whether a hypergraph is frozen
 
@@ -252,7 +290,7 @@ def set_node_attributes(H, values, name=None):
     ----------
     H : Hypergraph object
         The hypergraph to set node attributes
-    values : scalar value, dict-like
+    values : scalar value, dict-like, or numpy.ndarray
         What the node attribute should be set to.  If `values` is
         not a dictionary, then it is treated as a single attribute value
         that is then applied to every node in `H`.  This means that if
@@ -263,6 +301,10 @@ def set_node_attributes(H, values, name=None):
         If `values` is a dict or a dict of dict, it should be keyed
         by node to either an attribute value or a dict of attribute key/value
         pairs used to update the node's attributes.
+
+        If `values` is a 1D NumPy array, it holds the value of attribute `name`
+        of each node, in the order of `H.nodes`.  With the "columnar" attribute
+        backend, the array is stored at once.
     name : string, optional
         Name of the node attribute to set if values is a scalar, by default None
 
@@ -289,7 +331,9 @@ def set_node_attributes(H, values, name=None):
     values are silently ignored.
     """
     # Set node attributes based on type of `values`
-    if name is not None:  # `values` must not be a dict of dict
+    if isinstance(values, np.ndarray):
+        _set_attr_array(H._node_attr, H.nodes, values, name)
+    elif name is not None:  # `values` must not be a dict of dict
         try:  # `values` is a dict
             for n, v in values.items():
                 try:
@@ -310,7 +354,7 @@ def set_node_attributes(H, values, name=None):
             raise XGIError("Must pass a dictionary of dictionaries")
 
 
-def get_node_attributes(H, name=None):
+def get_node_attributes(H, name=None, as_array=False, default=np.nan):
     """Get the node attributes for a hypergraph
 
     Parameters
@@ -319,11 +363,26 @@ def get_node_attributes(H, name=None):
         The hypergraph to get node attributes from
     name : string, optional
        Attribute name. If None, then return the entire attribute dictionary.
+    as_array : bool, default: False
+        If True, return the values of attribute `name` as a NumPy array, in the
+        order of `H.nodes`.  With the "columnar" attribute backend, this is a copy
+        of the stored array.
+    default : optional
+        If `as_array` is True, the value for nodes without attribute `name`, by
+        default NaN.
 
     Returns
     -------
     dict of dict
         Dictionary of attributes keyed by node.
+    numpy.ndarray
+        If `as_array` is True, the attribute values.  The dtype is bool, int64 or
+        float64 if all values allow it, and object otherwise.
+
+    Raises
+    ------
+    XGIError
+        If `as_array` is True and `name` is None.
 
     See Also
     --------
@@ -331,8 +390,10 @@ def get_node_attributes(H, name=None):
     set_edge_attributes
     get_edge_attributes
     """
+    if as_array:
+        return _get_attr_array(H._node_attr, H.nodes, name, default)
     if name is None:
-        return dict(H._node_attr)
+        return {n: dict(H._node_attr[n]) for n in H.nodes}
     else:
         return {n: d[name] for n, d in H._node_attr.items() if name in d}
 
@@ -344,7 +405,7 @@ def set_edge_attributes(H, values, name=None):
     ----------
     H : Hypergraph object
         The hypergraph to set edge attributes
-    values : scalar value, dict-like
+    values : scalar value, dict-like, or numpy.ndarray
         What the edge attribute should be set to.  If `values` is
         not a dictionary, then it is treated as a single attribute value
         that is then applied to every edge in `H`.  This means that if
@@ -354,6 +415,9 @@ def set_edge_attributes(H, values, name=None):
         If `values` is a dict or a dict of dict, it should be keyed
         by edge ID to either an attribute value or a dict of attribute
         key/value pairs used to update the edge's attributes.
+        If `values` is a 1D NumPy array, it holds the value of attribute `name`
+        of each edge, in the order of `H.edges`.  With the "columnar" attribute
+        backend, the array is stored at once.
     name : string (optional, default=None)
         Name of the edge attribute to set if values is a scalar.
 
@@ -368,7 +432,9 @@ def set_edge_attributes(H, values, name=None):
     Note that if the dict contains edge IDs that are not in `H`, they are
     silently ignored.
     """
-    if name is not None:
+    if isinstance(values, np.ndarray):
+        _set_attr_array(H._edge_attr, H.edges, values, name)
+    elif name is not None:
         # `values` does not contain attribute names
         try:
             for id, value in values.items():
@@ -393,7 +459,7 @@ def set_edge_attributes(H, values, name=None):
             )
 
 
-def get_edge_attributes(H, name=None):
+def get_edge_attributes(H, name=None, as_array=False, default=np.nan):
     """Get the edge attributes of the hypergraph
 
     Parameters
@@ -402,11 +468,34 @@ def get_edge_attributes(H, name=None):
         The hypergraph to get edge attributes from
     name : string, optional
        Attribute name. If None, then return the entire attribute dictionary.
+    as_array : bool, default: False
+        If True, return the values of attribute `name` as a NumPy array, in the
+        order of `H.edges`.  With the "columnar" attribute backend, this is a copy
+        of the stored array.
+    default : optional
+        If `as_array` is True, the value for edges without attribute `name`, by
+        default NaN.
 
     Returns
     -------
     dict
         Dictionary of attributes keyed by edge ID.
+    numpy.ndarray
+        If `as_array` is True, the attribute values.  The dtype is bool, int64 or
+        float64 if all values allow it, and object otherwise.
+
+    Raises
+    ------
+    XGIError
+        If `as_array` is True and `name` is None.
+
+    Examples
+    --------
+    >>> import xgi
+    >>> H = xgi.Hypergraph([[1, 2], [2, 3, 4], [1, 4]])
+    >>> xgi.set_edge_attributes(H, {0: 2, 2: 3}, name="weight")
+    >>> xgi.get_edge_attributes(H, "weight", as_array=True, default=1)
+    array([2, 1, 3])
 
     See Also
     --------
@@ -414,12 +503,37 @@ def get_edge_attributes(H, name=None):
     get_node_attributes
     set_edge_attributes
     """
+    if as_array:
+        return _get_attr_array(H._edge_attr, H.edges, name, default)
     if name is None:
-        return dict(H._edge_attr)
+        return {e: dict(H._edge_attr[e]) for e in H.edges}
     else:
         return {e: d[name] for e, d in H._edge_attr.items() if name in d}
 
 
+def _set_attr_array(store, ids, values, name):
+    """Set attribute `name` of each of the `ids` to the corresponding entry of `values`."""
+    if name is None:
+        raise XGIError("The name of the attribute must be given with an array")
+    if values.ndim != 1 or len(values) != len(ids):
+        raise XGIError(f"Expected a 1D array of {len(ids)} values for attribute {name}")
+    if isinstance(store, ColumnarAttrs):
+        store.set_column(name, values)
+    else:
+        for id, value in zip(ids, values.tolist()):
+            store[id][name] = value
+
+
+def _get_attr_array(store, ids, name, default):
+    """The values of attribute `name` of all the `ids`, in order, as an array."""
+    if name is None:
+        raise XGIError("The name of the attribute must be given to get an array")
+    if isinstance(store, ColumnarAttrs):
+        return store.column(name, default)
+    no_attrs = {}
+    return _array_of([store.get(id, no_attrs).get(name, default) for id in ids])
+
+
 def is_empty(H):
     """Returns True if `H` has no edges.
 
@@ -462,24 +576,21 @@ def maximal_simplices(SC):
     maximal_simplices : list(int)
         A list of IDs correspondent to the maximal simplices in the provided simplicial complex.
 
+    See Also
+    --------
+    ~xgi.classes.simplicialcomplex.SimplicialComplex.facets
+
     Notes
     --------
     The output is not a xgi's SimplicialComplex since, by construction,
     that would automatically add back the non-maximal simplices just removed.
+
+    The maximal simplices are found in time linear in the total size of the
+    simplices, by marking the faces of each simplex, and are cached on the
+    simplicial complex until it changes.
     """
 
     if type(SC) != xgi.classes.simplicialcomplex.SimplicialComplex:
         raise XGIError("The input must be a xgi.SimplicialComplex")
 
-    maximal_simplices = []
-
-    for i in SC.edges:
-        maximal = True
-        for j in SC.edges:
-            # i is a subface of j, I remove it
-            if SC.edges.members(i) < SC.edges.members(j):
-                maximal = False
-                break
-        if maximal:
-            maximal_simplices.append(i)
-    return maximal_simplices
+    return SC.facets()
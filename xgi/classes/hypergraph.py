@@ -1,25 +1,30 @@
 """Base class for undirected hypergraphs."""
-from copy import deepcopy
+import sys
+import weakref
+from contextlib import contextmanager
+from functools import partial
+from copy import copy, deepcopy
+from itertools import chain
 from warnings import warn
-from collections.abc import Iterable, Hashable
+from collections.abc import Hashable, Iterable, Mapping
+from operator import index
 
 import numpy as np
 
 import xgi
 import xgi.convert as convert
+from xgi.classes.columnar import ColumnarAttrs
 from xgi.classes.reportviews import DegreeView, EdgeSizeView, EdgeView, NodeView
 from xgi.exception import IDNotFound, XGIError
 from xgi.utils import XGICounter
+from xgi.utils.utilities import ResultCache, _deep_sizeof, _edge_key
 
 __all__ = ["Hypergraph"]
 
 
 class IDDict(dict):
-    def __getitem__(self, item):
-        try:
-            return super().__getitem__(item)
-        except KeyError as e:
-            raise IDNotFound(f"ID {item} not found") from e
+    def __missing__(self, item):
+        raise IDNotFound(f"ID {item} not found")
 
     def __setitem__(self, item, value):
         if item is None:
@@ -35,6 +40,659 @@ class IDDict(dict):
         except KeyError as e:
             raise IDNotFound(f"ID {item} not found") from e
 
+    def copy(self):
+        return self.__class__(self)
+
+
+class AttrStore(IDDict):
+    """Mapping from the IDs of the nodes or edges of a hypergraph to their attributes.
+
+    Only the IDs with attributes have an attribute dict, so that nodes and edges
+    without attributes do not each hold an empty dict.  Looking up another ID of the
+    hypergraph returns a :class:`LazyAttrs`, an empty dict which becomes the dict of
+    the ID when it is first written to.  Assigning an empty mapping to an
+    ID removes its dict, and iterating over the store only gives the IDs with a dict.
+
+    Parameters
+    ----------
+    ids : dict
+        The dict of the node or edge IDs of the hypergraph, used to tell IDs without
+        attributes from IDs not in the hypergraph.
+    attrs : mapping, optional
+        The initial IDs and their attribute dicts, which are not copied.
+
+    """
+
+    __slots__ = ("_ids", "_views")
+
+    def __init__(self, ids, attrs=()):
+        super().__init__()
+        self._ids = ids
+        self._views = None  # weak references to the LazyAttrs in use, one per ID
+        dict.update(self, attrs)
+
+    def __missing__(self, id):
+        if id not in self._ids:
+            raise IDNotFound(f"ID {id} not found")
+        views = self._views
+        if views is None:
+            views = self._views = {}
+        else:
+            view = views.get(id)
+            if view is not None:
+                attrs = view()
+                if attrs is not None:
+                    return attrs
+        attrs = LazyAttrs(self, id)
+        views[id] = weakref.ref(attrs, partial(_drop_view, views, id))
+        return attrs
+
+    def __setitem__(self, id, attrs):
+        if attrs:
+            super().__setitem__(id, attrs)
+        elif id is None:
+            raise XGIError("None cannot be a node or edge")
+        else:
+            self.pop(id, None)
+
+    def __delitem__(self, id):
+        self.pop(id, None)
+
+    def copy(self):
+        return self.__class__(self._ids, self)
+
+    def __reduce__(self):
+        return self.__class__, (self._ids, dict(self))
+
+
+def _drop_view(views, id, view):
+    """Forget the weak reference `view` to the LazyAttrs of an ID once it is freed."""
+    if views.get(id) is view:
+        del views[id]
+
+
+class LazyAttrs(IDDict):
+    """Attribute dict of an ID of an :class:`AttrStore` which does not have one yet.
+
+    It is an empty dict, which is not in the store until it is first written to, and
+    then becomes the attribute dict of the ID in the store.  Copies, made with
+    `copy`, `copy.copy` or `copy.deepcopy`, and pickles are plain dicts.
+
+    Parameters
+    ----------
+    store : AttrStore
+        The store.
+    id : hashable
+        The ID.
+
+    """
+
+    __slots__ = ("_store", "_id")
+
+    def __init__(self, store, id):
+        super().__init__()
+        self._store = store
+        self._id = id
+
+    def _dict(self):
+        """The dict to write to: this one, stored for the ID if it has no dict yet,
+        or the dict the ID got since."""
+        store = self._store
+        attrs = dict.get(store, self._id)
+        if attrs is None:
+            if self._id not in store._ids:
+                raise IDNotFound(f"ID {self._id} not found")
+            dict.__setitem__(store, self._id, self)
+            return self
+        return attrs
+
+    def __missing__(self, name):
+        raise KeyError(name)
+
+    def __setitem__(self, name, value):
+        attrs = self._dict()
+        if attrs is not self:
+            attrs[name] = value
+        super().__setitem__(name, value)
+
+    def update(self, *args, **kwargs):
+        attrs = self._dict()
+        if attrs is not self:
+            attrs.update(*args, **kwargs)
+        dict.update(self, *args, **kwargs)
+
+    def setdefault(self, name, default=None):
+        if name not in self:
+            self[name] = default
+        return dict.__getitem__(self, name)
+
+    def copy(self):
+        """The attributes as a new dict."""
+        return dict(self)
+
+    def __copy__(self):
+        return dict(self)
+
+    def __deepcopy__(self, memo):
+        return deepcopy(dict(self), memo)
+
+    def __reduce__(self):
+        return dict, (dict(self),)
+
+
+class IDList:
+    """Insertion-ordered collection of IDs with constant-time lookup and removal.
+
+    This is the container for the members of each edge and the memberships of each
+    node.  It supports the list methods used on them, but the IDs are kept as keys
+    of a dict so that `remove` and `in` do not scan the collection.  An ID may be
+    repeated, as a node in the members of an edge, in which case the IDs are also
+    kept in a list, in the order in which they were added, and removing one takes
+    time linear in their number.
+
+    Parameters
+    ----------
+    ids : iterable, optional
+        The initial IDs.
+
+    """
+
+    __slots__ = ("_ids", "_extra", "_num_extra", "_order")
+
+    def __init__(self, ids=()):
+        self._ids = {}
+        self._extra = {}  # number of repeats of each repeated ID
+        self._num_extra = 0
+        self._order = None  # all the IDs in order, only when some are repeated
+        self.extend(ids)
+
+    @classmethod
+    def _from_list(cls, ids):
+        """An IDList of the IDs in the list `ids`, faster than `IDList(ids)`."""
+        new = cls.__new__(cls)
+        new._ids = dict.fromkeys(ids)
+        new._extra = {}
+        new._num_extra = 0
+        new._order = None
+        if len(new._ids) != len(ids):  # repeated IDs
+            new._ids = {}
+            new.extend(ids)
+        return new
+
+    def __iter__(self):
+        if self._order is None:
+            return iter(self._ids)
+        return iter(self._order)
+
+    def __len__(self):
+        return len(self._ids) + self._num_extra
+
+    def __contains__(self, id):
+        return id in self._ids
+
+    def __eq__(self, other):
+        if isinstance(other, (IDList, list)):
+            return len(self) == len(other) and list(self) == list(other)
+        return NotImplemented
+
+    __hash__ = None
+
+    def __repr__(self):
+        return f"{type(self).__name__}({list(self)})"
+
+    def append(self, id):
+        """Add `id` at the end."""
+        if id in self._ids:
+            self._extra[id] = self._extra.get(id, 0) + 1
+            self._num_extra += 1
+            if self._order is None:
+                self._order = list(self._ids)
+        else:
+            self._ids[id] = None
+        if self._order is not None:
+            self._order.append(id)
+
+    def extend(self, ids):
+        """Add the `ids` at the end."""
+        ids = list(ids)
+        new = dict.fromkeys(ids)
+        if (
+            self._order is None
+            and len(new) == len(ids)
+            and new.keys().isdisjoint(self._ids)
+        ):
+            self._ids.update(new)
+        else:
+            for id in ids:
+                self.append(id)
+
+    def remove(self, id):
+        """Remove the first copy of `id`.
+
+        Raises
+        ------
+        ValueError
+            If `id` is not in the collection.
+
+        """
+        if id not in self._ids:
+            raise ValueError(f"{id} not in {type(self).__name__}")
+        if self._order is None:
+            del self._ids[id]
+            return
+        self._order.remove(id)
+        if id in self._extra:
+            self._num_extra -= 1
+            self._extra[id] -= 1
+            if not self._extra[id]:
+                del self._extra[id]
+        else:
+            del self._ids[id]
+        if not self._num_extra:
+            # the remaining IDs are distinct, in the order of the list
+            self._ids = dict.fromkeys(self._order)
+            self._order = None
+
+    def copy(self):
+        """The IDs as a new list."""
+        return list(self)
+
+    def view(self):
+        """The IDs, read-only and without copying them when no ID is repeated.
+
+        Returns
+        -------
+        KeysView or tuple
+            A view of the IDs, which follows the changes to the collection, or a
+            tuple of the IDs if some are repeated.
+
+        """
+        if self._order is None:
+            return self._ids.keys()
+        return tuple(self._order)
+
+    def __copy__(self):
+        new = IDList.__new__(IDList)
+        new._ids = self._ids.copy()
+        new._extra = self._extra.copy()
+        new._num_extra = self._num_extra
+        new._order = None if self._order is None else self._order.copy()
+        return new
+
+
+class IDIndex:
+    """Stable map between IDs and contiguous integer positions.
+
+    IDs get consecutive positions in the order in which they are added.  Removing an
+    ID leaves a hole in the positions, and the positions are compacted, keeping their
+    order, the next time they are requested or when holes outnumber the IDs.  Hence
+    the positions of all IDs are the same as their positions when iterating over the
+    nodes or edges of the hypergraph, and they remain valid until the next removal.
+
+    Parameters
+    ----------
+    ids : iterable, optional
+        The initial IDs.
+
+    """
+
+    __slots__ = ("_pos", "_ids", "_holes", "_snapshot")
+
+    def __init__(self, ids=()):
+        self._ids = list(ids)
+        self._pos = {id: i for i, id in enumerate(self._ids)}
+        self._holes = 0
+        self._snapshot = None
+
+    def __len__(self):
+        return len(self._pos)
+
+    def add(self, id):
+        """Give the next position to `id`, unless it already has one."""
+        if id not in self._pos:
+            self._pos[id] = len(self._ids)
+            self._ids.append(id)
+            self._snapshot = None
+
+    def extend(self, ids):
+        """Give the next positions to the `ids` that do not have one yet."""
+        for id in ids:
+            if id not in self._pos:
+                self._pos[id] = len(self._ids)
+                self._ids.append(id)
+        self._snapshot = None
+
+    def remove(self, id):
+        """Remove `id` and leave a hole in its position."""
+        self._ids[self._pos.pop(id)] = None  # None cannot be an ID
+        self._holes += 1
+        self._snapshot = None
+        if self._holes > len(self._pos):
+            self.compact()
+
+    def clear(self):
+        """Remove all IDs."""
+        self._ids = []
+        self._pos = {}
+        self._holes = 0
+        self._snapshot = None
+
+    def compact(self):
+        """Renumber the positions to remove the holes left by removed IDs."""
+        if self._holes:
+            self._ids = [id for id in self._ids if id is not None]
+            self._pos = {id: i for i, id in enumerate(self._ids)}
+            self._holes = 0
+
+    def positions(self):
+        """The dict mapping each ID to its position.
+
+        The dict is owned by the index and must not be modified.
+
+        """
+        self.compact()
+        return self._pos
+
+    def ids(self):
+        """A tuple of the IDs in order of position."""
+        self.compact()
+        if self._snapshot is None:
+            self._snapshot = tuple(self._ids)
+        return self._snapshot
+
+    def copy(self):
+        """An independent copy of the index."""
+        new = IDIndex.__new__(IDIndex)
+        new._pos = self._pos.copy()
+        new._ids = self._ids.copy()
+        new._holes = self._holes
+        new._snapshot = self._snapshot
+        return new
+
+
+class SizeIndex:
+    """Edge IDs grouped by the size of the edges.
+
+    Each size with at least one edge maps to the IDs of the edges of that size, so that
+    the edges of a given order are found without scanning all the edges, and the
+    distinct sizes are found without looking at any edge.
+
+    Parameters
+    ----------
+    sizes : iterable of (ID, int) pairs, optional
+        The initial IDs and the sizes of their edges.
+
+    """
+
+    __slots__ = ("_buckets",)
+
+    def __init__(self, sizes=()):
+        self._buckets = {}  # size -> dict with the IDs as keys, in insertion order
+        for id, size in sizes:
+            self.add(id, size)
+
+    def add(self, id, size):
+        """Register `id` as an edge of size `size`."""
+        bucket = self._buckets.get(size)
+        if bucket is None:
+            self._buckets[size] = {id: None}
+        else:
+            bucket[id] = None
+
+    def remove(self, id, size):
+        """Unregister `id` from the edges of size `size`."""
+        bucket = self._buckets[size]
+        del bucket[id]
+        if not bucket:
+            del self._buckets[size]
+
+    def sizes(self):
+        """The distinct sizes of the edges, in no particular order."""
+        return self._buckets.keys()
+
+    def counts(self):
+        """Dict mapping each size to the number of edges of that size."""
+        return {size: len(ids) for size, ids in self._buckets.items()}
+
+    def ids(self, size, index=None):
+        """The IDs of the edges of size `size`.
+
+        Parameters
+        ----------
+        size : int
+            The size of the edges.
+        index : IDIndex, optional
+            If given, the IDs are sorted by their position in this index, which is the
+            order of the edges in the hypergraph.  Otherwise they are in the order in
+            which they got this size.
+
+        Returns
+        -------
+        list
+            The IDs.
+
+        """
+        bucket = self._buckets.get(size, ())
+        if index is None:
+            return list(bucket)
+        return sorted(bucket, key=index.positions().__getitem__)
+
+    def copy(self):
+        """An independent copy of the index."""
+        new = SizeIndex.__new__(SizeIndex)
+        new._buckets = {size: ids.copy() for size, ids in self._buckets.items()}
+        return new
+
+
+def _copy_attrs(store, deep=False):
+    """A copy of the attributes of the nodes or edges of a hypergraph.
+
+    The attribute dicts, or the arrays of a `ColumnarAttrs`, are copied.  Their values
+    are only copied if `deep` is True.  The copy of an `AttrStore` is bound to the
+    same IDs until it is given to `Hypergraph._set_attr_stores`.
+
+    """
+    if isinstance(store, ColumnarAttrs):
+        return store.copy(deep)
+    copy_attrs = deepcopy if deep else lambda attrs: attrs.copy()
+    return AttrStore(
+        store._ids, ((id, copy_attrs(attrs)) for id, attrs in store.items())
+    )
+
+
+def _update_attrs(store, items):
+    """Add (ID, attribute dict) pairs to the attributes of a hypergraph, in bulk."""
+    if isinstance(store, ColumnarAttrs):
+        store.update(items)
+    else:  # skip the checks of AttrStore, and the IDs without attributes
+        dict.update(store, ((id, attrs) for id, attrs in items if attrs))
+
+
+def _attrs_sizeof(store, seen, deep):
+    """Estimate the memory used by the attributes of the nodes or edges, in bytes.
+
+    If `deep` is False, the attribute dicts are counted but not the values they hold.
+
+    """
+    attrs = getattr(store, "_attrs", store)  # the dict of a compact hypergraph
+    if deep or not isinstance(attrs, dict):
+        return _deep_sizeof(store, seen, deep)
+    size = sys.getsizeof(store) + (sys.getsizeof(attrs) if attrs is not store else 0)
+    return size + sum(sys.getsizeof(a) for a in dict.values(attrs))
+
+
+def _index_dtype(n):
+    """The smallest of int32 and int64 that can hold `n`."""
+    return np.int32 if n < np.iinfo(np.int32).max else np.int64
+
+
+def _id_table(ids):
+    """A compact picklable form of a list of IDs, see `_ids_of_table`.
+
+    IDs 0 to n - 1 in order become a range, other integer IDs an int64 array, and
+    other IDs are kept in the list.
+
+    """
+    if all(type(id) is int for id in ids):
+        try:
+            table = np.array(ids, dtype=np.int64)
+        except OverflowError:
+            return ids
+        if np.array_equal(table, np.arange(len(ids))):
+            return range(len(ids))
+        return table
+    return ids
+
+
+def _ids_of_table(table):
+    """The list of IDs stored in `table` by `_id_table`."""
+    return table.tolist() if isinstance(table, np.ndarray) else list(table)
+
+
+def _attr_columns(store, ids):
+    """The attributes of the nodes or edges grouped by name, for pickling.
+
+    For a `ColumnarAttrs`, each attribute name maps to its column and its mask, with
+    one row per ID in `ids`.  For an `AttrStore`, each attribute name maps to the
+    positions in `ids` of the IDs with the attribute, or None if all have it, to
+    their values and to whether these are Python scalars.  The values are in a NumPy
+    array if they are all of the same bool, int or float type, Python or NumPy, and
+    in a list otherwise.
+
+    """
+    if isinstance(store, ColumnarAttrs):
+        rows = store.positions()
+        rows = None if store._ids == ids else [rows[id] for id in ids]
+        n = len(ids)
+        columns = {}
+        for name, column in store._columns.items():
+            mask = store._masks[name][:n]
+            column = column[:n]
+            if rows is not None:
+                column, mask = column[rows], mask[rows]
+            columns[name] = (column, mask)
+        return columns
+
+    pos = {id: i for i, id in enumerate(ids)}
+    columns = {}
+    for id, attrs in store.items():
+        i = pos[id]
+        for name, value in attrs.items():
+            column = columns.get(name)
+            if column is None:
+                columns[name] = column = ([], [])
+            column[0].append(i)
+            column[1].append(value)
+    for name, (positions, values) in columns.items():
+        types = {type(value) for value in values}
+        dtype = types.pop() if len(types) == 1 else None
+        python = dtype in (bool, int, float)
+        if python or (dtype is not None and issubclass(dtype, (np.number, np.bool_))):
+            try:
+                values = np.array(values, dtype=dtype)
+            except OverflowError:
+                pass
+        if len(positions) == len(ids):
+            positions = None
+        else:
+            positions = np.array(positions, dtype=_index_dtype(len(ids)))
+        columns[name] = (positions, values, python)
+    return columns
+
+
+def _attrs_of_columns(ids, columns, backend, id_dict, factory):
+    """The attribute store of the `ids` from the `columns` made by `_attr_columns`."""
+    if backend == "columnar":
+        return ColumnarAttrs._from_columns(ids, columns)
+    attrs = {}
+    for name, (positions, values, python) in columns.items():
+        if python and isinstance(values, np.ndarray):
+            values = values.tolist()
+        positions = range(len(ids)) if positions is None else positions.tolist()
+        for i, value in zip(positions, values):
+            attr = attrs.get(i)
+            if attr is None:
+                attrs[i] = attr = factory()
+            attr[name] = value
+    return AttrStore(id_dict, ((ids[i], attrs[i]) for i in sorted(attrs)))
+
+
+def _memberships_indptr(edge_indices, num_nodes):
+    """The CSR offsets of the node memberships, from the members of the edges."""
+    indptr = np.zeros(num_nodes + 1, dtype=edge_indices.dtype)
+    np.cumsum(np.bincount(edge_indices, minlength=num_nodes), out=indptr[1:])
+    return indptr
+
+
+def _memberships(edge_indptr, edge_indices):
+    """The positions of the edges of each node, in order of edges, as CSR indices."""
+    edges = np.repeat(
+        np.arange(len(edge_indptr) - 1, dtype=edge_indices.dtype), np.diff(edge_indptr)
+    )
+    return edges[np.argsort(edge_indices, kind="stable")]
+
+
+def _fill_from_csr(d, ids, indptr, indices, table, factory):
+    """Fill the dict `d` with the neighbors of each of the `ids`, made by `factory`.
+
+    The neighbors of the `i`-th ID are at positions ``indices[indptr[i]:indptr[i +
+    1]]`` of the IDs stored in `table` by `_id_table`.
+
+    """
+    if isinstance(table, range):  # the positions are the IDs
+        neighbors = indices.tolist()
+    else:
+        neighbor_ids = _ids_of_table(table)
+        neighbors = [neighbor_ids[i] for i in indices.tolist()]
+    bounds = indptr.tolist()
+    dict.update(
+        d,
+        (
+            (id, factory(neighbors[bounds[i] : bounds[i + 1]]))
+            for i, id in enumerate(ids)
+        ),
+    )
+
+
+def _from_pickle_state(cls, state):
+    """Rebuild a hypergraph of class `cls` from the state made by `__reduce__`."""
+    H = cls()
+    H._set_pickle_state(state)
+    return H
+
+
+class IndexView(Mapping):
+    """Read-only dict-like view mapping positions to IDs.
+
+    Parameters
+    ----------
+    ids : sequence
+        The IDs in order of position.
+
+    """
+
+    __slots__ = ("_ids",)
+
+    def __init__(self, ids):
+        self._ids = ids
+
+    def __getitem__(self, i):
+        try:
+            if isinstance(i, bool) or index(i) < 0:
+                raise KeyError(i)
+            return self._ids[i]
+        except (IndexError, TypeError):
+            raise KeyError(i)
+
+    def __iter__(self):
+        return iter(range(len(self._ids)))
+
+    def __len__(self):
+        return len(self._ids)
+
+    def __repr__(self):
+        return repr(dict(self))
+
 
 class Hypergraph:
     r"""A hypergraph is a collection of subsets of a set of *nodes* or *vertices*.
@@ -94,9 +752,16 @@ class Hypergraph:
         self._edge_uid = XGICounter()
         self._hypergraph = self._hypergraph_attr_dict_factory()
         self._node = self._node_dict_factory()
-        self._node_attr = self._node_attr_dict_factory()
+        self._node_attr = AttrStore(self._node)
         self._edge = self._hyperedge_dict_factory()
-        self._edge_attr = self._hyperedge_attr_dict_factory()
+        self._edge_attr = AttrStore(self._edge)
+        self._edge_lookup = {}
+        self._edge_sizes = SizeIndex()
+        self._node_index = IDIndex()
+        self._edge_index = IDIndex()
+        self._version = 0  # bumped by every change to the structure
+        self._cache = ResultCache()
+        self._shared = None  # group of copies sharing containers, see `copy`
 
         self.nodes = NodeView(self)
         """A :class:`~xgi.classes.reportviews.NodeView` of the hypergraph."""
@@ -225,6 +890,173 @@ class Hypergraph:
         """
         return len(self._edge)
 
+    @property
+    def version(self):
+        """The version of the structure of the hypergraph.
+
+        The version increases every time nodes or edges are added or removed, or
+        the members of an edge change.  Changes to attributes do not affect it.
+
+        Returns
+        -------
+        int
+            The structural version.
+
+        Examples
+        --------
+        >>> import xgi
+        >>> H = xgi.Hypergraph([[1, 2], [2, 3, 4]])
+        >>> v = H.version
+        >>> H.add_edge([1, 4])
+        >>> H.version > v
+        True
+
+        """
+        return self._version
+
+    def cache_info(self):
+        """Statistics of the cache of derived results.
+
+        Results such as the matrices of :mod:`xgi.linalg.matrix` and the connected
+        components are cached on the hypergraph until its structure changes.
+
+        Returns
+        -------
+        CacheInfo
+            A named tuple with fields `hits`, `misses`, `maxsize`, `currsize`,
+            `maxbytes` and `nbytes`, the estimated size of the cached results.
+
+        See Also
+        --------
+        cache_clear
+        cache_resize
+
+        Examples
+        --------
+        >>> import xgi
+        >>> H = xgi.Hypergraph([[1, 2], [2, 3, 4]])
+        >>> A = xgi.adjacency_matrix(H)
+        >>> A = xgi.adjacency_matrix(H)
+        >>> info = H.cache_info()
+        >>> info.hits > 0
+        True
+
+        """
+        return self._cache.info()
+
+    def cache_clear(self):
+        """Remove all the cached derived results and reset the statistics.
+
+        See Also
+        --------
+        cache_info
+        cache_resize
+
+        """
+        self._cache.clear()
+
+    def cache_resize(self, maxsize=32, maxbytes=2**28):
+        """Set the limits of the cache of derived results.
+
+        The least recently used results are evicted first.
+
+        Parameters
+        ----------
+        maxsize : int, default: 32
+            The maximum number of cached results.  If 0, nothing is cached.
+        maxbytes : int or None, default: 2**28
+            The maximum estimated size of the cached results, in bytes.  If None,
+            the size is not limited.
+
+        Raises
+        ------
+        XGIError
+            If a limit is negative.
+
+        See Also
+        --------
+        cache_info
+        cache_clear
+
+        """
+        self._cache.resize(maxsize, maxbytes)
+
+    def memory_usage(self, deep=True):
+        """Estimate the memory used by the hypergraph, by component.
+
+        Parameters
+        ----------
+        deep : bool, default: True
+            Whether to count the IDs and the attribute names and values.  If False,
+            only the containers holding them are counted.
+
+        Returns
+        -------
+        dict
+            The estimated number of bytes used by each component of the hypergraph:
+
+            * "node": the memberships of the nodes.
+            * "edge": the members of the edges.
+            * "edge_lookup": the index finding edges by their members.
+            * "edge_sizes": the index finding edges by their size.
+            * "node_index", "edge_index": the positions of the nodes and edges in
+              the matrices.
+            * "cofaces": for simplicial complexes, the Hasse diagram of the
+              simplices.
+            * "node_attr", "edge_attr": the node and edge attributes.
+            * "hypergraph": the hypergraph attributes.
+            * "cache": the cached derived results, see `cache_info`.
+
+            An index that is built lazily and has not been built uses 0 bytes.
+
+        See Also
+        --------
+        ~xgi.linalg.matrix.estimate_matrix_memory
+
+        Notes
+        -----
+        The sizes are estimated with `sys.getsizeof`, which does not count the
+        overhead of the memory allocator.  An object referred to by several
+        components, such as the ID of a node, which is also in the members of its
+        edges, is counted in the first of these components.  The containers shared
+        with copies made with `copy(copy_on_write=True)` are counted in full.
+
+        Examples
+        --------
+        >>> import xgi
+        >>> H = xgi.Hypergraph([[1, 2], [2, 3, 4]])
+        >>> usage = H.memory_usage()
+        >>> list(usage)[:3]
+        ['node', 'edge', 'edge_lookup']
+        >>> sum(usage.values()) > sum(H.memory_usage(deep=False).values())
+        True
+
+        """
+        seen = set()
+        usage = {
+            name: sum(_deep_sizeof(obj, seen, deep) for obj in objs)
+            for name, objs in self._structures().items()
+        }
+        usage["node_attr"] = _attrs_sizeof(self._node_attr, seen, deep)
+        usage["edge_attr"] = _attrs_sizeof(self._edge_attr, seen, deep)
+        if deep:
+            usage["hypergraph"] = _deep_sizeof(self._hypergraph, seen, deep)
+        else:
+            usage["hypergraph"] = sys.getsizeof(self._hypergraph)
+        usage["cache"] = _deep_sizeof(self._cache, seen, deep)
+        return usage
+
+    def _structures(self):
+        """The objects making up each structural component, see `memory_usage`."""
+        return {
+            "node": (self._node,),
+            "edge": (self._edge,),
+            "edge_lookup": (self._edge_lookup,),
+            "edge_sizes": (self._edge_sizes,),
+            "node_index": (self._node_index,),
+            "edge_index": (self._edge_index,),
+        }
+
     def neighbors(self, n):
         """Find the neighbors of a node.
 
@@ -256,7 +1088,11 @@ class Hypergraph:
         {1, 3, 4}
 
         """
-        return {i for e in self._node[n] for i in self._edge[e]}.difference({n})
+        nbrs = set()
+        for e in self._node[n]:
+            nbrs.update(self._edge[e])
+        nbrs.discard(n)
+        return nbrs
 
     def egonet(self, n, include_self=False):
         """The egonet of the specified node.
@@ -294,13 +1130,12 @@ class Hypergraph:
         [[1, 2, 3], [3, 4]]
 
         """
+        edges = self.edges.containing([n])
         if include_self:
-            return [self.edges.members(e) for e in self.nodes.memberships(n)]
+            return [self.edges.members(e) for e in edges]
         else:
-            return [
-                [x for x in self.edges.members(e) if x != n]
-                for e in self.nodes.memberships(n)
-            ]
+            members = self.edges.members
+            return [[x for x in members(e, copy=False) if x != n] for e in edges]
 
     def add_node(self, node, **attr):
         """Add one node with optional attributes.
@@ -321,10 +1156,13 @@ class Hypergraph:
         If node is already in the hypergraph, its attributes are still updated.
 
         """
+        self._bump_version()
         if node not in self._node:
-            self._node[node] = []
-            self._node_attr[node] = self._node_attr_dict_factory()
-        self._node_attr[node].update(attr)
+            self._node[node] = IDList()
+            self._node_attr[node] = self._node_attr_dict_factory(attr)
+            self._node_index.add(node)
+        else:
+            self._node_attr[node].update(attr)
 
     def add_nodes_from(self, nodes_for_adding, **attr):
         """Add multiple nodes with optional attributes.
@@ -346,6 +1184,7 @@ class Hypergraph:
         add_node
 
         """
+        self._bump_version()
         for n in nodes_for_adding:
             try:
                 newnode = n not in self._node
@@ -356,9 +1195,11 @@ class Hypergraph:
                 newdict = attr.copy()
                 newdict.update(ndict)
             if newnode:
-                self._node[n] = []
-                self._node_attr[n] = self._node_attr_dict_factory()
-            self._node_attr[n].update(newdict)
+                self._node[n] = IDList()
+                self._node_attr[n] = self._node_attr_dict_factory(newdict)
+                self._node_index.add(n)
+            else:
+                self._node_attr[n].update(newdict)
 
     def remove_node(self, n):
         """Remove a single node and all adjacent hyperedges.
@@ -378,14 +1219,20 @@ class Hypergraph:
         remove_nodes_from
 
         """
+        self._bump_version()
         edge_neighbors = self._node[n]
         del self._node[n]
         del self._node_attr[n]
+        self._node_index.remove(n)
         for edge in edge_neighbors:
+            self._unindex_edge(edge)
             self._edge[edge].remove(n)
             if not self._edge[edge]:
                 del self._edge[edge]
                 del self._edge_attr[edge]
+                self._edge_index.remove(edge)
+            else:
+                self._index_edge(edge)
 
     def remove_nodes_from(self, nodes):
         """Remove multiple nodes.
@@ -419,6 +1266,15 @@ class Hypergraph:
         bool
            Whether or not edge is as an edge in the hypergraph.
 
+        See Also
+        --------
+        ~xgi.classes.reportviews.EdgeView.find
+
+        Notes
+        -----
+        Edges are looked up by their set of members, so this takes time proportional
+        to the size of `edge` and not to the number of edges in the hypergraph.
+
         Examples
         --------
         >>> import xgi
@@ -430,7 +1286,96 @@ class Hypergraph:
         False
 
         """
-        return set(edge) in (set(self.edges.members(e)) for e in self.edges)
+        try:
+            return frozenset(edge) in self._edges_by_members()
+        except TypeError:
+            return False
+
+    def _edges_by_members(self):
+        """The dict mapping the set of members of each edge to the IDs of the edges.
+
+        It is built when first needed if the hypergraph was created without it, as
+        done by `dual`.
+
+        """
+        if self._edge_lookup is None:
+            lookup = {}
+            for id, members in self._edge.items():
+                lookup.setdefault(frozenset(members), []).append(id)
+            self._edge_lookup = lookup
+        return self._edge_lookup
+
+    def _edges_by_size(self):
+        """The :class:`SizeIndex` of the edges of the hypergraph.
+
+        It is built when first needed if the hypergraph was created without it, as
+        done by `dual`.
+
+        """
+        if self._edge_sizes is None:
+            self._edge_sizes = SizeIndex(
+                (id, len(members)) for id, members in self._edge.items()
+            )
+        return self._edge_sizes
+
+    def _bump_version(self):
+        """Bump the structural version before the structure changes.
+
+        If the membership containers are shared with copy-on-write copies, they are
+        first copied so that the change is not seen by the copies.
+
+        """
+        if self._shared is not None:
+            self._unshare()
+        self._version += 1
+
+    def _share_containers(self, other):
+        """Register `other` as sharing the membership containers of this hypergraph."""
+        if self._shared is None:
+            self._shared = [1]  # the number of hypergraphs sharing them
+        self._shared[0] += 1
+        other._shared = self._shared
+
+    def _unshare(self):
+        """Stop sharing the membership containers with copy-on-write copies."""
+        group = self._shared
+        self._shared = None
+        group[0] -= 1
+        if not group[0]:
+            return  # the other copies have already unshared
+        for d in (self._node, self._edge):
+            dict.update(d, ((id, copy(ids)) for id, ids in d.items()))
+        lookup = self._edge_lookup
+        if lookup is not None:
+            lookup.update((key, ids.copy()) for key, ids in lookup.items())
+        if self._edge_sizes is not None:
+            self._edge_sizes = self._edge_sizes.copy()
+
+    def _index_edge(self, id):
+        """Register an edge in the indices keyed by its members and by its size.
+
+        The indices which have not been built yet are skipped, since the edge is
+        registered when they are built.
+
+        """
+        members = self._edge[id]
+        if self._edge_sizes is not None:
+            self._edge_sizes.add(id, len(members))
+        if self._edge_lookup is not None:
+            self._edge_lookup.setdefault(frozenset(members), []).append(id)
+
+    def _unindex_edge(self, id):
+        """Remove an edge from the indices keyed by its members and by its size."""
+        members = self._edge[id]
+        if self._edge_sizes is not None:
+            self._edge_sizes.remove(id, len(members))
+        if self._edge_lookup is None:
+            return
+        key = frozenset(members)
+        ids = self._edge_lookup[key]
+        ids.remove(id)
+        if not ids:
+            del self._edge_lookup[key]
 
     def add_edge(self, members, id=None, **attr):
         """Add one edge with optional attributes.
@@ -475,21 +1420,25 @@ class Hypergraph:
         {'color': 'red', 'place': 'peru'}
 
         """
+        self._bump_version()
         members = list(members)
         if not members:
             raise XGIError("Cannot add an empty edge")
 
         uid = self._edge_uid() if not id else id
-        self._edge[uid] = []
+        if uid in self._edge:
+            self._unindex_edge(uid)
+        self._edge[uid] = IDList(members)
+        self._edge_index.add(uid)
         for node in members:
             if node not in self._node:
-                self._node[node] = []
-                self._node_attr[node] = self._node_attr_dict_factory()
+                self._node[node] = IDList()
+                self._node_attr[node] = {}
+                self._node_index.add(node)
             self._node[node].append(uid)
-            self._edge[uid].append(node)
+        self._index_edge(uid)
 
-        self._edge_attr[uid] = self._hyperedge_attr_dict_factory()
-        self._edge_attr[uid].update(attr)
+        self._edge_attr[uid] = self._hyperedge_attr_dict_factory(attr)
 
     def add_edges_from(self, ebunch_to_add, **attr):
         """Add multiple edges with optional attributes.
@@ -588,19 +1537,25 @@ class Hypergraph:
         {'one': {'color': 'red'}, 'two': {'age': 30}, 'three': {'color': 'blue', 'age': 40}}
 
         """
+        self._bump_version()
         # format 5 is the easiest one
         if isinstance(ebunch_to_add, dict):
             for uid, members in ebunch_to_add.items():
+                if uid in self._edge:
+                    self._unindex_edge(uid)
                 try:
-                    self._edge[uid] = list(members)
+                    self._edge[uid] = IDList(members)
                 except TypeError as e:
                     raise XGIError("Invalid ebunch format") from e
+                self._edge_index.add(uid)
                 for n in members:
                     if n not in self._node:
-                        self._node[n] = []
-                        self._node_attr[n] = self._node_attr_dict_factory()
+                        self._node[n] = IDList()
+                        self._node_attr[n] = {}
+                        self._node_index.add(n)
                     self._node[n].append(uid)
-                self._edge_attr[uid] = self._hyperedge_attr_dict_factory()
+                self._index_edge(uid)
+                self._edge_attr[uid] = {}
             return
 
         # in formats 1-4 we only know that ebunch_to_add is an iterable, so we iterate
@@ -645,20 +1600,25 @@ class Hypergraph:
             elif format4:
                 members, uid, eattr = e[0], e[1], e[2]
 
+            if uid in self._edge:
+                self._unindex_edge(uid)
             try:
-                self._edge[uid] = list(members)
+                self._edge[uid] = IDList(members)
             except TypeError as e:
                 raise XGIError("Invalid ebunch format") from e
+            self._edge_index.add(uid)
 
             for n in members:
                 if n not in self._node:
-                    self._node[n] = []
-                    self._node_attr[n] = self._node_attr_dict_factory()
+                    self._node[n] = IDList()
+                    self._node_attr[n] = {}
+                    self._node_index.add(n)
                 self._node[n].append(uid)
+            self._index_edge(uid)
 
-            self._edge_attr[uid] = self._hyperedge_attr_dict_factory()
-            self._edge_attr[uid].update(attr)
-            self._edge_attr[uid].update(eattr)
+            attrs = self._hyperedge_attr_dict_factory(attr)
+            attrs.update(eattr)
+            self._edge_attr[uid] = attrs
 
             try:
                 e = next(new_edges)
@@ -705,6 +1665,156 @@ class Hypergraph:
         except KeyError:
             XGIError("Empty or invalid edges specified.")
 
+    def add_edges_from_arrays(
+        self, indptr, indices, node_labels=None, edge_ids=None, edge_attrs=None
+    ):
+        """Add multiple edges given as arrays in compressed sparse row (CSR) format.
+
+        The members of the `i`-th edge are the nodes at positions
+        ``indices[indptr[i]:indptr[i + 1]]``.  All the edges are added in a single
+        pass, without inspecting the format of each edge as `add_edges_from` does,
+        which makes this the fastest way to add many edges at once.
+
+        Parameters
+        ----------
+        indptr : array-like of int
+            The offsets of the edges in `indices`, of length `m + 1` where `m` is the
+            number of edges, starting with 0.
+        indices : array-like of int
+            The positions of the members of all the edges, concatenated.
+        node_labels : sequence, optional
+            The node ID at each position.  By default, the positions are the node IDs.
+        edge_ids : sequence, optional
+            The IDs of the edges, which must be unique and not already in the
+            hypergraph.  By default, numeric IDs are assigned automatically.
+        edge_attrs : dict, optional
+            A dict mapping attribute names to sequences with the value of the
+            attribute for each edge.
+
+        Raises
+        ------
+        XGIError
+            If the arrays are not a valid CSR structure, if an edge is empty, or if
+            the labels, IDs, or attributes have the wrong length.
+
+        See Also
+        --------
+        add_edges_from : Add edges given in any of several formats.
+
+        Notes
+        -----
+        New nodes are added in order of position, and the memberships of each node
+        follow the order of the edges.
+
+        Examples
+        --------
+        >>> import xgi
+        >>> H = xgi.Hypergraph()
+        >>> H.add_edges_from_arrays([0, 2, 5], [0, 1, 1, 2, 3])
+        >>> H.edges.members(dtype=dict)
+        {0: [0, 1], 1: [1, 2, 3]}
+
+        Node labels, edge IDs, and edge attributes can be given as well.
+
+        >>> H = xgi.Hypergraph()
+        >>> H.add_edges_from_arrays(
+        ...     [0, 2, 5],
+        ...     [0, 1, 1, 2, 3],
+        ...     node_labels=["a", "b", "c", "d"],
+        ...     edge_ids=["e1", "e2"],
+        ...     edge_attrs={"weight": [0.5, 2.0]},
+        ... )
+        >>> H.edges.members(dtype=dict)
+        {'e1': ['a', 'b'], 'e2': ['b', 'c', 'd']}
+        >>> H.edges["e2"]
+        {'weight': 2.0}
+
+        """
+        self._bump_version()
+        indptr = np.asarray(indptr)
+        indices = np.asarray(indices)
+        if indptr.ndim != 1 or indices.ndim != 1 or len(indptr) == 0:
+            raise XGIError("indptr and indices must be one-dimensional arrays")
+        if len(indices) and not np.issubdtype(indices.dtype, np.integer):
+            raise XGIError("indices must be integers")
+        num_edges = len(indptr) - 1
+        sizes = np.diff(indptr)
+        if indptr[0] != 0 or indptr[-1] != len(indices) or np.any(sizes < 0):
+            raise XGIError("indptr is not consistent with indices")
+        if np.any(sizes == 0):
+            raise XGIError("Cannot add an empty edge")
+        if num_edges == 0:
+            return
+
+        if node_labels is None:
+            members = indices.tolist()
+            if indices.min() < 0:
+                raise XGIError("indices must be non-negative")
+            labels = None
+        else:
+            labels = list(node_labels)
+            if indices.min() < 0 or indices.max() >= len(labels):
+                raise XGIError("indices out of range of node_labels")
+            members = [labels[i] for i in indices.tolist()]
+
+        if edge_ids is None:
+            edge_ids = [self._edge_uid() for _ in range(num_edges)]
+        else:
+            edge_ids = list(edge_ids)
+            if len(edge_ids) != num_edges:
+                raise XGIError("edge_ids must have one ID per edge")
+            if len(set(edge_ids)) != num_edges or any(
+                e in self._edge for e in edge_ids
+            ):
+                raise XGIError("edge_ids must be unique and not in the hypergraph")
+
+        if edge_attrs is None:
+            edge_attrs = {}
+        for name, values in edge_attrs.items():
+            if len(values) != num_edges:
+                raise XGIError(f"Attribute {name} must have one value per edge")
+
+        # the dicts are filled in bulk, which skips the checks done by IDDict
+        if None in edge_ids or (labels is not None and None in labels):
+            raise XGIError("None cannot be a node or edge")
+
+        # memberships: sort the incidences by node, keeping the order of the edges
+        order = np.argsort(indices, kind="stable")
+        nodes, starts = np.unique(indices[order], return_index=True)
+        node_bounds = np.append(starts, len(indices)).tolist()
+        memberships = [
+            edge_ids[i] for i in np.repeat(np.arange(num_edges), sizes)[order].tolist()
+        ]
+        nodes = nodes.tolist()
+        if labels is not None:
+            nodes = [labels[n] for n in nodes]
+        new_nodes = [n for n in nodes if n not in self._node]
+        dict.update(self._node, ((n, IDList()) for n in new_nodes))
+        _update_attrs(self._node_attr, ((n, {}) for n in new_nodes))
+        self._node_index.extend(new_nodes)
+        for i, n in enumerate(nodes):
+            self._node[n].extend(memberships[node_bounds[i] : node_bounds[i + 1]])
+
+        bounds = indptr.tolist()
+        edges = [members[bounds[i] : bounds[i + 1]] for i in range(num_edges)]
+        dict.update(self._edge, zip(edge_ids, map(IDList, edges)))
+        self._edge_index.extend(edge_ids)
+        lookup = self._edge_lookup
+        if lookup is not None:
+            for uid, edge in zip(edge_ids, edges):
+                lookup.setdefault(frozenset(edge), []).append(uid)
+        if self._edge_sizes is not None:
+            for uid, size in zip(edge_ids, sizes.tolist()):
+                self._edge_sizes.add(uid, size)
+
+        attrs = [self._hyperedge_attr_dict_factory() for _ in range(num_edges)]
+        for name, values in edge_attrs.items():
+            if isinstance(values, np.ndarray):
+                values = values.tolist()
+            for attr, value in zip(attrs, values):
+                attr[name] = value
+        _update_attrs(self._edge_attr, zip(edge_ids, attrs))
+
     def add_node_to_edge(self, edge, node):
         """Add one node to an existing edge.
 
@@ -732,14 +1842,20 @@ class Hypergraph:
         {'fruits': ['apple', 'banana', 'pear'], 'veggies': ['lettuce']}
 
         """
+        self._bump_version()
         if edge not in self._edge:
-            self._edge[edge] = []
+            self._edge[edge] = IDList()
             self._edge_attr[edge] = {}
+            self._edge_index.add(edge)
+        else:
+            self._unindex_edge(edge)
         if node not in self._node:
-            self._node[node] = []
+            self._node[node] = IDList()
             self._node_attr[node] = {}
+            self._node_index.add(node)
         self._edge[edge].append(node)
         self._node[node].append(edge)
+        self._index_edge(edge)
 
     def remove_edge(self, id):
         """Remove one edge.
@@ -759,10 +1875,13 @@ class Hypergraph:
         remove_edges_from : Remove multiple edges.
 
         """
-        for node in self.edges.members(id):
+        self._bump_version()
+        self._unindex_edge(id)
+        for node in self._edge[id]:
             self._node[node].remove(id)
         del self._edge[id]
         del self._edge_attr[id]
+        self._edge_index.remove(id)
 
     def remove_edges_from(self, ebunch):
         """Remove multiple edges.
@@ -781,11 +1900,14 @@ class Hypergraph:
         Will fail silently if an edge in ebunch is not in the hypergraph.
 
         """
+        self._bump_version()
         for id in ebunch:
-            for node in self.edges.members(id):
+            self._unindex_edge(id)
+            for node in self._edge[id]:
                 self._node[node].remove(id)
             del self._edge[id]
             del self._edge_attr[id]
+            self._edge_index.remove(id)
 
     def remove_node_from_edge(self, edge, node):
         """Remove a node from an existing edge.
@@ -808,22 +1930,27 @@ class Hypergraph:
         removed.
 
         """
-        self._edge[edge].remove(node)
-        self._node[node].remove(edge)
-        if len(self._edge[edge]) == 0:
-            del self._edge[edge]
-            del self._edge_attr[edge]
-
+        self._bump_version()
         try:
-            self._node[node].remove(edge)
+            members = self._edge[edge]
+        except KeyError as e:
+            raise XGIError(f"Edge {edge} not in the hypergraph") from e
+        try:
+            memberships = self._node[node]
         except KeyError as e:
             raise XGIError(f"Node {node} not in the hypergraph") from e
-        except ValueError as e:
-            raise XGIError(f"Node {node} not in edge {edge}") from e
-
-        if not self._edge[edge]:
+        if node not in members:
+            raise XGIError(f"Node {node} not in edge {edge}")
+
+        self._unindex_edge(edge)
+        members.remove(node)
+        memberships.remove(edge)
+        if members:
+            self._index_edge(edge)
+        else:
             del self._edge[edge]
             del self._edge_attr[edge]
+            self._edge_index.remove(edge)
 
     def update(self, *, edges=None, nodes=None):
         """Add nodes or edges to the hypergraph.
@@ -846,6 +1973,43 @@ class Hypergraph:
         if edges:
             self.add_edges_from(edges)
 
+    @contextmanager
+    def batch(self):
+        """Context manager to make many changes to the structure at once.
+
+        Inside the block, the changes do not maintain the indices of the edges by
+        their members and by their size, which are rebuilt once when the block
+        exits.  The changes are still applied immediately, so the hypergraph can be
+        queried as usual inside the block, and queries that need an index rebuild
+        it.  Blocks can be nested, in which case the indices are rebuilt when the
+        outermost block exits.
+
+        Examples
+        --------
+        >>> import xgi
+        >>> H = xgi.Hypergraph()
+        >>> with H.batch():
+        ...     for i in range(5):
+        ...         H.add_edge([i, i + 1])
+        ...     H.remove_node(0)
+        >>> H.has_edge([2, 1])
+        True
+        >>> H.edges(order=1)
+        EdgeView((1, 2, 3, 4))
+
+        """
+        rebuild_lookup = self._edge_lookup is not None
+        rebuild_sizes = self._edge_sizes is not None
+        self._edge_lookup = None
+        self._edge_sizes = None
+        try:
+            yield self
+        finally:
+            if rebuild_lookup:
+                self._edges_by_members()
+            if rebuild_sizes:
+                self._edges_by_size()
+
     def degree(self, nbunch=None, weight=None, order=None, dtype="dict"):
         """A DegreeView for the Hypergraph.
 
@@ -940,53 +2104,324 @@ class Hypergraph:
             Whether to remove hypergraph attributes as well
 
         """
+        self._bump_version()
         self._node.clear()
         self._node_attr.clear()
         self._edge.clear()
         self._edge_attr.clear()
+        self._edge_lookup = {}
+        self._edge_sizes = SizeIndex()
+        self._node_index.clear()
+        self._edge_index.clear()
         if hypergraph_attr:
             self._hypergraph.clear()
 
     def clear_edges(self):
         """Remove all edges from the graph without altering any nodes."""
+        self._bump_version()
         for node in self.nodes:
-            self._node[node] = {}
+            self._node[node] = IDList()
         self._edge.clear()
         self._edge_attr.clear()
+        self._edge_lookup = {}
+        self._edge_sizes = SizeIndex()
+        self._edge_index.clear()
 
-    def copy(self):
-        """A deep copy of the hypergraph.
+    @property
+    def attr_backend(self):
+        """The way node and edge attributes are stored, "dict" or "columnar".
+
+        See Also
+        --------
+        set_attr_backend
+
+        """
+        return "columnar" if isinstance(self._node_attr, ColumnarAttrs) else "dict"
+
+    def set_attr_backend(self, backend):
+        """Change the way node and edge attributes are stored.
+
+        With the "dict" backend, the default, the attributes of each node and edge
+        are stored in their own dict.  With the "columnar" backend, the values of each
+        attribute are stored in a NumPy array with one entry per node or edge, see
+        :class:`~xgi.classes.columnar.ColumnarAttrs`.  Single attributes are slower to
+        access, but weighted degrees, weighted incidence matrices, `filterby_attr`,
+        and `set_node_attributes`/`get_node_attributes` with arrays are vectorized.
+
+        Parameters
+        ----------
+        backend : str
+            "dict" or "columnar".
+
+        Raises
+        ------
+        XGIError
+            If the backend is not valid.
+
+        Notes
+        -----
+        With the "columnar" backend, `H.nodes[n]` and `H.edges[e]` return dict-like
+        views of the attributes rather than dicts.  Views of `H.nodes` and `H.edges`
+        created by filtering before the change keep using the old attributes.
+
+        Examples
+        --------
+        >>> import xgi
+        >>> import numpy as np
+        >>> H = xgi.Hypergraph([[1, 2], [2, 3, 4]])
+        >>> H.set_attr_backend("columnar")
+        >>> xgi.set_edge_attributes(H, np.array([0.5, 2.0]), name="weight")
+        >>> H.degree(weight="weight")[2]
+        2.5
+        >>> H.edges[1]
+        {'weight': 2.0}
 
-        A deep copy of the hypergraph, including node, edge, and hypergraph attributes.
+        """
+        if backend == "columnar":
+            node_attr = ColumnarAttrs((n, self._node_attr[n]) for n in self._node)
+            edge_attr = ColumnarAttrs((e, self._edge_attr[e]) for e in self._edge)
+        elif backend == "dict":
+            node_attr = AttrStore(
+                self._node,
+                (
+                    (n, self._node_attr_dict_factory(a))
+                    for n, a in self._node_attr.items()
+                    if a
+                ),
+            )
+            edge_attr = AttrStore(
+                self._edge,
+                (
+                    (e, self._hyperedge_attr_dict_factory(a))
+                    for e, a in self._edge_attr.items()
+                    if a
+                ),
+            )
+        else:
+            raise XGIError(f"Invalid attribute backend {backend}")
+        self._set_attr_stores(node_attr, edge_attr)
+
+    def _set_attr_stores(self, node_attr, edge_attr):
+        """Replace the node and edge attribute containers, also in the views."""
+        if isinstance(node_attr, AttrStore):
+            node_attr._ids = self._node
+            edge_attr._ids = self._edge
+        self._node_attr = node_attr
+        self._edge_attr = edge_attr
+        self.nodes._id_attr = node_attr
+        self.edges._id_attr = edge_attr
+
+    def copy(self, copy_on_write=False):
+        """A copy of the hypergraph.
+
+        The copy is an independent hypergraph, which can be modified, with the same
+        nodes, edges and edge IDs.  The node, edge and hypergraph attribute dicts are
+        copied, but the attribute values themselves are shared.
+
+        Parameters
+        ----------
+        copy_on_write : bool, default: False
+            If True, the memberships of nodes and members of edges are shared with
+            this hypergraph until either one of them is modified, at which point the
+            modified one copies them.  This makes copies that are only read, or
+            discarded, much cheaper.
 
         Returns
         -------
         H : Hypergraph
             A copy of the hypergraph.
 
+        Examples
+        --------
+        >>> import xgi
+        >>> H = xgi.Hypergraph([[1, 2], [2, 3, 4]])
+        >>> C = H.copy(copy_on_write=True)
+        >>> C.remove_node(2)
+        >>> C.edges.members()
+        [[1], [3, 4]]
+        >>> H.edges.members()
+        [[1, 2], [2, 3, 4]]
+
         """
-        return xgi.hypergraphviews.subhypergraph(self)
+        new = self.__class__()
+        if copy_on_write:
+            self._share_containers(new)
+            dict.update(new._node, self._node)
+            dict.update(new._edge, self._edge)
+            if self._edge_lookup is None:
+                new._edge_lookup = None
+            else:
+                new._edge_lookup.update(self._edge_lookup)
+            new._edge_sizes = self._edge_sizes
+        else:
+            dict.update(new._node, ((n, copy(m)) for n, m in self._node.items()))
+            dict.update(new._edge, ((e, copy(m)) for e, m in self._edge.items()))
+            if self._edge_lookup is None:
+                new._edge_lookup = None
+            else:
+                new._edge_lookup.update(
+                    (key, ids.copy()) for key, ids in self._edge_lookup.items()
+                )
+            if self._edge_sizes is None:
+                new._edge_sizes = None
+            else:
+                new._edge_sizes = self._edge_sizes.copy()
+        new._set_attr_stores(_copy_attrs(self._node_attr), _copy_attrs(self._edge_attr))
+        new._hypergraph.update(self._hypergraph)
+        new._node_index = self._node_index.copy()
+        new._edge_index = self._edge_index.copy()
+        new._edge_uid._count = self._edge_uid._count
+        return new
+
+    def __reduce__(self):
+        """Pickle the structure as integer arrays rather than as dicts of lists.
+
+        The members of the edges are stored as CSR arrays of node positions, and the
+        memberships of the nodes as well unless they follow the order of the edges.
+        IDs are stored once, in a range or a NumPy array when they are integers, and
+        attributes are stored by name, in NumPy arrays when possible.  The indexes of
+        the edges by members and by size are rebuilt when first needed.
 
-    def dual(self):
+        """
+        return _from_pickle_state, (self.__class__, self._pickle_state())
+
+    def _pickle_state(self):
+        """The state pickled by `__reduce__`, see `_set_pickle_state`."""
+        nodes = list(self._node_index.ids())
+        edges = list(self._edge_index.ids())
+        node_pos = self._node_index.positions()
+        edge_pos = self._edge_index.positions()
+
+        sizes = np.fromiter((len(self._edge[e]) for e in edges), int, len(edges))
+        num_incidences = int(sizes.sum())
+        dtype = _index_dtype(max(len(nodes), len(edges), num_incidences))
+        edge_indptr = np.zeros(len(edges) + 1, dtype=dtype)
+        np.cumsum(sizes, out=edge_indptr[1:])
+        edge_indices = np.fromiter(
+            map(node_pos.__getitem__, chain.from_iterable(map(self._edge.get, edges))),
+            dtype,
+            num_incidences,
+        )
+
+        # the memberships are only stored if they do not follow the order of the edges
+        node_indptr = np.zeros(len(nodes) + 1, dtype=dtype)
+        np.cumsum([len(self._node[n]) for n in nodes], out=node_indptr[1:])
+        node_indices = np.fromiter(
+            map(edge_pos.__getitem__, chain.from_iterable(map(self._node.get, nodes))),
+            dtype,
+            int(node_indptr[-1]),
+        )
+        if np.array_equal(
+            node_indptr, _memberships_indptr(edge_indices, len(nodes))
+        ) and np.array_equal(node_indices, _memberships(edge_indptr, edge_indices)):
+            node_indptr = node_indices = None
+
+        return {
+            "nodes": _id_table(nodes),
+            "edges": _id_table(edges),
+            "edge_indptr": edge_indptr,
+            "edge_indices": edge_indices,
+            "node_indptr": node_indptr,
+            "node_indices": node_indices,
+            "attr_backend": self.attr_backend,
+            "node_attr": _attr_columns(self._node_attr, nodes),
+            "edge_attr": _attr_columns(self._edge_attr, edges),
+            "hypergraph": self._hypergraph,
+            "edge_uid": self._edge_uid._count,
+        }
+
+    def _members_of(self, members):
+        """The container of the members of an edge, given as a list."""
+        return IDList._from_list(members)
+
+    def _set_pickle_state(self, state):
+        """Fill an empty hypergraph with the state made by `_pickle_state`."""
+        node_table, edge_table = state["nodes"], state["edges"]
+        nodes = _ids_of_table(node_table)
+        edges = _ids_of_table(edge_table)
+        edge_indptr = state["edge_indptr"]
+        edge_indices = state["edge_indices"]
+        node_indptr = state["node_indptr"]
+        node_indices = state["node_indices"]
+        if node_indptr is None:
+            node_indptr = _memberships_indptr(edge_indices, len(nodes))
+            node_indices = _memberships(edge_indptr, edge_indices)
+
+        _fill_from_csr(
+            self._node, nodes, node_indptr, node_indices, edge_table, IDList._from_list
+        )
+        _fill_from_csr(
+            self._edge, edges, edge_indptr, edge_indices, node_table, self._members_of
+        )
+
+        self._node_index = IDIndex(nodes)
+        self._edge_index = IDIndex(edges)
+        self._edge_lookup = None
+        self._edge_sizes = None
+        backend = state["attr_backend"]
+        self._set_attr_stores(
+            _attrs_of_columns(
+                nodes,
+                state["node_attr"],
+                backend,
+                self._node,
+                self._node_attr_dict_factory,
+            ),
+            _attrs_of_columns(
+                edges,
+                state["edge_attr"],
+                backend,
+                self._edge,
+                self._hyperedge_attr_dict_factory,
+            ),
+        )
+        self._hypergraph.update(state["hypergraph"])
+        self._edge_uid._count = state["edge_uid"]
+
+    def dual(self, deepcopy_attrs=False):
         """The dual of the hypergraph.
 
-        In the dual, nodes become edges and edges become nodes.
+        In the dual, nodes become edges and edges become nodes.  The memberships of
+        the nodes of this hypergraph are used as the members of the edges of the dual
+        and vice versa.  They are shared until either hypergraph is modified, as in a
+        copy-on-write `copy`, so the dual is independent of this hypergraph.
+
+        Parameters
+        ----------
+        deepcopy_attrs : bool, default: False
+            If True, the attributes are deep copied.  Otherwise the attribute dicts
+            are copied, but the attribute values are shared with this hypergraph.
 
         Returns
         -------
         Hypergraph
             The dual of the hypergraph.
 
+        Examples
+        --------
+        >>> import xgi
+        >>> H = xgi.Hypergraph([[1, 2], [2, 3, 4]])
+        >>> D = H.dual()
+        >>> D.edges.members(dtype=dict)
+        {1: [0], 2: [0, 1], 3: [1], 4: [1]}
+
         """
         dual = self.__class__()
-        nn = self.nodes
-        dual.add_edges_from(
-            (nn.memberships(n), n, deepcopy(attr)) for n, attr in nn.items()
+        self._share_containers(dual)
+        dict.update(dual._node, self._edge)
+        dict.update(dual._edge, self._node)
+        dual._edge_lookup = None
+        dual._edge_sizes = None
+        dual._set_attr_stores(
+            _copy_attrs(self._edge_attr, deepcopy_attrs),
+            _copy_attrs(self._node_attr, deepcopy_attrs),
         )
-        ee = self.edges
-        dual.add_nodes_from((e, deepcopy(attr)) for e, attr in ee.items())
-        dual._hypergraph = deepcopy(self._hypergraph)
-
+        if deepcopy_attrs:
+            dual._hypergraph.update(deepcopy(self._hypergraph))
+        else:
+            dual._hypergraph.update(self._hypergraph)
+        dual._node_index = self._edge_index.copy()
+        dual._edge_index = self._node_index.copy()
         return dual
 
     def max_edge_order(self):
@@ -999,7 +2434,7 @@ class Hypergraph:
 
         """
         if self._edge:
-            d_max = max(len(edge) for edge in self._edge.values()) - 1
+            d_max = max(self._edges_by_size().sizes()) - 1
         else:
             d_max = 0 if self._node else None
         return d_max
@@ -1034,10 +2469,7 @@ class Hypergraph:
 
     def remove_singleton_edges(self):
         """Removes all singletons edges from the hypergraph"""
-        singleton_ids = [
-            id_ for id_, members in self._edge.items() if len(members) == 1
-        ]
-        self.remove_edges_from(singleton_ids)
+        self.remove_edges_from(self._edges_by_size().ids(1))
 
     def isolates(self, ignore_singletons=True):
         """Nodes that belong to no edges.
@@ -1067,7 +2499,7 @@ class Hypergraph:
         """
         nodes_in_edges = set()
         for idx in self.edges:
-            edge = self.edges.members(idx)
+            edge = self.edges.members(idx, copy=False)
             if ignore_singletons and len(edge) == 1:
                 continue
             nodes_in_edges = nodes_in_edges.union(edge)
@@ -1088,22 +2520,113 @@ class Hypergraph:
         """
         self.remove_nodes_from(self.isolates(ignore_singletons))
 
-    def duplicate_edges(self):
-        """A list of all duplicate edges.
+    def duplicate_edges(self, multisets=False, ids=False):
+        """Edges with the same members as another edge.
+
+        Edges are compared by their members, regardless of their order.  This takes
+        time proportional to the total size of the edges.
+
+        Parameters
+        ----------
+        multisets : bool, default: False
+            If True, edges in which a node is repeated a different number of times
+            are not duplicates of each other.
+        ids : bool, default: False
+            If True, return a view of the IDs of the duplicated edges instead of
+            their members.
 
         Returns
         -------
-        list
-            All edges with a duplicate.
+        list or EdgeView
+            The members of each group of duplicated edges, as a tuple in the order of
+            the first edge of the group, or if `ids` is True, the view of the edges
+            with a duplicate, including the first one of each group.
 
         See also
         --------
-        remove_duplicates
+        remove_duplicate_edges
+        ~xgi.utils.utilities.unique_edges
+
+        Examples
+        --------
+        >>> import xgi
+        >>> H = xgi.Hypergraph([[1, 2], [2, 3], [2, 1], [3, 4]])
+        >>> H.duplicate_edges()
+        [(1, 2)]
+        >>> H.duplicate_edges(ids=True)
+        EdgeView((0, 2))
 
         """
-        edges = [tuple(e) for e in self._edge.values()]
-        edges_unique, counts = np.unique(edges, return_counts=True)
-        return list(edges_unique[np.where(counts > 1)])
+        groups = self._duplicate_groups(multisets)
+        if not ids:
+            return [tuple(self._edge[ids[0]]) for ids in groups]
+        ids = [id for ids in groups for id in ids]
+        return self.edges.from_view(self.edges, ids)
+
+    def _duplicate_groups(self, multisets=False):
+        """Groups of the IDs of the edges with the same members, in edge order."""
+        groups = {}
+        for id, members in self._edge.items():
+            groups.setdefault(_edge_key(members, multisets), []).append(id)
+        return [ids for ids in groups.values() if len(ids) > 1]
+
+    def remove_duplicate_edges(self, keep="first", merge_attrs=None, multisets=False):
+        """Remove the edges with the same members as another edge.
+
+        One edge of each group of duplicates is kept.
+
+        Parameters
+        ----------
+        keep : {"first", "last"}, default: "first"
+            Whether to keep the first or the last edge of each group, in the order of
+            `H.edges`.
+        merge_attrs : callable, optional
+            Function called with the list of the attribute dicts of the edges of each
+            group, in order, returning the attributes of the edge kept.  By default,
+            the kept edge keeps its own attributes.
+        multisets : bool, default: False
+            If True, edges in which a node is repeated a different number of times
+            are not duplicates of each other.
+
+        Raises
+        ------
+        XGIError
+            If `keep` is not "first" or "last".
+
+        See also
+        --------
+        duplicate_edges
+        ~xgi.utils.utilities.unique_edges
+
+        Examples
+        --------
+        Count the duplicates of each edge in its weight:
+
+        >>> import xgi
+        >>> H = xgi.Hypergraph([[1, 2], [2, 3], [2, 1], [1, 2]])
+        >>> H.remove_duplicate_edges(merge_attrs=lambda attrs: {"weight": len(attrs)})
+        >>> H.edges.members(dtype=dict)
+        {0: [1, 2], 1: [2, 3]}
+        >>> H.edges[0]
+        {'weight': 3}
+
+        """
+        if keep not in {"first", "last"}:
+            raise XGIError(f"Invalid value {keep} for keep, use 'first' or 'last'")
+        groups = self._duplicate_groups(multisets)
+        if not groups:
+            return
+        kept = 0 if keep == "first" else -1
+        if merge_attrs is not None:
+            for ids in groups:
+                merged = dict(merge_attrs([self._edge_attr[id] for id in ids]))
+                attrs = self._edge_attr[ids[kept]]
+                attrs.clear()
+                attrs.update(merged)
+        if keep == "first":
+            self.remove_edges_from(id for ids in groups for id in ids[1:])
+        else:
+            self.remove_edges_from(id for ids in groups for id in ids[:-1])
 
     def is_uniform(self):
         """Order of uniformity if the hypergraph is uniform, or False.
@@ -1130,7 +2653,7 @@ class Hypergraph:
         H is uniform!
 
         """
-        edge_sizes = {len(members) for _, members in self._edge.items()}
+        edge_sizes = set(self._edges_by_size().sizes())
         if 1 in edge_sizes:
             edge_sizes.remove(1)  # discard singleton edges
 
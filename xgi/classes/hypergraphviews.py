@@ -11,11 +11,326 @@ Note: Since hypergraphviews look like hypergraphs, one can end up with
 view-of-view-of-view chains. Be careful with chains because
 they become very slow with about 15 nested views. Often it is easiest to use .copy() to avoid chains.
 """
-
+from collections.abc import Mapping
 
 import xgi
+from xgi.classes.function import _frozen_class
+from xgi.classes.hypergraph import AttrStore, Hypergraph, IDIndex, IDList
+from xgi.classes.reportviews import EdgeView, NodeView
+from xgi.exception import IDNotFound
+from xgi.utils.utilities import ResultCache
+
+__all__ = ["SubHypergraphView", "subhypergraph"]
+
+
+def _positions(H, kind):
+    """The dict mapping the node or edge IDs of `H` to their positions in `H`."""
+    if isinstance(H, xgi.CompactHypergraph):
+        return (H._node if kind == "node" else H._edge)._pos
+    return (H._node_index if kind == "node" else H._edge_index).positions()
+
+
+class _SubNodes(Mapping):
+    """The memberships of the nodes of a SubHypergraphView, read from its parent.
+
+    The memberships of a node only hold the edges of the view.
+
+    """
+
+    __slots__ = ("_view",)
+
+    def __init__(self, view):
+        self._view = view
+
+    def _ids(self):
+        view = self._view
+        view._refresh()
+        return view._parent._node if view._nodes is None else view._nodes
+
+    def __getitem__(self, n):
+        if n not in self._ids():
+            raise IDNotFound(f"ID {n} not found")
+        view = self._view
+        memberships = view._parent._node[n]
+        if view._edges is None:
+            return memberships
+        return [e for e in memberships if e in view._edges]
+
+    def __iter__(self):
+        return iter(self._ids())
+
+    def __len__(self):
+        return len(self._ids())
+
+    def __contains__(self, n):
+        return n in self._ids()
+
+
+class _SubEdges(_SubNodes):
+    """The members of the edges of a SubHypergraphView, read from its parent."""
+
+    __slots__ = ()
+
+    def _ids(self):
+        view = self._view
+        view._refresh()
+        return view._parent._edge if view._edges is None else view._edges
+
+    def __getitem__(self, e):
+        if e not in self._ids():
+            raise IDNotFound(f"ID {e} not found")
+        return self._view._parent._edge[e]
+
+
+class _SubAttrs(Mapping):
+    """The attributes of the nodes or edges of a SubHypergraphView.
+
+    The attributes are those of the parent, so changing them through the view changes
+    them in the parent.
+
+    """
+
+    __slots__ = ("_id_dict", "_name")
+
+    def __init__(self, id_dict, name):
+        self._id_dict = id_dict
+        self._name = name  # "_node_attr" or "_edge_attr"
+
+    def __getitem__(self, id):
+        if id not in self._id_dict:
+            raise IDNotFound(f"ID {id} not found")
+        return getattr(self._id_dict._view._parent, self._name)[id]
+
+    def __iter__(self):
+        return iter(self._id_dict)
+
+    def __len__(self):
+        return len(self._id_dict)
+
+
+class _SubIndex:
+    """The positions of the nodes or edges of a SubHypergraphView.
+
+    Offers the part of the interface of :class:`~xgi.classes.hypergraph.IDIndex`
+    used to build matrices.  The positions are rebuilt when first requested after the
+    structure of the parent changes.
+
+    """
+
+    __slots__ = ("_id_dict", "_version", "_ids", "_pos")
+
+    def __init__(self, id_dict):
+        self._id_dict = id_dict
+        self._version = None
+        self._ids = ()
+        self._pos = {}
 
-__all__ = ["subhypergraph"]
+    def _update(self):
+        version = self._id_dict._view._version
+        if self._version != version:
+            self._ids = tuple(self._id_dict)
+            self._pos = {id: i for i, id in enumerate(self._ids)}
+            self._version = version
+
+    def __len__(self):
+        return len(self._id_dict)
+
+    def positions(self):
+        """The dict mapping each ID to its position."""
+        self._update()
+        return self._pos
+
+    def ids(self):
+        """A tuple of the IDs in order of position."""
+        self._update()
+        return self._ids
+
+
+@_frozen_class
+class SubHypergraphView(Hypergraph):
+    """A read-only view of the nodes and edges of a hypergraph passing filters.
+
+    The view does not copy the hypergraph: its nodes, edges, memberships and
+    attributes are read from the parent hypergraph when they are accessed, so that it
+    is created in constant time and follows the changes to the parent.  The edges of
+    the view are found the first time they are needed after the parent changes, with
+    :meth:`~xgi.classes.reportviews.EdgeView.within`, which takes time proportional
+    to the number of memberships of the nodes of the view rather than to the number
+    of edges of the parent.
+
+    Nodes, edges, memberships, degrees and matrices are accessed in the same way as
+    in a :class:`~xgi.classes.hypergraph.Hypergraph`, but no method that modifies the
+    structure can be used.  Use `copy` to get an independent hypergraph.
+
+    Parameters
+    ----------
+    H : Hypergraph
+        The parent hypergraph.
+    nodes : iterable, optional
+        The nodes of the view.  If None (default), all the nodes of `H`.
+    edges : iterable, optional
+        The edges that the view can have.  If None (default), all the edges of `H`.
+        Edges with members that are not nodes of the view are left out.
+
+    See Also
+    --------
+    subhypergraph
+
+    Notes
+    -----
+    Nodes and edges are in the order of the parent.  The node, edge and hypergraph
+    attributes are those of the parent, so that changing them through the view
+    changes them in the parent.  A view of a
+    :class:`~xgi.classes.simplicialcomplex.SimplicialComplex` only has the methods
+    of a Hypergraph, but its copy is a SimplicialComplex.
+
+    """
+
+    def __init__(self, H, nodes=None, edges=None):
+        self._parent = H
+        self._node_filter = None if nodes is None else set(nodes)
+        self._edge_filter = None if edges is None else set(edges)
+        self._nodes = None  # dict of the node IDs, or None for all the nodes of H
+        self._edges = None  # dict of the edge IDs, or None for all the edges of H
+        self._state_version = None  # version of H when they were found
+
+        self._edge_uid = H._edge_uid
+        self._hypergraph = H._hypergraph
+        self._node = _SubNodes(self)
+        self._node_attr = _SubAttrs(self._node, "_node_attr")
+        self._edge = _SubEdges(self)
+        self._edge_attr = _SubAttrs(self._edge, "_edge_attr")
+        self._edge_lookup = None
+        self._edge_sizes = None
+        self._node_index = _SubIndex(self._node)
+        self._edge_index = _SubIndex(self._edge)
+        self._cache = ResultCache()
+        self._shared = None
+
+        self.nodes = NodeView(self)
+        """A :class:`~xgi.classes.reportviews.NodeView` of the hypergraph."""
+
+        self.edges = EdgeView(self)
+        """An :class:`~xgi.classes.reportviews.EdgeView` of the hypergraph."""
+
+    @property
+    def _version(self):
+        return self._parent._version
+
+    def _refresh(self):
+        """Find the nodes and edges of the view if the parent has changed."""
+        H = self._parent
+        if self._state_version == H._version:
+            return
+        nodes = edges = None
+        if self._node_filter is not None:
+            pos = _positions(H, "node")
+            nodes = dict.fromkeys(
+                sorted((n for n in self._node_filter if n in H._node), key=pos.get)
+            )
+            edges = self._induced_edges(nodes)
+        elif self._edge_filter is not None:
+            edges = [e for e in self._edge_filter if e in H._edge]
+        if edges is not None:
+            edges = dict.fromkeys(sorted(edges, key=_positions(H, "edge").get))
+
+        self._nodes = nodes
+        self._edges = edges
+        self._edge_lookup = None
+        self._edge_sizes = None
+        self._state_version = H._version
+
+    def _induced_edges(self, nodes):
+        """The edges of the parent allowed by the edge filter with all members in
+        `nodes`."""
+        H = self._parent
+        edges = H.edges
+        if self._edge_filter is not None:
+            edges = edges.from_view(
+                edges, (e for e in self._edge_filter if e in H._edge)
+            )
+        return edges.within(nodes)
+
+    def _edges_by_members(self):
+        self._refresh()
+        return super()._edges_by_members()
+
+    def _edges_by_size(self):
+        self._refresh()
+        return super()._edges_by_size()
+
+    def _structures(self):
+        self._refresh()
+        return {
+            "node": (self._node_filter, self._nodes),
+            "edge": (self._edge_filter, self._edges),
+            "edge_lookup": (self._edge_lookup,),
+            "edge_sizes": (self._edge_sizes,),
+            "node_index": (self._node_index,),
+            "edge_index": (self._edge_index,),
+        }
+
+    @property
+    def attr_backend(self):
+        """The way node and edge attributes are stored by the parent hypergraph."""
+        return self._parent.attr_backend
+
+    def copy(self, copy_on_write=False):
+        """An independent hypergraph with the nodes, edges and attributes of the view.
+
+        The copy can be modified.  It is a Hypergraph, or a SimplicialComplex for a
+        view of a simplicial complex.  The node, edge and hypergraph attribute dicts
+        are copied, but the attribute values themselves are shared.
+
+        Parameters
+        ----------
+        copy_on_write : bool, default: False
+            Ignored, for compatibility with `Hypergraph.copy`.
+
+        Returns
+        -------
+        Hypergraph
+            A copy of the view.
+
+        """
+        root = self._parent
+        while isinstance(root, SubHypergraphView):
+            root = root._parent
+        if isinstance(root, xgi.CompactHypergraph):
+            new = Hypergraph()
+        else:
+            new = root.__class__()
+
+        dict.update(
+            new._node, ((n, IDList._from_list(list(m))) for n, m in self._node.items())
+        )
+        dict.update(
+            new._edge, ((e, new._members_of(list(m))) for e, m in self._edge.items())
+        )
+        new._edge_lookup = None
+        new._edge_sizes = None
+        new._node_index = IDIndex(self._node_index.ids())
+        new._edge_index = IDIndex(self._edge_index.ids())
+        new._set_attr_stores(
+            AttrStore(
+                new._node, ((n, dict(a)) for n, a in self._node_attr.items() if a)
+            ),
+            AttrStore(
+                new._edge, ((e, dict(a)) for e, a in self._edge_attr.items() if a)
+            ),
+        )
+        if self.attr_backend == "columnar":
+            new.set_attr_backend("columnar")
+        new._hypergraph.update(self._hypergraph)
+        new._edge_uid._count = self._edge_uid._count
+        return new
+
+    def dual(self, deepcopy_attrs=False):
+        """The dual of a copy of the view, see `Hypergraph.dual`."""
+        return self.copy().dual(deepcopy_attrs)
+
+    def __reduce__(self):
+        return self.__class__, (self._parent, self._node_filter, self._edge_filter)
 
 
 def subhypergraph(H, nodes=None, edges=None):
@@ -49,21 +364,24 @@ def subhypergraph(H, nodes=None, edges=None):
 
     Returns
     -------
-    Hypergraph object
-        A read-only hypergraph view of the input hypergraph.
-
-    """
-    new = H.__class__()
+    SubHypergraphView
+        A read-only hypergraph view of the input hypergraph, which is not copied.
+        Use its `copy` method to get a hypergraph that can be modified.
 
-    new._hypergraph = H._hypergraph
-    nodes = set(H.nodes) if nodes is None else (set(nodes) & set(H.nodes))
-    edges = set(H.edges) if edges is None else (set(edges) & set(H.edges))
+    See Also
+    --------
+    SubHypergraphView
 
-    new.add_nodes_from((uid, attr) for uid, attr in H.nodes.items() if uid in nodes)
-    new.add_edges_from(
-        (H.edges.members(uid), uid, attr)
-        for uid, attr in H.edges.items()
-        if uid in edges and set(H.edges.members(uid)).issubset(nodes)
-    )
+    Examples
+    --------
+    >>> import xgi
+    >>> H = xgi.Hypergraph([[1, 2, 3], [4], [5, 6], [6, 7, 8]])
+    >>> S = xgi.subhypergraph(H, nodes=[1, 2, 3, 4, 5])
+    >>> S.edges.members()
+    [[1, 2, 3], [4]]
+    >>> H.add_edge([1, 5])
+    >>> S.edges.members()
+    [[1, 2, 3], [4], [1, 5]]
 
-    return xgi.freeze(new)
+    """
+    return SubHypergraphView(H, nodes, edges)
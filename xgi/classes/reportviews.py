@@ -5,10 +5,12 @@ allow modification.  This module provides View classes for nodes, edges, degree,
 edge size of a hypergraph.  Views are automatically updaed when the hypergraph changes.
 
 """
+import operator
 from collections.abc import Mapping, Set
 
 import numpy as np
 
+from xgi.classes.columnar import ColumnarAttrs
 from xgi.exception import IDNotFound, XGIError
 
 __all__ = [
@@ -18,6 +20,34 @@ __all__ = [
     "EdgeSizeView",
 ]
 
+_FILTER_MODES = {
+    "eq": operator.eq,
+    "neq": operator.ne,
+    "lt": operator.lt,
+    "gt": operator.gt,
+    "leq": operator.le,
+    "geq": operator.ge,
+    "between": lambda x, val: (val[0] <= x) & (x <= val[1]),
+}
+
+
+def _copy(ids):
+    """A copy of the members of an edge or the memberships of a node."""
+    return ids.copy()
+
+
+def _read_only(ids):
+    """The members of an edge or the memberships of a node, without copying them.
+
+    Lists and frozensets are returned as they are, since they are either built on
+    request, as in compact hypergraphs, or immutable.
+
+    """
+    try:
+        return ids.view()  # IDList
+    except AttributeError:
+        return ids
+
 
 class IDView(Mapping, Set):
     """Base View class for accessing the ids (nodes or edges) of a Hypergraph.
@@ -27,6 +57,8 @@ class IDView(Mapping, Set):
 
     Parameters
     ----------
+    network : Hypergraph
+        The underlying hypergraph.
     id_dict : dict
         The original dict this is a view of.
     id_attrs : dict
@@ -41,19 +73,28 @@ class IDView(Mapping, Set):
 
     """
 
-    __slots__ = ("_id_dict", "_id_attr", "_ids")
+    __slots__ = ("_net", "_id_dict", "_id_attr", "_ids")
 
     def __getstate__(self):
         """Function that allows pickling.
 
+        The dicts of the IDs and of their attributes are not pickled when they are
+        those of the nodes or edges of the hypergraph, which is pickled with the view.
+
         Returns
         -------
         dict
-            The keys access the IDs and their attributes respectively
-            and the values are dictionarys from the Hypergraph class.
+            The keys access the hypergraph, the IDs of the view and either the kind of
+            IDs, "node" or "edge", or the dicts of the IDs and of their attributes.
 
         """
+        net = self._net
+        if net is not None and self._id_dict is net._node:
+            return {"_net": net, "_ids": self._ids, "_kind": "node"}
+        if net is not None and self._id_dict is net._edge:
+            return {"_net": net, "_ids": self._ids, "_kind": "edge"}
         return {
+            "_net": net,
             "_id_dict": self._id_dict,
             "_id_attr": self._id_attr,
             "_ids": self._ids,
@@ -65,15 +106,24 @@ class IDView(Mapping, Set):
         Parameters
         ----------
         dict
-            The keys access the IDs and their attributes respectively
-            and the values are dictionarys from the Hypergraph class.
+            The state returned by `__getstate__`.
 
         """
-        self._id_dict = state["_id_dict"]
-        self._id_attr = state["_id_attr"]
+        self._net = state["_net"]
         self._ids = state["_ids"]
+        kind = state.get("_kind")
+        if kind == "node":
+            self._id_dict = self._net._node
+            self._id_attr = self._net._node_attr
+        elif kind == "edge":
+            self._id_dict = self._net._edge
+            self._id_attr = self._net._edge_attr
+        else:
+            self._id_dict = state["_id_dict"]
+            self._id_attr = state["_id_attr"]
 
-    def __init__(self, id_dict, id_attr, ids=None):
+    def __init__(self, network, id_dict, id_attr, ids=None):
+        self._net = network
         self._id_dict = id_dict
         self._id_attr = id_attr
 
@@ -155,7 +205,74 @@ class IDView(Mapping, Set):
             A View that keeps track only of the ids in this view with the given size.
 
         """
-        bunch = [id for id in self._id_dict if len(self._id_dict[id]) == size]
+        try:
+            sizes = self._id_dict.sizes()
+        except AttributeError:
+            bunch = [id for id in self._id_dict if len(self._id_dict[id]) == size]
+        else:
+            bunch = self._id_dict._ids[sizes == size].tolist()
+        return self.from_view(self, bunch)
+
+    def filterby_attr(self, attr, val, mode="eq"):
+        """Filter the IDs by the value of an attribute.
+
+        IDs without the attribute are left out.  With the "columnar" attribute backend,
+        the comparison is done on the whole array of values at once.
+
+        Parameters
+        ----------
+        attr : hashable
+            The name of the attribute.
+        val : Any
+            The value to compare to, or a pair of bounds if `mode` is "between".
+        mode : str, default: "eq"
+            How to compare the attribute with `val`: "eq", "neq", "lt", "gt", "leq",
+            "geq", or "between", which keeps values between the bounds, inclusive.
+
+        Returns
+        -------
+        IDView
+            A view that keeps track only of the IDs in this view whose attribute
+            satisfies the condition.
+
+        Raises
+        ------
+        XGIError
+            If the mode is not valid.
+
+        Examples
+        --------
+        >>> import xgi
+        >>> H = xgi.Hypergraph([[1, 2], [2, 3, 4], [1, 4]])
+        >>> xgi.set_edge_attributes(H, {0: 0.5, 1: 2.0, 2: 1.5}, name="weight")
+        >>> H.edges.filterby_attr("weight", 1, mode="gt")
+        EdgeView((1, 2))
+
+        """
+        try:
+            compare = _FILTER_MODES[mode]
+        except KeyError:
+            raise XGIError(f"Invalid filter mode {mode}") from None
+
+        store = self._id_attr
+        if isinstance(store, ColumnarAttrs):
+            mask = store.mask(attr)
+            values = store.column(attr)
+            try:
+                mask[mask] = np.asarray(compare(values[mask], val), dtype=bool)
+            except (TypeError, ValueError):
+                pass
+            else:
+                bunch = [id for id, keep in zip(store, mask.tolist()) if keep]
+                if self._ids is not None:
+                    bunch = [id for id in bunch if id in self._ids]
+                return self.from_view(self, bunch)
+
+        bunch = [
+            id
+            for id, attrs in store.items()
+            if id in self and attr in attrs and compare(attrs[attr], val)
+        ]
         return self.from_view(self, bunch)
 
     @classmethod
@@ -179,6 +296,7 @@ class IDView(Mapping, Set):
 
         """
         newview = cls(None)
+        newview._net = view._net
         newview._id_dict = view._id_dict
         newview._id_attr = view._id_attr
         newview._ids = set(view._id_dict.keys()) if bunch is None else set(bunch)
@@ -188,6 +306,11 @@ class IDView(Mapping, Set):
 class IDDegreeView:
     """Base View class for the size (node degree or edge order) of IDs in a Hypergraph.
 
+    Degrees are computed lazily: looking up a single ID only computes its degree, and
+    the degrees of all IDs are computed when the view is iterated over.  When the
+    view belongs to a hypergraph, the unweighted degrees of all IDs are cached on the
+    hypergraph until its structure changes.
+
     Parameters
     ----------
     ids : dict
@@ -209,10 +332,24 @@ class IDDegreeView:
     dtype : str, default : dict
         Specifies the data type when __getitem__ is called. Valid choices are
         dict, list, or nparray.
+    network : Hypergraph, optional
+        The hypergraph holding the cache, by default None, meaning no caching.
+    cache_name : str, optional
+        The name under which the degrees are cached in `network`.
 
     """
 
-    __slots__ = ("_ids", "_id_attrs", "_weight")
+    __slots__ = (
+        "_ids",
+        "_id_attrs",
+        "_neighbor_ids",
+        "_bunch",
+        "_weight",
+        "_order",
+        "_dtype",
+        "_net",
+        "_cache_key",
+    )
 
     def __init__(
         self,
@@ -223,7 +360,10 @@ class IDDegreeView:
         weight=None,
         order=None,
         dtype="dict",
+        network=None,
+        cache_name=None,
     ):
+        self._ids = ids
         self._id_attrs = id_attrs
         self._neighbor_ids = neighbor_ids
         self._weight = weight
@@ -231,18 +371,23 @@ class IDDegreeView:
         if dtype not in {"dict", "list", "nparray"}:
             raise XGIError("Invalid datatype!")
         self._dtype = dtype
+        self._net = network
+        self._cache_key = (cache_name, order)
 
+        try:
+            single = id_bunch in ids
+        except TypeError:
+            single = False
         if id_bunch is None:
-            self._ids = ids
+            self._bunch = None
+        elif single:
+            self._bunch = {id_bunch: None}
         elif isinstance(id_bunch, int):
-            if id_bunch in ids:
-                self._ids = {id_bunch: ids[id_bunch]}
-            else:
-                raise XGIError("ID does not exist in the hypergraph!")
+            raise XGIError("ID does not exist in the hypergraph!")
         else:
-            self._ids = {id: val for id, val in ids.items() if id in id_bunch}
-
-        self._deg = self._get_degrees()
+            if not isinstance(id_bunch, (Set, Mapping)):
+                id_bunch = set(id_bunch)
+            self._bunch = {id: None for id in ids if id in id_bunch}
 
     def __getitem__(self, id_bunch):
         """Get the degree for an ID.
@@ -259,7 +404,9 @@ class IDDegreeView:
 
         """
         try:
-            return self._deg[id_bunch]
+            if self._bunch is not None and id_bunch not in self._bunch:
+                raise KeyError(id_bunch)
+            return self._degree(id_bunch)
         except TypeError:
             degs = {id: deg for id, deg in self if id in id_bunch}
             if self._dtype == "dict":
@@ -268,7 +415,7 @@ class IDDegreeView:
                 return list(degs.values())
             elif self._dtype == "nparray":
                 return np.array(list(degs.values()))
-        except KeyError:
+        except (KeyError, IDNotFound):
             raise XGIError("Invalid ID specified!")
 
     def __iter__(self):
@@ -280,50 +427,94 @@ class IDDegreeView:
             Each entry is an ID, degree (Weighted or unweighted) pair.
 
         """
-        for id, deg in self._deg.items():
-            yield (id, deg)
+        degrees = self._cached_degrees()
+        if degrees is None:
+            ids = self._ids if self._bunch is None else self._bunch
+            degrees = self._get_degrees(ids)
+        elif self._bunch is not None:
+            degrees = {id: degrees[id] for id in self._bunch}
+        return iter(degrees.items())
 
     def __len__(self):
         """Returns the number of IDs/degrees."""
-        return len(self._ids)
+        return len(self._ids) if self._bunch is None else len(self._bunch)
 
     def __str__(self):
         """Returns a string of IDs."""
-        return str(list(self._ids))
+        return str(list(self._ids if self._bunch is None else self._bunch))
 
     def __repr__(self):
         """A string representation of the degrees."""
         return f"{self.__class__.__name__}({dict(self)})"
 
-    def _get_degrees(self):
-        degrees = dict()
-        if self._order is None:
-            if self._weight is None:
-                for id, nbrs in self._ids.items():
-                    degrees[id] = len(nbrs)
-            else:
-                for id, nbrs in self._ids.items():
-                    degrees[id] = sum(
-                        self._id_attrs[dd].get(self._weight, 1) for dd in nbrs
-                    )
-        else:
-            if self._weight is None:
-                for id, nbrs in self._ids.items():
-                    degrees[id] = len(
-                        [
-                            i
-                            for i in nbrs
-                            if len(self._neighbor_ids[i]) == self._order + 1
-                        ]
-                    )
-            else:
-                for id, nbrs in self._ids.items():
-                    degrees[id] = sum(
-                        self._id_attrs[i].get(self._weight, 1)
-                        for i in nbrs
-                        if len(self._neighbor_ids[i]) == self._order + 1
-                    )
-        return degrees
+    def _cached_degrees(self):
+        """The degrees of all IDs if they can be cached, or None."""
+        net = self._net
+        if net is None or self._weight is not None:
+            return None
+        return net._cache.lookup(
+            self._cache_key, net._version, lambda: self._get_degrees(self._ids)
+        )
+
+    def _degree(self, id):
+        """The degree of a single ID, from the cache if it is up to date."""
+        net = self._net
+        if net is not None and self._weight is None:
+            degrees = net._cache.get(self._cache_key, net._version)
+            if degrees is not None:
+                return degrees[id]
+        return self._compute_degree(id)
+
+    def _compute_degree(self, id):
+        nbrs = self._ids[id]
+        if self._order is not None:
+            nbrs = [i for i in nbrs if len(self._neighbor_ids[i]) == self._order + 1]
+        if self._weight is None:
+            return len(nbrs)
+        return sum(self._id_attrs[i].get(self._weight, 1) for i in nbrs)
+
+    def _get_degrees(self, ids):
+        """The degrees of `ids`, a subset of the keys of the ids dict."""
+        if self._order is None and self._weight is None:
+            if ids is self._ids:
+                try:
+                    # arrays-backed ids compute all sizes at once
+                    return dict(zip(ids, ids.sizes().tolist()))
+                except AttributeError:
+                    pass
+            return {id: len(self._ids[id]) for id in ids}
+        if (
+            self._weight is not None
+            and self._order is None
+            and isinstance(self._id_attrs, ColumnarAttrs)
+        ):
+            degrees = self._columnar_degrees(ids)
+            if degrees is not None:
+                return degrees
+        return {id: self._compute_degree(id) for id in ids}
+
+    def _columnar_degrees(self, ids):
+        """The weighted degrees of `ids` computed on the array of weights.
+
+        Returns None if the weights are not all booleans or numbers.
+
+        """
+        attrs = self._id_attrs
+        weights = attrs.column(self._weight, default=1)
+        if weights.dtype.kind not in "bif":
+            return None
+        if weights.dtype.kind == "b":
+            weights = weights.astype(np.int64)
+        pos = attrs.positions()
+        counts = [len(self._ids[id]) for id in ids]
+        rows = np.fromiter(
+            (pos[i] for id in ids for i in self._ids[id]),
+            dtype=np.int64,
+            count=sum(counts),
+        )
+        degrees = np.zeros(len(counts), dtype=weights.dtype)
+        np.add.at(degrees, np.repeat(np.arange(len(counts)), counts), weights[rows])
+        return dict(zip(ids, degrees.tolist()))
 
 
 class NodeView(IDView):
@@ -340,34 +531,54 @@ class NodeView(IDView):
 
     def __init__(self, hypergraph, bunch=None):
         if hypergraph is None:
-            super().__init__(None, None, bunch)
+            super().__init__(None, None, None, bunch)
         else:
-            super().__init__(hypergraph._node, hypergraph._node_attr, bunch)
+            super().__init__(hypergraph, hypergraph._node, hypergraph._node_attr, bunch)
 
     def __call__(self, degree):
         """Return a new view that keeps track only of the nodes of the given degree."""
         return super().__call__(size=degree)
 
-    def memberships(self, n=None):
+    def memberships(self, n=None, copy=True):
         """Get the edge ids of which a node is a member.
 
         Parameters
         ----------
         n : hashable
             Node ID.
+        copy : bool, default: True
+            Whether to return new lists.  If False, the memberships are returned
+            without copying them, as read-only collections which must not be
+            modified, which is faster in loops that only read them.
 
         Returns
         -------
         list
-            Edge memberships.
+            Edge memberships.  If `copy` is False, a read-only collection of the edge
+            IDs supporting iteration, `len` and `in`, such as a view or a tuple.
 
         Raises
         ------
         XGIError
             If `n` is not hashable or if it is not in the hypergraph.
 
+        Examples
+        --------
+        >>> import xgi
+        >>> H = xgi.Hypergraph([[1, 2], [2, 3, 4]])
+        >>> H.nodes.memberships(2)
+        [0, 1]
+        >>> list(H.nodes.memberships(2, copy=False))
+        [0, 1]
+
         """
-        return self._id_dict.copy() if n is None else self._id_dict[n].copy()
+        if n is None:
+            if copy:
+                return {key: val.copy() for key, val in self._id_dict.items()}
+            return {key: _read_only(val) for key, val in self._id_dict.items()}
+        if copy:
+            return self._id_dict[n].copy()
+        return _read_only(self._id_dict[n])
 
 
 class EdgeView(IDView):
@@ -384,15 +595,20 @@ class EdgeView(IDView):
 
     def __init__(self, hypergraph, bunch=None):
         if hypergraph is None:
-            super().__init__(None, None, bunch)
+            super().__init__(None, None, None, bunch)
         else:
-            super().__init__(hypergraph._edge, hypergraph._edge_attr, bunch)
+            super().__init__(hypergraph, hypergraph._edge, hypergraph._edge_attr, bunch)
 
     def __call__(self, order):
-        """Filter the results by size."""
-        return super().__call__(size=order + 1)
+        """Return a new view that keeps track only of the edges of the given order.
+
+        The edges are looked up in the index of the edges by size kept by the
+        hypergraph, so this takes time proportional to the number of edges returned.
 
-    def members(self, e=None, dtype=list):
+        """
+        return self.from_view(self, self._net._edges_by_size().ids(order + 1))
+
+    def members(self, e=None, dtype=list, copy=True):
         """Get the node ids that are members of an edge.
 
         Parameters
@@ -401,6 +617,10 @@ class EdgeView(IDView):
             Edge ID.
         dtype : type, default list
             Specify the type of the return value.
+        copy : bool, default: True
+            Whether to return the members of each edge in a new list.  If False, they
+            are returned without copying them, as read-only collections which must
+            not be modified, which is faster in loops that only read them.
 
         Returns
         -------
@@ -409,6 +629,9 @@ class EdgeView(IDView):
         dict (if dtype is dict)
             Edge members.
 
+        If `copy` is False, the members of each edge are a read-only collection of
+        node IDs supporting iteration, `len` and `in`, such as a view or a tuple.
+
         Raises
         ------
         TypeError
@@ -419,11 +642,12 @@ class EdgeView(IDView):
             If `e` does not exist in the hypergraph
 
         """
+        get = _copy if copy else _read_only
         if e is None:
             if dtype is dict:
-                return {key: self._id_dict[key] for key in self}
+                return {key: get(self._id_dict[key]) for key in self}
             elif dtype is list:
-                return [self._id_dict[key] for key in self]
+                return [get(self._id_dict[key]) for key in self]
             else:
                 raise XGIError(f"Unrecognized dtype {dtype}")
 
@@ -431,7 +655,7 @@ class EdgeView(IDView):
             raise IDNotFound(f'ID "{e}" not in this view')
 
         try:
-            return self._id_dict[e].copy()
+            return get(self._id_dict[e])
         except IDNotFound:
             if e is None:
                 if dtype is dict:
@@ -442,6 +666,150 @@ class EdgeView(IDView):
                     raise XGIError(f"Unrecognized dtype {dtype}")
             raise IDNotFound(f"Item {e} not in this view")
 
+    def find(self, members):
+        """Get the IDs of the edges with the given members.
+
+        The lookup uses an index of the edges keyed by their set of members, so it
+        takes time proportional to the size of `members` rather than to the number of
+        edges.
+
+        Parameters
+        ----------
+        members : Iterable
+            An iterable of node IDs.
+
+        Returns
+        -------
+        list
+            IDs of the edges in this view whose set of members equals the set of
+            `members`, in insertion order.  Empty if there is no such edge.
+
+        See Also
+        --------
+        ~xgi.classes.hypergraph.Hypergraph.has_edge
+
+        Examples
+        --------
+        >>> import xgi
+        >>> H = xgi.Hypergraph([[1, 2], [2, 3, 4], [2, 1]])
+        >>> H.edges.find([1, 2])
+        [0, 2]
+        >>> H.edges.find({4, 3, 2})
+        [1]
+        >>> H.edges.find([1, 3])
+        []
+
+        """
+        try:
+            ids = self._net._edges_by_members().get(frozenset(members), [])
+        except TypeError:
+            return []
+        if self._ids is None:
+            return list(ids)
+        return [id for id in ids if id in self._ids]
+
+    def containing(self, nodes):
+        """Get the IDs of the edges that contain all the given nodes.
+
+        The memberships of the nodes are intersected, starting from the node with the
+        fewest edges, so this takes time proportional to the number of edges of that
+        node times the number of nodes, rather than to the number of edges.
+
+        Parameters
+        ----------
+        nodes : Iterable
+            An iterable of node IDs.
+
+        Returns
+        -------
+        list
+            IDs of the edges in this view whose members include all of `nodes`, in
+            the order of the memberships of the node with the fewest edges.  All the
+            edges of this view if `nodes` is empty.
+
+        Raises
+        ------
+        IDNotFound
+            If a node is not in the hypergraph.
+
+        See Also
+        --------
+        within
+        find
+
+        Examples
+        --------
+        >>> import xgi
+        >>> H = xgi.Hypergraph([[1, 2, 3], [2, 3], [3, 4], [1, 2, 3, 4]])
+        >>> H.edges.containing([2, 3])
+        [0, 1, 3]
+        >>> H.edges.containing([4, 1])
+        [3]
+
+        """
+        net = self._net
+        memberships = sorted((net._node[n] for n in set(nodes)), key=len)
+        if not memberships:
+            return list(self)
+        edges = dict.fromkeys(memberships[0])
+        for m in memberships[1:]:
+            # lists are turned into sets so that lookups take constant time
+            m = set(m) if isinstance(m, list) else m
+            edges = [e for e in edges if e in m]
+        if self._ids is None:
+            return list(edges)
+        return [e for e in edges if e in self._ids]
+
+    def within(self, nodes):
+        """Get the IDs of the edges whose members are all among the given nodes.
+
+        The edges of the nodes are counted, and an edge is kept when its count is its
+        size, so this takes time proportional to the number of memberships of the
+        nodes rather than to the number of edges.  If this view holds fewer edges
+        than there are nodes, its edges are checked directly instead.
+
+        Parameters
+        ----------
+        nodes : Iterable
+            An iterable of node IDs.  Those not in the hypergraph are ignored.
+
+        Returns
+        -------
+        list
+            IDs of the edges in this view that are subsets of `nodes`, in no
+            particular order.
+
+        See Also
+        --------
+        containing
+        ~xgi.classes.hypergraphviews.subhypergraph
+
+        Examples
+        --------
+        >>> import xgi
+        >>> H = xgi.Hypergraph([[1, 2, 3], [2, 3], [3, 4], [1, 2, 3, 4]])
+        >>> sorted(H.edges.within([1, 2, 3]))
+        [0, 1]
+        >>> H.edges.within([4, 5])
+        []
+
+        """
+        net = self._net
+        nodes = nodes if isinstance(nodes, (Set, Mapping)) else set(nodes)
+        if self._ids is not None and len(self._ids) < len(nodes):
+            return [e for e in self._ids if all(n in nodes for n in self._id_dict[e])]
+        counts = {}
+        for n in nodes:
+            if n in net._node:
+                for e in net._node[n]:
+                    counts[e] = counts.get(e, 0) + 1
+        # members repeated in an edge are repeated in the memberships too
+        return [
+            e
+            for e, count in counts.items()
+            if e in self and count == len(self._id_dict[e])
+        ]
+
 
 class DegreeView(IDDegreeView):
     """An IDDegreeView that keeps track of node degree."""
@@ -455,8 +823,26 @@ class DegreeView(IDDegreeView):
             weight=weight,
             order=order,
             dtype=dtype,
+            network=hypergraph,
+            cache_name="degree",
         )
 
+    def _get_degrees(self, ids):
+        """The degrees of `ids`, a subset of the nodes.
+
+        The unweighted degrees of all the nodes for an order are counted on the edges
+        of that order, found in the index of the edges by size, rather than on the
+        memberships of the nodes.
+
+        """
+        if self._order is None or self._weight is not None or ids is not self._ids:
+            return super()._get_degrees(ids)
+        degrees = dict.fromkeys(ids, 0)
+        for e in self._net._edges_by_size().ids(self._order + 1):
+            for n in self._neighbor_ids[e]:
+                degrees[n] += 1
+        return degrees
+
 
 class EdgeSizeView(IDDegreeView):
     """An IDDegreeView that keeps track of edge size."""
@@ -469,4 +855,6 @@ class EdgeSizeView(IDDegreeView):
             id_bunch=ebunch,
             weight=weight,
             dtype=dtype,
+            network=hypergraph,
+            cache_name="edge_size",
         )
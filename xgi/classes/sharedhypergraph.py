@@ -0,0 +1,236 @@
+"""Read-only hypergraphs in shared memory, for worker processes.
+
+Worker processes of a pool that use a hypergraph each end up with their own copy of
+it: it is pickled to each of them, or, when the workers are forked, the pages holding
+its Python objects are copied as soon as the reference counts of the objects are
+updated.  `share` instead places the CSR arrays of a
+:class:`~xgi.classes.compacthypergraph.CompactHypergraph` snapshot of the hypergraph
+in a block of `multiprocessing.shared_memory`, and returns a small handle which can
+be sent to the workers.  There, `attach` returns a CompactHypergraph whose arrays
+are views of the shared block, without copying them.
+"""
+import numpy as np
+
+from xgi.classes.compacthypergraph import CompactHypergraph, _object_array
+from xgi.classes.compacthypergraph import _RangePositions
+from xgi.classes.hypergraph import _id_table
+from xgi.exception import XGIError
+
+__all__ = ["SharedHypergraph", "share", "attach"]
+
+_ARRAYS = ("node_indptr", "node_indices", "edge_indptr", "edge_indices")
+
+
+def _shared_memory():
+    """The `multiprocessing.shared_memory` module, which needs Python 3.8."""
+    try:
+        from multiprocessing import shared_memory
+    except ImportError as e:
+        raise XGIError("Sharing hypergraphs requires Python 3.8 or later.") from e
+    return shared_memory
+
+
+class SharedHypergraph:
+    """Handle to the arrays of a read-only hypergraph in shared memory.
+
+    The handle is returned by `share` and is passed to `attach` to get the
+    hypergraph.  Pickling it only pickles the name and layout of the shared memory
+    block, the IDs that are not integers, and the attributes, so that it is cheap to
+    send to worker processes.
+
+    The process which shared the hypergraph must free the block with `unlink` once
+    the workers are done, or use the handle as a context manager, which frees the
+    block on exit.
+
+    Parameters
+    ----------
+    H : Hypergraph
+        The hypergraph to share.
+
+    See Also
+    --------
+    share
+    attach
+
+    """
+
+    def __init__(self, H):
+        C = H if isinstance(H, CompactHypergraph) else CompactHypergraph(H)
+        arrays = {name: getattr(C, f"_{name}") for name in _ARRAYS}
+
+        self._ids = {}  # "node"/"edge" -> ("range", n), ("array", n) or ("list", ids)
+        for kind, ids in (("node", C._node_ids), ("edge", C._edge_ids)):
+            table = _id_table(ids.tolist())
+            if isinstance(table, range):
+                self._ids[kind] = ("range", len(table))
+                arrays[f"{kind}_ids"] = np.arange(len(table), dtype=np.int64)
+            elif isinstance(table, np.ndarray):
+                self._ids[kind] = ("array", len(table))
+                arrays[f"{kind}_ids"] = table
+            else:
+                self._ids[kind] = ("list", table)
+
+        self._layout = {}  # name -> (dtype, length, offset)
+        offset = 0
+        for name, array in arrays.items():
+            self._layout[name] = (array.dtype.str, len(array), offset)
+            offset += -(-array.nbytes // 8) * 8  # keep the arrays aligned
+        self._shm = _shared_memory().SharedMemory(create=True, size=max(offset, 1))
+        self.name = self._shm.name
+        """The name of the shared memory block."""
+        for name, array in arrays.items():
+            self._array(name)[:] = array
+
+        self._node_attr = dict(C._node_attr._attrs)
+        self._edge_attr = dict(C._edge_attr._attrs)
+        self._hypergraph = dict(C._hypergraph)
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state["_shm"] = None  # the block is opened again by `attach`
+        return state
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.unlink()
+
+    def __repr__(self):
+        return f"{type(self).__name__}({self.name!r})"
+
+    @property
+    def nbytes(self):
+        """The size of the shared memory block, in bytes."""
+        return self._open().size
+
+    def _open(self):
+        if self._shm is None:
+            try:
+                self._shm = _shared_memory().SharedMemory(name=self.name)
+            except FileNotFoundError as e:
+                raise XGIError(f"Shared hypergraph {self.name} was unlinked") from e
+        return self._shm
+
+    def _array(self, name):
+        dtype, length, offset = self._layout[name]
+        return np.ndarray(length, dtype, buffer=self._open().buf, offset=offset)
+
+    def attach(self):
+        """The shared hypergraph, see `attach`."""
+        arrays = {name: self._array(name) for name in self._layout}
+        ids, positions = {}, {}
+        for kind, (layout, value) in self._ids.items():
+            if layout == "list":
+                ids[kind] = _object_array(value)
+            else:
+                ids[kind] = arrays[f"{kind}_ids"]
+                if layout == "range":
+                    positions[kind] = _RangePositions(value)
+
+        C = CompactHypergraph.__new__(CompactHypergraph)
+        C._from_arrays(
+            ids["node"],
+            ids["edge"],
+            *(arrays[name] for name in _ARRAYS),
+            positions.get("node"),
+            positions.get("edge"),
+        )
+        C._set_attrs(self._node_attr, self._edge_attr, self._hypergraph)
+        C._shared_memory = self._shm  # keeps the block open while C uses it
+        return C
+
+    def close(self):
+        """Close the shared memory block in this process, without freeing it.
+
+        Hypergraphs attached in this process through this handle must be deleted
+        first, since their arrays are views of the block.
+
+        """
+        if self._shm is not None:
+            self._shm.close()
+            self._shm = None
+
+    def unlink(self):
+        """Free the shared memory block.
+
+        Processes which have attached the hypergraph can keep using it, but it can no
+        longer be attached.  This should be called once, by the process which shared
+        the hypergraph.
+
+        """
+        shm = self._open()
+        shm.unlink()
+
+
+def share(H):
+    """Place a read-only snapshot of a hypergraph in shared memory.
+
+    The node and edge incidences of the hypergraph are stored as CSR arrays, as in a
+    :class:`~xgi.classes.compacthypergraph.CompactHypergraph`, in one block of
+    `multiprocessing.shared_memory`, along with the node and edge IDs when they are
+    integers.  The returned handle can be sent to worker processes, which get the
+    hypergraph with `attach`.
+
+    Parameters
+    ----------
+    H : Hypergraph
+        The hypergraph.  Later changes to it are not seen by the shared snapshot.
+
+    Returns
+    -------
+    SharedHypergraph
+        The handle of the shared hypergraph, which frees the shared memory when used
+        as a context manager or when its `unlink` method is called.
+
+    See Also
+    --------
+    attach
+    ~xgi.classes.function.freeze
+
+    Notes
+    -----
+    Attributes and IDs which are not integers are not in the shared block but in the
+    handle, so they are copied to each process that attaches the hypergraph.
+    Attaching takes constant time when the node IDs and the edge IDs are 0, ...,
+    n-1 in the order of the hypergraph, and otherwise takes time linear in the
+    number of nodes and edges to map IDs to positions.
+
+    Examples
+    --------
+    >>> import xgi
+    >>> H = xgi.Hypergraph([[0, 1, 2], [1, 3]])
+    >>> with xgi.share(H) as handle:
+    ...     C = xgi.attach(handle)  # typically in a worker process
+    ...     C.edges.members()
+    [[0, 1, 2], [1, 3]]
+
+    """
+    return SharedHypergraph(H)
+
+
+def attach(handle):
+    """The hypergraph placed in shared memory by `share`.
+
+    Parameters
+    ----------
+    handle : SharedHypergraph
+        The handle returned by `share`, or a copy of it sent to this process.
+
+    Returns
+    -------
+    CompactHypergraph
+        The hypergraph, whose incidence arrays are read-only views of the shared
+        memory, which are not copied.
+
+    Raises
+    ------
+    XGIError
+        If the shared memory has already been freed.
+
+    See Also
+    --------
+    share
+
+    """
+    return handle.attach()
@@ -10,13 +10,23 @@ from itertools import combinations
 
 from xgi import convert
 from xgi.classes import Hypergraph
+from xgi.classes.hypergraph import AttrStore, IDIndex, IDList, SizeIndex
 from xgi.classes.reportviews import NodeView, EdgeView
 from xgi.exception import XGIError
 from xgi.utils import XGICounter
+from xgi.utils.decorators import cached
+from xgi.utils.utilities import ResultCache
 
 __all__ = ["SimplicialComplex"]
 
 
+def _boundary(simplex):
+    """The faces of a simplex, given as a frozenset, with one node less."""
+    if len(simplex) < 2:
+        return []
+    return [simplex - {node} for node in simplex]
+
+
 class SimplicialComplex(Hypergraph):
     r"""A class to represent undirected simplicial complexes.
 
@@ -73,9 +83,17 @@ class SimplicialComplex(Hypergraph):
         self._edge_uid = XGICounter()
         self._hypergraph = self._hypergraph_attr_dict_factory()
         self._node = self._node_dict_factory()
-        self._node_attr = self._node_attr_dict_factory()
+        self._node_attr = AttrStore(self._node)
         self._edge = self._hyperedge_dict_factory()
-        self._edge_attr = self._hyperedge_attr_dict_factory()
+        self._edge_attr = AttrStore(self._edge)
+        self._edge_lookup = {}
+        self._edge_sizes = SizeIndex()
+        self._cofaces = None  # the Hasse diagram, built when first needed
+        self._node_index = IDIndex()
+        self._edge_index = IDIndex()
+        self._version = 0  # bumped by every change to the structure
+        self._cache = ResultCache()
+        self._shared = None
 
         self.nodes = NodeView(self)
         self.edges = EdgeView(self)
@@ -115,6 +133,18 @@ class SimplicialComplex(Hypergraph):
             "Cannot add_edges_from to SimplicialComplex, use add_simplices_from instead"
         )
 
+    def add_edges_from_arrays(self, indptr, indices, **kwargs):
+        """Cannot `add_edges_from_arrays` to SimplicialComplex, use `add_simplices_from` instead"""
+        raise XGIError(
+            "Cannot add_edges_from_arrays to SimplicialComplex, use add_simplices_from instead"
+        )
+
+    def dual(self, deepcopy_attrs=False):
+        """Cannot take the `dual` of a SimplicialComplex, convert it to a Hypergraph first"""
+        raise XGIError(
+            "Cannot take the dual of a SimplicialComplex, convert it to a Hypergraph first"
+        )
+
     def add_weighted_edges_from(self, ebunch_to_add, weight="weight", **attr):
         """Cannot `add_weighted_edges_from` to SimplicialComplex, use add_weighted_simplices_from instead"""
         raise XGIError(
@@ -157,52 +187,165 @@ class SimplicialComplex(Hypergraph):
         -----
         Currently cannot add empty edges.
         """
+        self._bump_version()
+        if not simplex:
+            raise XGIError("Cannot add an empty simplex.")
+        self._add_simplex(simplex, attr)
 
-        if not self.has_simplex(simplex):
+    def _members_of(self, members):
+        return frozenset(members)
 
-            # add simplex and its nodes
-            if simplex:
-                uid = self._edge_uid()
+    def _add_simplex(self, simplex, attr):
+        """Add a simplex with attributes `attr` and its faces, unless it is already
+        in the complex."""
+        try:
+            key = frozenset(simplex)
+        except TypeError:
+            raise XGIError("The simplex cannot be cast to a frozenset.")
+        if key in self._edges_by_members():
+            return
+        uid = self._new_simplex(simplex, key)
+        self._edge_attr[uid].update(attr)
+        self._link_cofaces([uid] + self._add_faces(simplex))
+
+    def _new_simplex(self, simplex, key, uid=None):
+        """Add a simplex which is not in the complex, without its faces, and return
+        its ID, `uid` if given and otherwise a new one."""
+        if uid is None:
+            uid = self._edge_uid()
+        for node in simplex:
+            if node not in self._node:
+                if node is None:
+                    raise ValueError("None cannot be a node")
+                self._node[node] = IDList()
+                self._node_attr[node] = {}
+                self._node_index.add(node)
+            self._node[node].append(uid)
+
+        self._edge[uid] = key
+        self._edge_attr[uid] = {}
+        self._index_edge(uid)
+        self._edge_index.add(uid)
+        return uid
+
+    def _add_faces(self, simplex):
+        """Add the faces of a simplex that are not in the complex yet, and return
+        their IDs.
+
+        The faces are enumerated depth first with a stack rather than by recursion,
+        going from each new face to its faces of one dimension less.  The faces of a
+        face already in the complex are not enumerated, since the complex is closed,
+        so each face is added once and the faces of the other simplices are never
+        visited.  The simplices get the same IDs as when recursively adding every
+        face.
+
+        """
+        lookup = self._edges_by_members()
+        stack = [tuple(simplex)]
+        first = True
+        new = []
+        while stack:
+            face = stack.pop()
+            if first:
+                first = False
             else:
-                raise XGIError("Cannot add an empty simplex.")
-            for node in simplex:
-                if node not in self._node:
-                    if node is None:
-                        raise ValueError("None cannot be a node")
-                    self._node[node] = list()
-                    self._node_attr[node] = self._node_attr_dict_factory()
-                self._node[node].append(uid)
-
-            try:
-                self._edge[uid] = frozenset(simplex)
-                self._edge_attr[uid] = self._hyperedge_attr_dict_factory()
-            except TypeError:
-                raise XGIError("The simplex cannot be cast to a frozenset.")
-
-            self._edge_attr[uid].update(attr)
-
-            # add all subfaces
-            faces = self._subfaces(simplex)
-            self.add_simplices_from(faces)
-
-    def _subfaces(self, simplex):
-        """Returns list of subfaces of simplex"""
-        size = len(simplex)
-        faces = []
-        for n in range(size, 2, -1):
-            for face in combinations(simplex, n - 1):
-                faces.append(face)
-        return faces
+                key = frozenset(face)
+                if key in lookup:
+                    continue
+                new.append(self._new_simplex(face, key))
+            if len(face) > 2:
+                stack.extend(reversed(list(combinations(face, len(face) - 1))))
+        return new
+
+    def _cofaces_index(self):
+        """The Hasse diagram of the complex, as a dict mapping the ID of each simplex
+        to the set of IDs of its cofaces, the simplices with one more node that
+        contain it.
+
+        It is built when first needed, from the faces of one node less of each
+        simplex, and is then kept up to date as simplices are added and removed.
+
+        """
+        if self._cofaces is None:
+            lookup = self._edges_by_members()
+            cofaces = {id: set() for id in self._edge}
+            for id, simplex in self._edge.items():
+                for face in _boundary(simplex):
+                    ids = lookup.get(face)
+                    if ids:
+                        cofaces[ids[0]].add(id)
+            self._cofaces = cofaces
+        return self._cofaces
+
+    def _link_cofaces(self, ids):
+        """Add new simplices to the Hasse diagram, if it has been built.
+
+        Since the complex is closed, the cofaces of a new simplex are new too, unless
+        it is a single node, so the links are found from the faces of the new
+        simplices.
+
+        """
+        cofaces = self._cofaces
+        if cofaces is None:
+            return
+        lookup = self._edges_by_members()
+        for id in ids:
+            cofaces[id] = set()
+        for id in ids:
+            simplex = self._edge[id]
+            if len(simplex) == 1:
+                (node,) = simplex
+                cofaces[id].update(
+                    e for e in self._node[node] if len(self._edge[e]) == 2
+                )
+            for face in _boundary(simplex):
+                face_ids = lookup.get(face)
+                if face_ids:
+                    cofaces[face_ids[0]].add(id)
+
+    def _unindex_edge(self, id):
+        """Remove a simplex from the indices, including the Hasse diagram."""
+        cofaces = self._cofaces
+        if cofaces is not None:
+            lookup = self._edges_by_members()
+            for face in _boundary(self._edge[id]):
+                ids = lookup.get(face)
+                if ids:
+                    cofaces[ids[0]].discard(id)
+            del cofaces[id]
+        super()._unindex_edge(id)
+
+    def _structures(self):
+        """The objects making up each structural component, see `memory_usage`."""
+        return {**super()._structures(), "cofaces": (self._cofaces,)}
 
     def _supfaces(self, simplex):
         """Returns list of simplices that contain simplex"""
 
-        return [s for s in self._edge.values() if simplex < s]
+        return [self._edge[id] for id in self._supfaces_id(simplex)]
 
     def _supfaces_id(self, simplex):
-        """Returns list of IDs of simplices that contain simplex"""
+        """Returns list of IDs of simplices that contain simplex
 
-        return [id_ for id_, s in self._edge.items() if simplex < s]
+        The cofaces of the simplex are followed in the Hasse diagram, so this takes
+        time proportional to the number of these simplices and of their cofaces.
+        Sets of nodes which are not simplices, such as nodes which were not added as
+        simplices of their own, fall back on intersecting the memberships of their
+        nodes.
+
+        """
+        ids = self._edges_by_members().get(frozenset(simplex))
+        if not ids:
+            return self.edges.containing(simplex)
+        cofaces = self._cofaces_index()
+        found = dict.fromkeys(cofaces[ids[0]])
+        supfaces = list(found)
+        for id in supfaces:  # breadth first, extending the list while iterating
+            for coface in cofaces[id]:
+                if coface not in found:
+                    found[coface] = None
+                    supfaces.append(coface)
+        return supfaces
 
     def add_simplices_from(self, ebunch_to_add, max_order=None, **attr):
         """Add all the simplices in `ebunch_to_add`.
@@ -227,6 +370,7 @@ class SimplicialComplex(Hypergraph):
         Adding the same simplex twice will add it only once. Currently
         cannot add empty simplices; the method skips over them.
         """
+        self._bump_version()
 
         if max_order != None:
             new_ebunch_to_add = []
@@ -246,29 +390,8 @@ class SimplicialComplex(Hypergraph):
             else:
                 dd = {}
 
-            if simplex and not self.has_simplex(simplex):
-                uid = self._edge_uid()
-
-                for n in simplex:
-                    if n not in self._node:
-                        if n is None:
-                            raise ValueError("None cannot be a node")
-                        self._node[n] = list()
-                        self._node_attr[n] = self._node_attr_dict_factory()
-                    self._node[n].append(uid)
-
-                try:
-                    self._edge[uid] = frozenset(simplex)
-                    self._edge_attr[uid] = self._hyperedge_attr_dict_factory()
-                except TypeError:
-                    raise XGIError("The simplex cannot be cast to a frozenset.")
-
-                self._edge_attr[uid].update(attr)
-                self._edge_attr[uid].update(dd)
-
-                # add subfaces
-                faces = self._subfaces(simplex)
-                self.add_simplices_from(faces)
+            if simplex:
+                self._add_simplex(simplex, {**attr, **dd})
 
     def close(self):
         """Adds all missing subfaces to the complex.
@@ -283,17 +406,29 @@ class SimplicialComplex(Hypergraph):
         Adding the same simplex twice will add it only once. Currently
         cannot add empty simplices; the method skips over them.
         """
-        ebunch_to_close = list(map(list, self.edges.members()))
-        for simplex in ebunch_to_close:
-            if isinstance(simplex[-1], dict):
-                dd = simplex[-1]
-                simplex = simplex[:-1]
-            else:
-                dd = {}
+        self._bump_version()
+        for simplex in list(self._edge.values()):
+            self._link_cofaces(self._add_faces(simplex))
 
-            if simplex:
-                new_faces = self._subfaces(simplex)
-                self.add_simplices_from(new_faces)
+    def clear(self, hypergraph_attr=True):
+        """Remove all nodes and simplices from the simplicial complex.
+
+        Also removes node and simplex attribues, and optionally simplicial complex
+        attributes.
+
+        Parameters
+        ----------
+        hypergraph_attr : bool, default True
+            Whether to remove simplicial complex attributes as well
+
+        """
+        super().clear(hypergraph_attr)
+        self._cofaces = None
+
+    def clear_edges(self):
+        """Remove all simplices from the simplicial complex without altering any nodes."""
+        super().clear_edges()
+        self._cofaces = None
 
     def add_weighted_simplices_from(
         self, ebunch_to_add, max_order=None, weight="weight", **attr
@@ -343,7 +478,8 @@ class SimplicialComplex(Hypergraph):
         """Remove a simplex with a given id.
 
         This also removes all simplices of which this simplex is face,
-        to preserve the simplicial complex structure.
+        to preserve the simplicial complex structure.  These are found with the Hasse
+        diagram of the complex, in time proportional to their number.
 
         Parameters
         ----------
@@ -359,6 +495,7 @@ class SimplicialComplex(Hypergraph):
         --------
         remove_edges_from : remove a collection of edges
         """
+        self._bump_version()
         try:
 
             # remove all simplices that contain simplex
@@ -366,10 +503,12 @@ class SimplicialComplex(Hypergraph):
             self.remove_simplex_ids_from(supfaces_ids)
 
             # remove simplex
-            for node in self.edges.members(id):
+            self._unindex_edge(id)
+            for node in self.edges.members(id, copy=False):
                 self._node[node].remove(id)
             del self._edge[id]
             del self._edge_attr[id]
+            self._edge_index.remove(id)
 
         except KeyError as e:
             raise XGIError(f"Simplex {id} is not in the Simplicialcomplex") from e
@@ -391,11 +530,14 @@ class SimplicialComplex(Hypergraph):
         -----
         Will fail silently if an edge in ebunch is not in the simplicial complex.
         """
+        self._bump_version()
         for id in ebunch:
-            for node in self.edges.members(id):
+            self._unindex_edge(id)
+            for node in self.edges.members(id, copy=False):
                 self._node[node].remove(id)
             del self._edge[id]
             del self._edge_attr[id]
+            self._edge_index.remove(id)
 
     def has_simplex(self, simplex):
         """Whether a simplex appears in the simplicial complex.
@@ -420,4 +562,130 @@ class SimplicialComplex(Hypergraph):
         False
 
         """
-        return set(simplex) in (set(self.edges.members(s)) for s in self.edges)
+        try:
+            return frozenset(simplex) in self._edges_by_members()
+        except TypeError:
+            return False
+
+    @cached
+    def facets(self):
+        """The maximal simplices of the simplicial complex.
+
+        Returns
+        -------
+        list
+            The IDs of the simplices which are not faces of other simplices, in the
+            order of the simplices.
+
+        See Also
+        --------
+        ~xgi.classes.function.maximal_simplices
+
+        Notes
+        -----
+        Since the complex is closed, a simplex is maximal if and only if it is not a
+        face with one node less of another simplex.  The facets are found by marking
+        these faces, or from the Hasse diagram if it has been built, in time linear
+        in the total size of the simplices.  The result is cached until the structure
+        of the complex changes.
+
+        Examples
+        --------
+        >>> import xgi
+        >>> S = xgi.SimplicialComplex([[1, 2, 3], [3, 4], [5]])
+        >>> S.facets()
+        [0, 4, 5]
+
+        """
+        if self._cofaces is not None:
+            return [id for id in self._edge if not self._cofaces[id]]
+        faces = set()
+        for simplex in self._edge.values():
+            faces.update(_boundary(simplex))
+        return [id for id, simplex in self._edge.items() if simplex not in faces]
+
+    def star(self, simplex):
+        """The simplices that contain a simplex.
+
+        Parameters
+        ----------
+        simplex : list or set
+            An iterable of hashables that specifies a simplex.  It does not need to
+            be a simplex of the complex, e.g. the star of a single node contains all
+            the simplices it belongs to.
+
+        Returns
+        -------
+        list
+            The IDs of the simplices that contain `simplex`, starting with its own ID
+            if it is in the complex.
+
+        Raises
+        ------
+        IDNotFound
+            If a node of `simplex` is not in the simplicial complex.
+
+        See Also
+        --------
+        link
+
+        Notes
+        -----
+        The simplices are found by following the cofaces of the simplex in the Hasse
+        diagram of the complex, which is built the first time it is needed.  This
+        takes time proportional to the size of the star rather than to the number of
+        simplices in the complex.
+
+        Examples
+        --------
+        >>> import xgi
+        >>> S = xgi.SimplicialComplex([[1, 2, 3], [3, 4]])
+        >>> S.edges.members(dtype=dict)
+        {0: frozenset({1, 2, 3}), 1: frozenset({1, 2}), 2: frozenset({1, 3}), 3: frozenset({2, 3}), 4: frozenset({3, 4})}
+        >>> S.star([1, 3])
+        [2, 0]
+        >>> sorted(S.star([3]))
+        [0, 2, 3, 4]
+
+        """
+        ids = self._edges_by_members().get(frozenset(simplex), [])
+        return ids[:1] + self._supfaces_id(simplex)
+
+    def link(self, simplex):
+        """The link of a simplex.
+
+        The link of a simplex is made of the simplices that do not intersect it and
+        whose union with it is a simplex of the complex.
+
+        Parameters
+        ----------
+        simplex : list or set
+            An iterable of hashables that specifies a simplex.
+
+        Returns
+        -------
+        list of frozenset
+            The simplices of the link, given by their nodes.  They include single
+            nodes even if these were not added as simplices.
+
+        Raises
+        ------
+        IDNotFound
+            If a node of `simplex` is not in the simplicial complex.
+
+        See Also
+        --------
+        star
+
+        Examples
+        --------
+        >>> import xgi
+        >>> S = xgi.SimplicialComplex([[1, 2, 3], [2, 3, 4], [3, 5]])
+        >>> S.link([2, 3])
+        [frozenset({1}), frozenset({4})]
+        >>> sorted(map(sorted, S.link([3])))
+        [[1], [1, 2], [2], [2, 4], [4], [5]]
+
+        """
+        simplex = frozenset(simplex)
+        return [self._edge[id] - simplex for id in self._supfaces_id(simplex)]
@@ -1,15 +1,17 @@
 from collections import defaultdict
 from copy import deepcopy
+from inspect import signature
 
 import networkx as nx
 import pandas as pd
 from networkx.algorithms import bipartite
+import numpy as np
 from numpy import matrix, ndarray
 from scipy.sparse import coo_matrix, csc_matrix, csr_matrix, lil_matrix
 
 import xgi
 from xgi.exception import XGIError
-from xgi.utils.utilities import get_dual
+from xgi.utils.utilities import _csr_from_codes, get_dual
 
 __all__ = [
     "convert_to_hypergraph",
@@ -130,11 +132,20 @@ def convert_to_simplicial_complex(data, create_using=None):
         xgi.empty_hypergraph(create_using)
 
     elif isinstance(data, xgi.SimplicialComplex):
-        H = xgi.empty_simplicial_complex(create_using)
-        H.add_nodes_from((n, attr) for n, attr in data.nodes.items())
+        H = xgi.empty_hypergraph(create_using, default=xgi.SimplicialComplex)
+        H.add_nodes_from((n, deepcopy(attr)) for n, attr in data.nodes.items())
+        # the simplices keep their IDs, and the complex is closed, so they are added
+        # without looking for their faces
         ee = data.edges
-        H.add_edges_from((ee.members(e), e, deepcopy(attr)) for e, attr in ee.items())
+        ids = []
+        for e, attr in ee.items():
+            members = ee.members(e)
+            ids.append(H._new_simplex(members, frozenset(members), uid=e))
+            H._edge_attr[e].update(deepcopy(attr))
+        H._link_cofaces(ids)
+        H._edge_uid._count = data._edge_uid._count
         H._hypergraph = deepcopy(data._hypergraph)
+        return H
 
     elif isinstance(data, list):
         # edge list
@@ -247,7 +258,7 @@ def to_hyperedge_dict(H):
     --------
     from_hyperedge_dict
     """
-    return deepcopy(H._edge)
+    return H.edges.members(dtype=dict)
 
 
 def from_bipartite_pandas_dataframe(
@@ -290,7 +301,7 @@ def from_bipartite_pandas_dataframe(
         try:
             columns = list(df.columns)
             d = df[[columns[node_column], columns[edge_column]]]
-        except KeyError:
+        except (KeyError, IndexError, TypeError):
             raise XGIError("Invalid columns specified")
 
     if isinstance(H, xgi.SimplicialComplex):
@@ -301,14 +312,35 @@ def from_bipartite_pandas_dataframe(
 
         H.add_simplices_from(list(simplex_list.values()))
     else:
-        for line in d.itertuples(index=False):
-            node = line[0]
-            edge = line[1]
-            H.add_node_to_edge(edge, node)
+        rows, nodes = _factorize(d.iloc[:, 0])
+        cols, edges = _factorize(d.iloc[:, 1])
+        indptr, indices = _csr_from_codes(rows, cols, len(edges))
+        H.add_edges_from_arrays(indptr, indices, node_labels=nodes, edge_ids=edges)
 
     return H
 
 
+def _factorize(column):
+    """The codes of the values of a column and its unique values, in order of
+    appearance, with missing values kept as a value.
+
+    `pandas.factorize` only keeps missing values from pandas 1.5, with
+    `use_na_sentinel`, so the values are hashed in a dict with older versions.
+
+    """
+    if "use_na_sentinel" in signature(pd.factorize).parameters:
+        codes, uniques = pd.factorize(column, use_na_sentinel=False)
+        return codes, uniques.tolist()
+    na = float("nan")
+    index = {}
+    codes = np.fromiter(
+        (index.setdefault(na if pd.isna(v) else v, len(index)) for v in column),
+        dtype=np.intp,
+        count=len(column),
+    )
+    return codes, list(index)
+
+
 def from_incidence_matrix(d, create_using=None, nodelabels=None, edgelabels=None):
     """Create a hypergraph from an incidence matrix
 
@@ -340,29 +372,32 @@ def from_incidence_matrix(d, create_using=None, nodelabels=None, edgelabels=None
     incidence_matrix
     to_incidence_matrix
     """
-    I = coo_matrix(d)
+    I = csc_matrix(d)
+    I.eliminate_zeros()
+    I.sort_indices()
     n, m = I.shape
 
     if nodelabels is None:
-        nodedict = dict(zip(range(n), range(n)))
-    elif nodelabels is not None and len(nodelabels) != n:
+        nodelabels = range(n)
+    elif len(nodelabels) != n:
         raise XGIError("Node dictionary is the wrong size.")
-    else:
-        nodedict = dict(zip(range(n), nodelabels))
 
     if edgelabels is None:
-        edgedict = dict(zip(range(m), range(m)))
-    elif edgelabels is not None and len(edgelabels) != m:
+        edgelabels = range(m)
+    elif len(edgelabels) != m:
         raise XGIError("Edge dictionary is the wrong size.")
-    else:
-        edgedict = dict(zip(range(m), edgelabels))
 
     H = xgi.empty_hypergraph(create_using)
 
-    for node, edge in zip(I.row, I.col):
-        node = nodedict[node]
-        edge = edgedict[edge]
-        H.add_node_to_edge(edge, node)
+    # empty columns are not edges
+    sizes = np.diff(I.indptr)
+    nonempty = np.flatnonzero(sizes)
+    indptr = np.zeros(len(nonempty) + 1, dtype=int)
+    np.cumsum(sizes[nonempty], out=indptr[1:])
+    edge_ids = [edgelabels[j] for j in nonempty.tolist()]
+    H.add_edges_from_arrays(
+        indptr, I.indices, node_labels=nodelabels, edge_ids=edge_ids
+    )
 
     return H
 
@@ -529,7 +564,7 @@ def to_bipartite_graph(H):
     G.add_nodes_from(node_dict.values(), bipartite=0)
     G.add_nodes_from(edge_dict.values(), bipartite=1)
     for node in H.nodes:
-        for edge in H.nodes.memberships(node):
+        for edge in H.nodes.memberships(node, copy=False):
             G.add_edge(node_dict[node], edge_dict[edge])
 
     return (
@@ -140,7 +140,7 @@ def barycenter_spring_layout(H, return_phantom_graph=False, k=None):
     G.add_nodes_from(list(H.nodes))
 
     # Adding links (edges composed by two nodes only, for which we don't use phantom nodes
-    for i, j in H.edges(order=1).members():
+    for i, j in H.edges(order=1).members(copy=False):
 
         G.add_edge(i, j)
 
@@ -149,7 +149,7 @@ def barycenter_spring_layout(H, return_phantom_graph=False, k=None):
     # Looping over the hyperedges of different order (from triples up)
     for d in range(2, H.max_edge_order() + 1):
         # Hyperedges of order d (d=2: triplets, etc.)
-        for he in H.edges(order=d).members():
+        for he in H.edges(order=d).members(copy=False):
             # Adding one phantom node for each hyperedge and linking it to the nodes of the hyperedge
             for n in he:
                 G.add_edge(phantom_node_id, n)
@@ -213,7 +213,7 @@ def weighted_barycenter_spring_layout(H, return_phantom_graph=False, k=None):
 
     # Adding links (edges composed by two nodes only, for which we don't use phantom nodes)
     d = 1
-    for i, j in H.edges(order=d).members():
+    for i, j in H.edges(order=d).members(copy=False):
         G.add_edge(i, j, weight=d)
 
     # Adding phantom nodes and connections therein
@@ -221,7 +221,8 @@ def weighted_barycenter_spring_layout(H, return_phantom_graph=False, k=None):
     # Looping over the hyperedges of different order (from triples up)
     for d in range(2, H.max_edge_order() + 1):
         # Hyperedges of order d (d=2: triplets, etc.)
-        for he_id, members in H.edges(order=d).members(dtype=dict).items():
+        edges = H.edges(order=d).members(dtype=dict, copy=False)
+        for he_id, members in edges.items():
             # Adding one phantom node for each hyperedge and linking it to the nodes of the hyperedge
             for n in members:
                 G.add_edge(phantom_node_id, n, weight=d)
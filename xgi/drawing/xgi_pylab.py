@@ -124,7 +124,7 @@ def draw(
         for d in reversed(range(1, d_max + 1)):
             if d == 1:
                 # Drawing the edges
-                for he in H.edges(order=d).members():
+                for he in H.edges(order=d).members(copy=False):
                     he = list(he)
                     x_coords = [pos[he[0]][0], pos[he[1]][0]]
                     y_coords = [pos[he[0]][1], pos[he[1]][1]]
@@ -133,7 +133,7 @@ def draw(
 
             else:
                 # Hyperedges of order d (d=1: links, etc.)
-                for he in H.edges(order=d).members():
+                for he in H.edges(order=d).members(copy=False):
                     # Filling the polygon
                     coordinates = [[pos[n][0], pos[n][1]] for n in he]
                     # Sorting the points counterclockwise (needed to have the correct filling)
@@ -154,7 +154,7 @@ def draw(
         for d in reversed(range(1, d_max + 1)):
             if d == 1:
                 # Drawing the edges
-                for he in H_.edges(order=d).members():
+                for he in H_.edges(order=d).members(copy=False):
                     he = list(he)
                     x_coords = [pos[he[0]][0], pos[he[1]][0]]
                     y_coords = [pos[he[0]][1], pos[he[1]][1]]
@@ -162,7 +162,7 @@ def draw(
                     ax.add_line(line)
             else:
                 # Hyperedges of order d (d=1: links, etc.)
-                for he in H_.edges(order=d).members():
+                for he in H_.edges(order=d).members(copy=False):
                     # Filling the polygon
                     coordinates = [[pos[n][0], pos[n][1]] for n in he]
                     # Sorting the points counterclockwise (needed to have the correct filling)
@@ -9,6 +9,7 @@ import numpy as np
 
 import xgi
 from xgi.utils import py_random_state
+from xgi.utils.utilities import _csr_from_incidences
 
 __all__ = [
     "chung_lu_hypergraph",
@@ -82,6 +83,8 @@ def chung_lu_hypergraph(k1, k2, seed=None):
     H = xgi.empty_hypergraph()
     H.add_nodes_from(Nlabels)
 
+    nodes = []
+    edges = []
     for u in Nlabels:
         j = 0
         v = Mlabels[j]  # start from beginning every time
@@ -97,10 +100,13 @@ def chung_lu_hypergraph(k1, k2, seed=None):
                 r = seed.random()
                 if r < q / p:
                     # no duplicates
-                    H.add_node_to_edge(u, v)
+                    nodes.append(v)
+                    edges.append(u)
                 p = q
                 j = j + 1
 
+    indptr, indices, node_labels, edge_ids = _csr_from_incidences(nodes, edges)
+    H.add_edges_from_arrays(indptr, indices, node_labels=node_labels, edge_ids=edge_ids)
     return H
 
 
@@ -200,6 +206,8 @@ def dcsbm_hypergraph(k1, k2, g1, g2, omega, seed=None):
     H = xgi.empty_hypergraph()
     H.add_nodes_from(Nlabels)
 
+    nodes = []
+    edges = []
     kappa1 = defaultdict(lambda: 0)
     kappa2 = defaultdict(lambda: 0)
     for id, g in g1.items():
@@ -235,9 +243,13 @@ def dcsbm_hypergraph(k1, k2, g1, g2, omega, seed=None):
                         r = seed.random()
                         if r < q / p:
                             # no duplicates
-                            H.add_node_to_edge(u, v)
+                            nodes.append(v)
+                            edges.append(u)
                         p = q
                         j = j + 1
+
+    indptr, indices, node_labels, edge_ids = _csr_from_incidences(nodes, edges)
+    H.add_edges_from_arrays(indptr, indices, node_labels=node_labels, edge_ids=edge_ids)
     return H
 
 
@@ -293,7 +305,9 @@ def random_hypergraph(N, ps, seed=None):
 
     H = xgi.empty_hypergraph()
     H.add_nodes_from(nodes)
-    H.add_edges_from(hyperedges)
+    indptr = np.cumsum([0] + [len(e) for e in hyperedges])
+    indices = np.fromiter((n for e in hyperedges for n in e), int, count=indptr[-1])
+    H.add_edges_from_arrays(indptr, indices)
 
     return H
 
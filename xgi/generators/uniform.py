@@ -1,6 +1,8 @@
 """Generate random uniform hypergraphs."""
 import warnings
 
+import numpy as np
+
 import xgi
 from xgi.utils import py_random_state
 
@@ -72,14 +74,19 @@ def uniform_hypergraph_configuration_model(k, m, seed=None):
 
     H = xgi.empty_hypergraph()
 
+    members = []
     while len(stubs) != 0:
         u = seed.sample(range(len(stubs)), m)
-        edge = []
         for index in u:
-            edge.append(stubs[index])
-        H.add_edge(edge)
+            members.append(stubs[index])
 
         for index in sorted(u, reverse=True):
             del stubs[index]
 
+    # all edges have m members
+    node_pos = {}
+    indices = np.fromiter((node_pos.setdefault(n, len(node_pos)) for n in members), int)
+    H.add_edges_from_arrays(
+        np.arange(0, len(indices) + 1, m), indices, node_labels=list(node_pos)
+    )
     return H
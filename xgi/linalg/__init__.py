@@ -1,2 +1,3 @@
-from xgi.linalg import matrix
+from xgi.linalg import homology, matrix
+from xgi.linalg.homology import *
 from xgi.linalg.matrix import *
@@ -0,0 +1,539 @@
+r"""Boundary matrices, Hodge Laplacians and homology of simplicial complexes.
+
+The simplices of order 0 are the nodes of the complex, whether or not they were
+added as simplices.  Each simplex is oriented by the order of its nodes in the
+complex, so that the boundary of the simplex with nodes :math:`v_0 < \dots < v_k` is
+:math:`\sum_i (-1)^i [v_0, \dots, \hat{v}_i, \dots, v_k]`.
+"""
+import heapq
+
+import numpy as np
+from scipy.sparse import coo_matrix, csr_matrix
+from scipy.sparse.csgraph import connected_components
+
+import xgi
+from xgi.classes.hypergraph import IndexView
+from xgi.exception import XGIError
+from xgi.utils.decorators import cached
+
+__all__ = [
+    "boundary_matrix",
+    "hodge_laplacian",
+    "betti_numbers",
+]
+
+
+def _check_complex(S):
+    if not isinstance(S, xgi.SimplicialComplex):
+        raise XGIError("The input must be a xgi.SimplicialComplex")
+
+
+def _simplices(S, order):
+    """The IDs of the simplices of an order and the positions of their nodes.
+
+    Returns
+    -------
+    ids : sequence
+        The IDs of the simplices, the nodes for order 0.
+    nodes : numpy.ndarray
+        Array of shape (len(ids), order + 1) whose rows are the positions of the
+        nodes of the simplices, in increasing order.
+
+    """
+    if order == 0:
+        ids = S._node_index.ids()
+        return ids, np.arange(len(ids), dtype=np.int64).reshape(-1, 1)
+    ids = S._edges_by_size().ids(order + 1, S._edge_index)
+    node_pos = S._node_index.positions()
+    nodes = np.fromiter(
+        (node_pos[n] for e in ids for n in S._edge[e]),
+        dtype=np.int64,
+        count=len(ids) * (order + 1),
+    ).reshape(-1, order + 1)
+    nodes.sort(axis=1)
+    return ids, nodes
+
+
+def _keys(nodes):
+    """One sortable key per row of an array of node positions.
+
+    The rows are viewed as byte strings of big-endian integers, which compare like
+    the rows themselves.
+
+    """
+    nodes = np.ascontiguousarray(nodes, dtype=">i8")
+    return nodes.view(np.dtype((np.void, 8 * nodes.shape[1]))).ravel()
+
+
+def _boundary(faces, simplices):
+    """The boundary matrix from the node positions of the faces and the simplices.
+
+    Parameters
+    ----------
+    faces : numpy.ndarray
+        The node positions of the simplices of order k - 1, as returned by
+        `_simplices`.
+    simplices : numpy.ndarray
+        The node positions of the simplices of order k.
+
+    Returns
+    -------
+    scipy.sparse.csr_matrix
+        The matrix of shape (len(faces), len(simplices)).
+
+    Raises
+    ------
+    XGIError
+        If a face of a simplex is not in `faces`.
+
+    """
+    num_simplices, size = simplices.shape
+    shape = (len(faces), num_simplices)
+    if size == 1 or num_simplices == 0:
+        return csr_matrix(shape, dtype=int)
+    # the faces without the i-th node of every simplex, with sign (-1)^i
+    boundary = np.delete(
+        np.repeat(simplices, size, axis=0),
+        np.arange(num_simplices * size) * size
+        + np.tile(np.arange(size), num_simplices),
+    ).reshape(-1, size - 1)
+    if size == 2:
+        rows = boundary.ravel()
+    else:
+        keys = _keys(faces)
+        order = np.argsort(keys)
+        keys = keys[order]
+        found = _keys(boundary)
+        pos = np.searchsorted(keys, found)
+        missing = pos == len(keys)
+        missing[~missing] = keys[pos[~missing]] != found[~missing]
+        if missing.any():
+            raise XGIError("The simplicial complex is missing faces of its simplices.")
+        rows = order[pos]
+    cols = np.repeat(np.arange(num_simplices), size)
+    signs = np.tile(1 - 2 * (np.arange(size) % 2), num_simplices)
+    return coo_matrix((signs, (rows, cols)), shape=shape).tocsr()
+
+
+@cached
+def boundary_matrix(S, order, index=False):
+    """The oriented boundary matrix of a simplicial complex, of an order.
+
+    The boundary matrix :math:`B_k` of order :math:`k` maps each simplex of order
+    :math:`k` to its faces of order :math:`k - 1`, with signs given by their
+    orientation.  The simplices of order 0 are the nodes.
+
+    Parameters
+    ----------
+    S : SimplicialComplex
+        The simplicial complex of interest.
+    order : int
+        The order of the simplices of the columns, those of the rows having order
+        `order` - 1.  Order 0 gives a matrix with no rows.
+    index : bool, default: False
+        Specifies whether to output dictionaries mapping the row and column indices to
+        the simplex IDs, which are the nodes for order 0.
+
+    Returns
+    -------
+    B : scipy.sparse.csr_matrix
+        The boundary matrix, of integers, with dimension (number of simplices of order
+        `order` - 1, number of simplices of order `order`).
+    rowdict : dict
+        The dictionary mapping indices to the IDs of the faces, if index is True.
+    coldict : dict
+        The dictionary mapping indices to the IDs of the simplices, if index is True.
+
+    Raises
+    ------
+    XGIError
+        If `S` is not a simplicial complex or lacks faces of its simplices.
+
+    Notes
+    -----
+    The simplices are oriented by the order of their nodes in the complex.  The
+    matrix is built at once from the node positions of the simplices: the faces are
+    found by sorting and searching arrays, rather than one at a time.
+
+    Examples
+    --------
+    >>> import xgi
+    >>> S = xgi.SimplicialComplex([[1, 2, 3]])
+    >>> xgi.boundary_matrix(S, 2).toarray()
+    array([[ 1],
+           [-1],
+           [ 1]])
+
+    """
+    _check_complex(S)
+    if order < 0:
+        raise XGIError("The order must be non-negative.")
+    ids, simplices = _simplices(S, order)
+    if order == 0:
+        face_ids, faces = (), np.empty((0, 0), dtype=np.int64)
+    else:
+        face_ids, faces = _simplices(S, order - 1)
+    B = _boundary(faces, simplices)
+    if index:
+        return B, IndexView(tuple(face_ids)), IndexView(tuple(ids))
+    return B
+
+
+@cached
+def hodge_laplacian(S, order, index=False):
+    """The Hodge Laplacian of a simplicial complex, of an order.
+
+    The Hodge Laplacian of order :math:`k` is
+    :math:`L_k = B_k^T B_k + B_{k+1} B_{k+1}^T`, where :math:`B_k` is the boundary
+    matrix of order :math:`k`, see [1]_.  For order 0, it is the Laplacian of the
+    graph of the nodes and the simplices of order 1.
+
+    Parameters
+    ----------
+    S : SimplicialComplex
+        The simplicial complex of interest.
+    order : int
+        The order of the simplices.
+    index : bool, default: False
+        Specifies whether to output a dictionary mapping the indices to the simplex
+        IDs, which are the nodes for order 0.
+
+    Returns
+    -------
+    L : scipy.sparse.csr_matrix
+        The Hodge Laplacian, of integers, with dimension (number of simplices of
+        order `order`, number of simplices of order `order`).
+    rowdict : dict
+        The dictionary mapping indices to simplex IDs, if index is True.
+
+    Raises
+    ------
+    XGIError
+        If `S` is not a simplicial complex or lacks faces of its simplices.
+
+    See Also
+    --------
+    boundary_matrix
+
+    References
+    ----------
+    .. [1] Schaub, M. T., Benson, A. R., Horn, P., Lippner, G., & Jadbabaie, A.
+        (2020). Random walks on simplicial complexes and the normalized Hodge
+        1-Laplacian. SIAM Review, 62(2), 353-391.
+
+    Examples
+    --------
+    >>> import xgi
+    >>> S = xgi.SimplicialComplex([[1, 2, 3], [3, 4]])
+    >>> xgi.hodge_laplacian(S, 0).toarray()
+    array([[ 2, -1, -1,  0],
+           [-1,  2, -1,  0],
+           [-1, -1,  3, -1],
+           [ 0,  0, -1,  1]])
+
+    """
+    _check_complex(S)
+    if order < 0:
+        raise XGIError("The order must be non-negative.")
+    ids, simplices = _simplices(S, order)
+    down = _boundary(_simplices(S, order - 1)[1], simplices) if order else None
+    up = _boundary(simplices, _simplices(S, order + 1)[1])
+    L = up @ up.T
+    if down is not None:
+        L = L + down.T @ down
+    L = L.tocsr()
+    if index:
+        return L, IndexView(tuple(ids))
+    return L
+
+
+# the prime modulo which ranks over the reals are computed, the largest below 2^21
+# so that dense sums of `_BLOCK` products are exact in double precision
+_PRIME = 2097143
+
+# the number of columns of the blocks of the dense elimination modulo the prime
+_BLOCK = 64
+
+# the weight of the sparsest row above which the elimination turns dense
+_DENSE_WEIGHT = 64
+
+# the largest number of bits, for Z2, or of floats, modulo the prime, of a dense
+# matrix, 128 MB
+_DENSE_SIZE = {2: 2**30, _PRIME: 2**24}
+
+
+def _rank(B, p):
+    """The rank of a sparse integer matrix over the integers modulo a prime `p`.
+
+    The matrix is reduced by sparse Gaussian elimination, pivoting on the row with
+    the fewest nonzero entries and, in that row, on the column with the fewest nonzero
+    entries, so that rows with a single entry are eliminated first and at no cost.
+    When the sparsest row has more than `_DENSE_WEIGHT` entries and the remaining
+    matrix fits in `_DENSE_SIZE`, it is reduced as a dense array instead.
+
+    Parameters
+    ----------
+    B : scipy.sparse matrix
+        The matrix.
+    p : int
+        2, or `_PRIME`.
+
+    Returns
+    -------
+    int
+        The rank.
+
+    """
+    B = B.tocsc(copy=True)
+    B.data %= p
+    B.eliminate_zeros()
+    num_rows, num_cols = B.shape
+    indptr, indices, data = B.indptr, B.indices, B.data
+    # the columns as sets of rows, or dicts mapping rows to entries, and the rows as
+    # sets of columns
+    bounds = list(zip(indptr[:-1].tolist(), indptr[1:].tolist()))
+    if p == 2:
+        cols = [set(indices[start:end].tolist()) for start, end in bounds]
+    else:
+        cols = [
+            dict(zip(indices[start:end].tolist(), data[start:end].tolist()))
+            for start, end in bounds
+        ]
+    rows = [set() for _ in range(num_rows)]
+    for j, col in enumerate(cols):
+        for i in col:
+            rows[i].add(j)
+    heap = [(len(row), i) for i, row in enumerate(rows) if row]
+    heapq.heapify(heap)
+
+    rank = 0
+    check = 0  # the rank at which to check the size of the remaining matrix
+    while heap:
+        weight, r = heapq.heappop(heap)
+        row = rows[r]
+        if len(row) != weight:
+            continue
+        if weight > _DENSE_WEIGHT and rank >= check:
+            size = sum(1 for row in rows if row) * sum(1 for col in cols if col)
+            if size <= _DENSE_SIZE[p]:
+                return rank + _dense_rank(rows, cols, p)
+            check = rank + 1000
+        c = min(row, key=lambda j: len(cols[j]))
+        pivot = cols[c]
+        cols[c] = None
+        for i in pivot:
+            rows[i].discard(c)
+        rank += 1
+        others = list(row)
+        if p == 2:
+            for j in others:
+                _add_z2(cols[j], pivot, rows, j)
+        else:
+            inverse = pow(pivot[r], p - 2, p)
+            for j in others:
+                factor = cols[j][r] * inverse % p
+                _add_mod(cols[j], pivot, factor, p, rows, j)
+        for i in pivot:
+            if rows[i]:
+                heapq.heappush(heap, (len(rows[i]), i))
+    return rank
+
+
+def _add_z2(col, pivot, rows, j):
+    """Add the column `pivot` to column `j`, `col`, over Z2, updating the rows."""
+    for i in pivot:
+        row = rows[i]
+        if i in col:
+            col.discard(i)
+            row.discard(j)
+        else:
+            col.add(i)
+            row.add(j)
+
+
+def _add_mod(col, pivot, factor, p, rows, j):
+    """Subtract `factor` times the column `pivot` from column `j`, `col`, modulo
+    `p`, updating the rows."""
+    for i, value in pivot.items():
+        row = rows[i]
+        value = (col.get(i, 0) - factor * value) % p
+        if value:
+            if i not in col:
+                row.add(j)
+            col[i] = value
+        elif i in col:
+            del col[i]
+            row.discard(j)
+
+
+def _dense_rank(rows, cols, p):
+    """The rank of what remains of a sparse elimination, as a dense array."""
+    row_ids = [i for i, row in enumerate(rows) if row]
+    col_ids = [j for j, col in enumerate(cols) if col]
+    row_pos = {i: k for k, i in enumerate(row_ids)}
+    entries = [(row_pos[i], k) for k, j in enumerate(col_ids) for i in cols[j]]
+    r, c = np.array(entries, dtype=np.int64).reshape(-1, 2).T
+    if p == 2:
+        # rows of bits packed in words
+        M = np.zeros((len(row_ids), (len(col_ids) + 63) // 64), dtype=np.uint64)
+        np.bitwise_or.at(
+            M, (r, c // 64), np.left_shift(np.uint64(1), (c % 64).astype(np.uint64))
+        )
+        return _dense_rank_z2(M, len(col_ids))
+    M = np.zeros((len(row_ids), len(col_ids)))
+    M[r, c] = [cols[j][i] for j in col_ids for i in cols[j]]
+    return _dense_rank_mod(M, p)
+
+
+def _dense_rank_z2(M, num_cols):
+    """The rank over Z2 of a matrix whose rows are packed in words, reducing it."""
+    rank = 0
+    for b in range(num_cols):
+        if rank == len(M):
+            break
+        w, mask = b // 64, np.uint64(1 << (b % 64))
+        hits = np.flatnonzero(M[rank:, w] & mask)
+        if not len(hits):
+            continue
+        pivot = rank + hits[0]
+        if pivot != rank:
+            M[[rank, pivot], w:] = M[[pivot, rank], w:]
+        others = rank + 1 + np.flatnonzero(M[rank + 1 :, w] & mask)
+        M[others, w:] ^= M[rank, w:]
+        rank += 1
+    return rank
+
+
+def _dense_rank_mod(M, p):
+    """The rank modulo a prime below 2^21 of a matrix of floats, reducing it.
+
+    The matrix is reduced by blocks of `_BLOCK` columns: each block is reduced on
+    its own, storing the multipliers below the pivots, and the rest of the matrix is
+    then updated by a single matrix product, whose sums of products below
+    :math:`p^2` stay exact in double precision.
+
+    """
+    num_rows, num_cols = M.shape
+    rank = 0
+    for start in range(0, num_cols, _BLOCK):
+        if rank == num_rows:
+            break
+        end = min(start + _BLOCK, num_cols)
+        first = rank
+        pivots = []
+        for j in range(start, end):
+            if rank == num_rows:
+                break
+            hits = np.flatnonzero(M[rank:, j])
+            if not len(hits):
+                continue
+            pivot = rank + hits[0]
+            if pivot != rank:
+                M[[rank, pivot]] = M[[pivot, rank]]
+            others = rank + 1 + np.flatnonzero(M[rank + 1 :, j])
+            if len(others):
+                factors = np.remainder(M[others, j] * pow(int(M[rank, j]), p - 2, p), p)
+                M[others, j] = factors
+                block = M[others, j + 1 : end] - factors[:, None] * M[rank, j + 1 : end]
+                M[others, j + 1 : end] = np.remainder(block, p, out=block)
+            pivots.append(j)
+            rank += 1
+        if rank == first or end == num_cols or rank == num_rows:
+            continue
+        # the rows of the pivots to the right of the block, then the rows below
+        L = M[first:rank][:, pivots]
+        U = M[first:rank, end:]
+        for i in range(1, rank - first):
+            U[i] -= L[i, :i] @ U[:i]
+            np.remainder(U[i], p, out=U[i])
+        rest = M[rank:, end:]
+        rest -= M[rank:][:, pivots] @ U
+        np.remainder(rest, p, out=rest)
+    return rank
+
+
+_fields = {"Z2": 2, "R": _PRIME}
+
+
+@cached
+def betti_numbers(S, max_order=None, field="Z2"):
+    r"""The Betti numbers of a simplicial complex.
+
+    The Betti number :math:`\beta_k` is the dimension of the homology group of order
+    :math:`k`, :math:`\beta_k = n_k - \mathrm{rank}(B_k) - \mathrm{rank}(B_{k+1})`,
+    where :math:`n_k` is the number of simplices of order :math:`k` and :math:`B_k`
+    is the boundary matrix of order :math:`k`.  :math:`\beta_0` is the number of
+    connected components, :math:`\beta_1` the number of independent cycles, and so
+    on.
+
+    Parameters
+    ----------
+    S : SimplicialComplex
+        The simplicial complex of interest.
+    max_order : int, optional
+        The highest order of the Betti numbers.  By default, the order of the largest
+        simplices.
+    field : {"Z2", "R"}, default: "Z2"
+        The field of the coefficients of the homology, integers modulo 2 or the real
+        numbers.  They give the same Betti numbers unless the homology of the complex
+        has torsion, as the real projective plane does.
+
+    Returns
+    -------
+    list of int
+        The Betti numbers of orders 0 to `max_order`, or an empty list if the complex
+        has no nodes.
+
+    Raises
+    ------
+    XGIError
+        If `S` is not a simplicial complex or lacks faces of its simplices, or if
+        `field` is not valid.
+
+    See Also
+    --------
+    boundary_matrix
+
+    Notes
+    -----
+    The rank of :math:`B_1` is the number of nodes less the number of connected
+    components.  The ranks of the other boundary matrices are computed by sparse
+    Gaussian elimination, pivoting on the sparsest rows first, which are the faces of
+    a single simplex left.  When the remaining rows are no longer sparse and fit in
+    memory, the elimination goes on with dense arrays, of bits for Z2.
+
+    The ranks over the reals are computed over the integers modulo the prime
+    :math:`p = 2097143`, so that entries do not grow.  The Betti numbers are
+    those over the reals unless the integral homology of the complex has torsion of
+    order :math:`p`.
+
+    Examples
+    --------
+    >>> import xgi
+    >>> S = xgi.SimplicialComplex([[1, 2], [2, 3], [1, 3], [4, 5, 6]])
+    >>> xgi.betti_numbers(S)
+    [2, 1, 0]
+
+    """
+    _check_complex(S)
+    if field not in _fields:
+        raise XGIError(f"field must be one of {list(_fields)}.")
+    if not S._node:
+        return []
+    if max_order is None:
+        max_order = max(S._edges_by_size().sizes(), default=1) - 1
+
+    simplices = [_simplices(S, k)[1] for k in range(max_order + 2)]
+    counts = [len(nodes) for nodes in simplices]
+    ranks = [0] * (max_order + 2)
+    # the rank of B_1 is the number of nodes less the number of components
+    edges = simplices[1]
+    graph = csr_matrix(
+        (np.ones(len(edges)), (edges[:, 0], edges[:, 1])),
+        shape=(counts[0], counts[0]),
+    )
+    ranks[1] = counts[0] - connected_components(graph, directed=False)[0]
+    for k in range(2, max_order + 2):
+        if counts[k]:
+            ranks[k] = _rank(_boundary(simplices[k - 1], simplices[k]), _fields[field])
+    return [counts[k] - ranks[k] - ranks[k + 1] for k in range(max_order + 1)]
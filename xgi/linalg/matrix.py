@@ -2,7 +2,13 @@
 from warnings import warn
 
 import numpy as np
-from scipy.sparse import csr_matrix, diags
+from scipy.sparse import csc_matrix, csr_matrix, diags
+
+import xgi
+from xgi.classes.columnar import ColumnarAttrs, _array_of
+from xgi.classes.hypergraph import IndexView
+from xgi.exception import XGIError
+from xgi.utils.decorators import cached
 
 __all__ = [
     "incidence_matrix",
@@ -12,12 +18,16 @@ __all__ = [
     "laplacian",
     "multiorder_laplacian",
     "clique_motif_matrix",
+    "estimate_matrix_memory",
 ]
 
 
-def incidence_matrix(
-    H, order=None, sparse=True, index=False, weight=lambda node, edge, H: 1
-):
+def _unit_weight(node, edge, H):
+    return 1
+
+
+@cached(volatile=("weight",))
+def incidence_matrix(H, order=None, sparse=True, index=False, weight=_unit_weight):
     """
     A function to generate a weighted incidence matrix from a Hypergraph object,
     where the rows correspond to nodes and the columns correspond to edges.
@@ -33,8 +43,11 @@ def incidence_matrix(
         Specifies whether the output matrix is a scipy sparse matrix or a numpy matrix
     index: bool, default: False
         Specifies whether to output dictionaries mapping the node and edge IDs to indices
-    weight: lambda function, default=lambda function outputting 1
-        A function specifying the weight, given a node and edge
+    weight: lambda function or str, default=lambda function outputting 1
+        A function specifying the weight, given a node, an edge and the hypergraph,
+        or the name of an edge attribute giving the weight of all the entries of
+        each edge, 1 for edges without it.  With the "columnar" attribute backend,
+        the weights of an attribute are read from its array at once.
 
     Returns
     -------
@@ -46,63 +59,103 @@ def incidence_matrix(
         The dictionary mapping indices to edge IDs, if index is True
 
     """
-    edge_ids = H.edges
-    if order is not None:
-        edge_ids = [id_ for id_, edge in H._edge.items() if len(edge) == order + 1]
-    if not edge_ids:
+    if isinstance(H, xgi.CompactHypergraph):
+        return _compact_incidence_matrix(H, order, sparse, index, weight)
+
+    if order is None:
+        edge_ids = H._edge_index.ids()
+    else:
+        edge_ids = H._edges_by_size().ids(order + 1, H._edge_index)
+    if not edge_ids or not H._node:
         return (np.array([]), {}, {}) if index else np.array([])
 
-    node_ids = H.nodes
+    node_pos = H._node_index.positions()
+    num_nodes = len(node_pos)
     num_edges = len(edge_ids)
-    num_nodes = len(node_ids)
-
-    node_dict = dict(zip(node_ids, range(num_nodes)))
-    edge_dict = dict(zip(edge_ids, range(num_edges)))
-
-    if node_dict and edge_dict:
-
-        if index:
-            rowdict = {v: k for k, v in node_dict.items()}
-            coldict = {v: k for k, v in edge_dict.items()}
-
-        if sparse:
-            # Create csr sparse matrix
-            rows = []
-            cols = []
-            data = []
-            for node in node_ids:
-                memberships = H.nodes.memberships(node)
-                # keep only those with right order
-                memberships = [i for i in memberships if i in edge_ids]
-                if len(memberships) > 0:
-                    for edge in memberships:
-                        data.append(weight(node, edge, H))
-                        rows.append(node_dict[node])
-                        cols.append(edge_dict[edge])
-                else:  # include disconnected nodes
-                    for edge in edge_ids:
-                        data.append(0)
-                        rows.append(node_dict[node])
-                        cols.append(edge_dict[edge])
-            I = csr_matrix((data, (rows, cols)))
-        else:
-            # Create an np.matrix
-            I = np.zeros((num_nodes, num_edges), dtype=int)
-            for edge in edge_ids:
-                members = H.edges.members(edge)
-                for node in members:
-                    I[node_dict[node], edge_dict[edge]] = weight(node, edge, H)
-        if index:
-            return I, rowdict, coldict
+
+    if sparse:
+        rows = [node_pos[node] for edge in edge_ids for node in H._edge[edge]]
+        indptr = np.cumsum([0] + [len(H._edge[edge]) for edge in edge_ids])
+        cols = np.repeat(np.arange(num_edges), np.diff(indptr))
+        if weight is _unit_weight:
+            data = np.ones(len(rows), dtype=int)
+        elif isinstance(weight, str):
+            data = np.repeat(_edge_weights(H, edge_ids, weight), np.diff(indptr))
         else:
-            return I
+            data = [
+                weight(node, edge, H) for edge in edge_ids for node in H._edge[edge]
+            ]
+        I = csr_matrix((data, (rows, cols)), shape=(num_nodes, num_edges))
     else:
-        if index:
-            return np.array([]), {}, {}
-        else:
-            return np.array([])
+        I = np.zeros((num_nodes, num_edges), dtype=int)
+        if isinstance(weight, str):
+            weights = _edge_weights(H, edge_ids, weight)
+            I = I.astype(np.result_type(I, weights))
+            weight = lambda node, edge, H, w=dict(zip(edge_ids, weights)): w[edge]
+        for j, edge in enumerate(edge_ids):
+            for node in H._edge[edge]:
+                I[node_pos[node], j] = weight(node, edge, H)
+
+    if index:
+        rowdict = IndexView(H._node_index.ids())
+        coldict = IndexView(edge_ids if order is None else tuple(edge_ids))
+        return I, rowdict, coldict
+    else:
+        return I
+
+
+def _compact_incidence_matrix(H, order, sparse, index, weight):
+    """Incidence matrix of a CompactHypergraph, built from its CSR arrays."""
+    num_nodes = len(H._node_ids)
+    cols = np.arange(len(H._edge_ids))
+    if order is not None:
+        cols = cols[H._edge.sizes() == order + 1]
+    if num_nodes == 0 or len(cols) == 0:
+        return (np.array([]), {}, {}) if index else np.array([])
+
+    if weight is _unit_weight:
+        data = np.ones(len(H._edge_indices), dtype=int)
+    elif isinstance(weight, str):
+        data = np.repeat(
+            _edge_weights(H, H._edge_ids.tolist(), weight), H._edge.sizes()
+        )
+    else:
+        counts = H._edge.sizes()
+        data = np.array(
+            [
+                weight(n, e, H)
+                for n, e in zip(
+                    H._node_ids[H._edge_indices], np.repeat(H._edge_ids, counts)
+                )
+            ]
+        )
+    I = csc_matrix(
+        (data, H._edge_indices, H._edge_indptr),
+        shape=(num_nodes, len(H._edge_ids)),
+    )[:, cols].tocsr()
+    I.sum_duplicates()
+    if not sparse:
+        I = I.toarray()
+
+    if index:
+        return I, IndexView(H._node_ids.tolist()), IndexView(H._edge_ids[cols].tolist())
+    return I
+
 
+def _edge_weights(H, edge_ids, name):
+    """The values of edge attribute `name` of `edge_ids` as an array, 1 by default."""
+    store = H._edge_attr
+    if isinstance(store, ColumnarAttrs):
+        weights = store.column(name, default=1)
+        if len(weights) != len(edge_ids):
+            pos = store.positions()
+            weights = weights[[pos[e] for e in edge_ids]]
+        return weights
+    no_attrs = {}
+    return _array_of([store.get(e, no_attrs).get(name, 1) for e in edge_ids])
 
+
+@cached
 def adjacency_matrix(H, order=None, s=1, weighted=False, index=False):
     """
     A function to generate an adjacency matrix (N,N) from a Hypergraph object.
@@ -150,6 +203,7 @@ def adjacency_matrix(H, order=None, s=1, weighted=False, index=False):
         return A
 
 
+@cached
 def intersection_profile(H, order=None, index=False):
     """
     A function to generate an intersection profile from a Hypergraph object.
@@ -186,6 +240,7 @@ def intersection_profile(H, order=None, index=False):
         return P
 
 
+@cached
 def degree_matrix(H, order=None, index=False):
     """Returns the degree of each node as an array
 
@@ -217,6 +272,7 @@ def degree_matrix(H, order=None, index=False):
     return (K, rowdict) if index else K
 
 
+@cached
 def laplacian(H, order=1, rescale_per_node=False, index=False):
     """Laplacian matrix of order d, see [1]_.
 
@@ -266,6 +322,7 @@ def laplacian(H, order=1, rescale_per_node=False, index=False):
         return L
 
 
+@cached
 def multiorder_laplacian(H, orders, weights, rescale_per_node=False, index=False):
     """Multiorder Laplacian matrix, see [1]_.
 
@@ -324,6 +381,7 @@ def multiorder_laplacian(H, orders, weights, rescale_per_node=False, index=False
         return L_multi
 
 
+@cached
 def clique_motif_matrix(H, index=False):
     """
     A function to generate a weighted clique motif matrix
@@ -367,3 +425,94 @@ def clique_motif_matrix(H, index=False):
         return W, rowdict
     else:
         return W
+
+
+def estimate_matrix_memory(H, matrix="incidence", order=None, sparse=True):
+    """Estimate the memory needed to build a matrix, without building it.
+
+    The estimate only depends on the number of nodes and on the number of edges of
+    each size, so it can be used to refuse to build matrices that would not fit in
+    memory.
+
+    Parameters
+    ----------
+    H : Hypergraph object
+        The hypergraph of interest.
+    matrix : {"incidence", "adjacency", "laplacian"}, default: "incidence"
+        The matrix: the one returned by `incidence_matrix`, by `adjacency_matrix` or
+        by `laplacian`, which is dense.
+    order : int, optional
+        Order of interactions to use, as in the functions building the matrices.  If
+        None (default), all orders are used, except for the Laplacian, for which the
+        default order is 1.
+    sparse : bool, default: True
+        Whether the incidence matrix is sparse.  The adjacency matrix is always
+        sparse and the Laplacian is always dense.
+
+    Returns
+    -------
+    int
+        The estimated peak number of bytes used by the arrays of the matrix and of
+        the intermediate matrices built along the way.
+
+    Raises
+    ------
+    XGIError
+        If `matrix` is not one of the supported matrices.
+
+    See Also
+    --------
+    ~xgi.classes.hypergraph.Hypergraph.memory_usage
+
+    Notes
+    -----
+    The number of nonzero entries of the adjacency matrix is bounded by the sum of
+    the squared sizes of the edges, so the estimate of its memory is an upper bound
+    when edges overlap.  The integers in the temporary lists used while building the
+    incidence matrix are not counted.
+
+    Examples
+    --------
+    >>> import xgi
+    >>> H = xgi.Hypergraph([[1, 2], [2, 3, 4]])
+    >>> xgi.estimate_matrix_memory(H, "laplacian") >= 8 * H.num_nodes**2
+    True
+
+    """
+    if matrix not in {"incidence", "adjacency", "laplacian"}:
+        raise XGIError(f"Unknown matrix {matrix}")
+    if matrix == "laplacian" and order is None:
+        order = 1
+
+    counts = H._edges_by_size().counts()
+    if order is not None:
+        counts = {order + 1: counts.get(order + 1, 0)}
+    num_nodes = H.num_nodes
+    num_edges = sum(counts.values())
+    nnz = sum(size * count for size, count in counts.items())
+    if not num_nodes or not num_edges:
+        return 8 * num_nodes**2 if matrix == "laplacian" else 0
+
+    if matrix == "incidence" and not sparse:
+        return 8 * num_nodes * num_edges
+    # the list of row positions and the COO triplets from which the int64 CSR
+    # incidence matrix is built
+    incidence = 4 * 8 * nnz + _csr_nbytes(num_nodes, nnz)
+    if matrix == "incidence":
+        return incidence
+
+    # I.dot(I.T), then A minus its diagonal and the thresholded or weighted copy
+    adjacency_nnz = min(num_nodes**2, sum(s * s * c for s, c in counts.items()))
+    adjacency = _csr_nbytes(num_nodes, nnz) + 2 * _csr_nbytes(num_nodes, adjacency_nnz)
+    adjacency = max(incidence, adjacency)
+    if matrix == "adjacency":
+        return adjacency
+
+    # diag(K), order * diag(K) and the difference with A
+    return _csr_nbytes(num_nodes, adjacency_nnz) + 3 * 8 * num_nodes**2
+
+
+def _csr_nbytes(num_rows, nnz):
+    """The bytes used by a float64 or int64 CSR matrix with `nnz` nonzero entries."""
+    index_bytes = 4 if max(num_rows, nnz) < 2**31 else 8
+    return 8 * nnz + index_bytes * (nnz + num_rows + 1)
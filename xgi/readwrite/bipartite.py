@@ -1,6 +1,7 @@
 """Read from and write to bipartite formats."""
 import xgi
 from xgi.exception import XGIError
+from xgi.utils.utilities import _csr_from_incidences
 
 __all__ = [
     "read_bipartite_edgelist",
@@ -26,7 +27,7 @@ def generate_bipartite_edgelist(H, delimiter=" "):
         Each entry is a line to be written to the output file.
     """
     for id in H.edges:
-        for node in H.edges.members(id):
+        for node in H.edges.members(id, copy=False):
             yield delimiter.join(map(str, [node, id]))
 
 
@@ -176,6 +177,8 @@ def parse_bipartite_edgelist(
     node_index = 1 if dual else 0
     edge_index = 0 if dual else 1
 
+    nodes = []
+    edges = []
     for line in lines:
         if comments is not None:
             p = line.find(comments)
@@ -210,5 +213,9 @@ def parse_bipartite_edgelist(
         else:
             edge = s[edge_index]
 
-        H.add_node_to_edge(edge, node)
+        nodes.append(node)
+        edges.append(edge)
+
+    indptr, indices, node_labels, edge_ids = _csr_from_incidences(nodes, edges)
+    H.add_edges_from_arrays(indptr, indices, node_labels=node_labels, edge_ids=edge_ids)
     return H
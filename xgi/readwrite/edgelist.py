@@ -1,4 +1,6 @@
 """Read from and write to edgelists."""
+import numpy as np
+
 import xgi
 
 __all__ = [
@@ -25,7 +27,7 @@ def generate_edgelist(H, delimiter=" "):
         Each entry is a line for the file to write.
     """
     for id in H.edges:
-        e = H.edges.members(id)
+        e = H.edges.members(id, copy=False)
         yield delimiter.join(map(str, e))
 
 
@@ -137,6 +139,9 @@ def parse_edgelist(
 
     """
     H = xgi.empty_hypergraph(create_using)
+    node_pos = {}
+    indices = []
+    indptr = [0]
     for line in lines:
         if comments is not None:
             p = line.find(comments)
@@ -152,5 +157,10 @@ def parse_edgelist(
             except Exception as e:
                 raise TypeError(f"Failed to convert nodes to type {nodetype}.") from e
 
-        H.add_edge(edge)
+        indices.extend(node_pos.setdefault(node, len(node_pos)) for node in edge)
+        indptr.append(len(indices))
+
+    H.add_edges_from_arrays(
+        indptr, np.array(indices, dtype=int), node_labels=list(node_pos)
+    )
     return H
@@ -27,12 +27,12 @@ def write_hypergraph_json(H, path):
     data["hypergraph-data"].update(H._hypergraph)
 
     # get node data
-    data["node-data"] = {str(id): H.nodes[id] for id in H.nodes}
-    data["edge-data"] = {str(id): H.edges[id] for id in H.edges}
+    data["node-data"] = {str(id): dict(attrs) for id, attrs in H.nodes.items()}
+    data["edge-data"] = {str(id): dict(attrs) for id, attrs in H.edges.items()}
 
     # hyperedge dict
     data["edge-dict"] = {
-        str(id): [str(n) for n in H.edges.members(id)] for id in H.edges
+        str(id): [str(n) for n in H.edges.members(id, copy=False)] for id in H.edges
     }
 
     datastring = json.dumps(data)
@@ -3,6 +3,7 @@ Ported from networkx
 """
 
 import collections
+import functools
 import inspect
 import re
 from contextlib import contextmanager
@@ -16,6 +17,7 @@ __all__ = [
     "np_random_state",
     "py_random_state",
     "argmap",
+    "cached",
 ]
 
 
@@ -193,6 +195,85 @@ def py_random_state(random_state_argument):
     return argmap(create_py_random_state, random_state_argument)
 
 
+def cached(func=None, *, volatile=()):
+    """Decorator to cache the results of a function of a hypergraph.
+
+    The first argument of the decorated function must be a hypergraph.  Its results
+    are cached on the hypergraph, keyed on the function and the values of all the
+    other arguments, until the structure of the hypergraph changes.  Copies of the
+    cached results are returned, so callers can modify them.
+
+    Parameters
+    ----------
+    func : function
+        The function to decorate.
+    volatile : iterable of str, optional
+        Names of arguments whose values can depend on more than the structure, such
+        as weight functions reading attributes.  Calls that do not leave these
+        arguments at their default value are not cached.
+
+    Returns
+    -------
+    wrapper : function
+        The caching function.
+
+    See Also
+    --------
+    xgi.classes.hypergraph.Hypergraph.cache_info
+    xgi.classes.hypergraph.Hypergraph.cache_clear
+
+    Examples
+    --------
+    Decorate functions like this::
+
+        @cached
+        def edge_sizes(H, order=None):
+            return [len(e) for e in H.edges.members()]
+
+    """
+    if func is None:
+        return lambda func: cached(func, volatile=volatile)
+
+    sig = inspect.signature(func)
+    defaults = {name: p.default for name, p in sig.parameters.items()}
+
+    @functools.wraps(func)
+    def wrapper(H, *args, **kwargs):
+        cache = getattr(H, "_cache", None)
+        bound = sig.bind(H, *args, **kwargs)
+        bound.apply_defaults()
+        if cache is None or any(
+            bound.arguments[name] is not defaults[name] for name in volatile
+        ):
+            return func(H, *args, **kwargs)
+
+        arguments = list(bound.arguments.items())[1:]
+        key = (func.__module__, func.__qualname__, _hashable(arguments))
+        try:
+            hash(key)
+        except TypeError:
+            return func(H, *args, **kwargs)
+        result = cache.lookup(key, H._version, lambda: func(H, *args, **kwargs))
+        return _copy_result(result)
+
+    return wrapper
+
+
+def _hashable(value):
+    """Turn lists into tuples, recursively, so that they can be part of a key."""
+    if isinstance(value, (list, tuple)):
+        return tuple(_hashable(v) for v in value)
+    return value
+
+
+def _copy_result(result):
+    """Copy the mutable parts of a cached result."""
+    if isinstance(result, (tuple, list)):
+        return type(result)(map(_copy_result, result))
+    copy = getattr(result, "copy", None)  # cheaper than catching AttributeError
+    return result if copy is None else copy()
+
+
 class argmap:
     """A decorator to apply a map to arguments before calling the function
 
@@ -1,12 +1,15 @@
 """General utilities."""
-from collections import defaultdict
+import sys
+from collections import Counter, OrderedDict, defaultdict, namedtuple
 
+import numpy as np
 import requests
+from scipy.sparse import issparse
 
 import xgi
 from xgi.exception import XGIError
 
-__all__ = ["XGICounter", "get_dual", "load_xgi_data"]
+__all__ = ["XGICounter", "get_dual", "load_xgi_data", "unique_edges"]
 
 
 class XGICounter:
@@ -41,6 +44,310 @@ class XGICounter:
         return temp
 
 
+CacheInfo = namedtuple(
+    "CacheInfo", ["hits", "misses", "maxsize", "currsize", "maxbytes", "nbytes"]
+)
+
+
+class ResultCache:
+    """Bounded LRU cache for results derived from the structure of a hypergraph.
+
+    The cache is tied to a version of the structure: when it is accessed with a
+    different version, all the entries are dropped.  Entries are evicted in least
+    recently used order when there are more than `maxsize` of them or when their
+    estimated size exceeds `maxbytes`.
+
+    Parameters
+    ----------
+    maxsize : int, default: 32
+        The maximum number of entries.
+    maxbytes : int or None, default: 2**28
+        The maximum estimated size of the entries, in bytes.  Results larger than
+        this are not cached.  If None, the size is not limited.
+
+    """
+
+    def __init__(self, maxsize=32, maxbytes=2**28):
+        self._entries = OrderedDict()  # key -> (value, nbytes)
+        self._version = None
+        self._nbytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.resize(maxsize, maxbytes)
+
+    def __len__(self):
+        return len(self._entries)
+
+    def resize(self, maxsize=32, maxbytes=2**28):
+        """Change the limits, evicting entries as needed.
+
+        Parameters
+        ----------
+        maxsize : int, default: 32
+            The maximum number of entries.  If 0, nothing is cached.
+        maxbytes : int or None, default: 2**28
+            The maximum estimated size of the entries, in bytes.  If None, the size
+            is not limited.
+
+        """
+        if maxsize < 0 or (maxbytes is not None and maxbytes < 0):
+            raise XGIError("The cache limits must be non-negative")
+        self.maxsize = maxsize
+        self.maxbytes = maxbytes
+        self._evict()
+
+    def clear(self):
+        """Remove all the entries and reset the counters."""
+        self._entries.clear()
+        self._nbytes = 0
+        self.hits = 0
+        self.misses = 0
+
+    def info(self):
+        """The statistics of the cache as a `CacheInfo` named tuple."""
+        return CacheInfo(
+            self.hits,
+            self.misses,
+            self.maxsize,
+            len(self._entries),
+            self.maxbytes,
+            self._nbytes,
+        )
+
+    def get(self, key, version, default=None):
+        """The value for `key` if it is cached for `version`, else `default`.
+
+        Unlike `lookup`, this does not count hits and misses.
+
+        """
+        if version != self._version:
+            return default
+        try:
+            value, _ = self._entries[key]
+        except KeyError:
+            return default
+        self._entries.move_to_end(key)
+        return value
+
+    def lookup(self, key, version, compute):
+        """The cached value for `key`, or the result of `compute()`, which is cached.
+
+        Parameters
+        ----------
+        key : hashable
+            The key of the result.
+        version : hashable
+            The version of the structure the result is derived from.
+        compute : callable
+            Function without arguments computing the result.
+
+        """
+        if version != self._version:
+            self._entries.clear()
+            self._nbytes = 0
+            self._version = version
+        try:
+            value, _ = self._entries[key]
+        except KeyError:
+            self.misses += 1
+            value = compute()
+            if version != self._version:
+                # `compute` changed the structure, so the result is already stale
+                return value
+            nbytes = _sizeof(value)
+            if self.maxsize and (self.maxbytes is None or nbytes <= self.maxbytes):
+                self._entries[key] = (value, nbytes)
+                self._nbytes += nbytes
+                self._evict()
+        else:
+            self.hits += 1
+            self._entries.move_to_end(key)
+        return value
+
+    def _evict(self):
+        while self._entries and (
+            len(self._entries) > self.maxsize
+            or (self.maxbytes is not None and self._nbytes > self.maxbytes)
+        ):
+            _, (_, nbytes) = self._entries.popitem(last=False)
+            self._nbytes -= nbytes
+
+
+def _sizeof(obj):
+    """Estimate the memory used by a cached result, in bytes."""
+    if isinstance(obj, np.ndarray):
+        return obj.nbytes
+    if issparse(obj):
+        return sum(
+            getattr(obj, a).nbytes
+            for a in ("data", "indices", "indptr", "row", "col", "offsets")
+            if isinstance(getattr(obj, a, None), np.ndarray)
+        )
+    if isinstance(obj, (tuple, list)):
+        return sys.getsizeof(obj) + sum(_sizeof(o) for o in obj)
+    if isinstance(obj, dict):
+        return sys.getsizeof(obj) + sum(sys.getsizeof(v) for v in obj.values())
+    return sys.getsizeof(obj)
+
+
+def _deep_sizeof(obj, seen, deep=True):
+    """Estimate the memory used by `obj` and the objects it refers to, in bytes.
+
+    Containers (dicts, lists, tuples, sets, NumPy arrays, SciPy sparse matrices and
+    instances of the classes of XGI) are always counted, and their items are visited.
+    Other objects, such as IDs and attribute values, are only counted if `deep` is
+    True.  Objects whose `id` is in `seen` are skipped, and the objects counted are
+    added to it, so that an object referred to several times is counted once.
+    Hypergraphs referred to are not counted.
+
+    """
+    if obj is None or id(obj) in seen or isinstance(obj, xgi.Hypergraph):
+        return 0
+    is_xgi = type(obj).__module__.startswith("xgi.")
+    if not (
+        deep
+        or is_xgi
+        or issparse(obj)
+        or isinstance(obj, (dict, list, tuple, set, frozenset, np.ndarray))
+    ):
+        return 0
+    seen.add(id(obj))
+    size = sys.getsizeof(obj)  # includes the data of arrays owning it
+
+    if isinstance(obj, np.ndarray):
+        if obj.base is not None:
+            size += _deep_sizeof(obj.base, seen, deep)
+        if deep and obj.dtype == object:
+            size += sum(_deep_sizeof(v, seen, deep) for v in obj.flat)
+        return size
+    if issparse(obj):
+        arrays = ("data", "indices", "indptr", "row", "col", "offsets")
+        return size + sum(
+            _deep_sizeof(getattr(obj, a, None), seen, deep) for a in arrays
+        )
+
+    if isinstance(obj, dict):
+        children = [x for item in dict.items(obj) for x in item]
+    elif isinstance(obj, (list, tuple, set, frozenset)):
+        children = obj
+    elif is_xgi:
+        children = [
+            getattr(obj, name, None)
+            for cls in type(obj).__mro__
+            for name in getattr(cls, "__slots__", ())
+        ]
+        if hasattr(obj, "__dict__"):
+            children.append(vars(obj))
+    else:
+        return size
+    return size + sum(_deep_sizeof(child, seen, deep) for child in children)
+
+
+def _csr_from_incidences(nodes, edges):
+    """Convert node-edge incidence pairs to the arrays of `add_edges_from_arrays`.
+
+    Nodes and edges are numbered in order of first appearance, and the members of
+    each edge keep the order of the pairs.
+
+    Parameters
+    ----------
+    nodes : iterable of hashables
+        The node of each incidence.
+    edges : iterable of hashables
+        The edge of each incidence.
+
+    Returns
+    -------
+    indptr, indices : numpy.ndarray
+        The CSR arrays.
+    node_labels, edge_ids : list
+        The IDs of the nodes and edges at each position.
+
+    """
+    node_pos = {}
+    edge_pos = {}
+    rows = np.fromiter((node_pos.setdefault(n, len(node_pos)) for n in nodes), int)
+    cols = np.fromiter((edge_pos.setdefault(e, len(edge_pos)) for e in edges), int)
+    indptr, indices = _csr_from_codes(rows, cols, len(edge_pos))
+    return indptr, indices, list(node_pos), list(edge_pos)
+
+
+def _csr_from_codes(rows, cols, num_edges):
+    """CSR arrays of the incidences between node `rows` and edge `cols` positions."""
+    if len(rows) != len(cols):
+        raise XGIError("The numbers of nodes and edges of the incidences differ")
+    order = np.argsort(cols, kind="stable")
+    indptr = np.zeros(num_edges + 1, dtype=int)
+    np.cumsum(np.bincount(cols, minlength=num_edges), out=indptr[1:])
+    return indptr, rows[order]
+
+
+def _edge_key(members, multisets=False):
+    """Hashable key of an edge that is equal for edges with the same members.
+
+    The order of the members does not matter.  If `multisets` is True, edges with the
+    same members repeated a different number of times get different keys.
+
+    """
+    if multisets:
+        return frozenset(Counter(members).items())
+    return frozenset(members)
+
+
+def unique_edges(edges, multisets=False, key=None):
+    """Iterate over the edges of an iterable, skipping repeated edges.
+
+    Edges are compared by their members, regardless of their order, and only the
+    first edge with given members is kept.  The edges are consumed one at a time, so
+    this can deduplicate a stream of edges while it is added to a hypergraph, storing
+    only the sets of members already seen.
+
+    Parameters
+    ----------
+    edges : iterable
+        The edges, or records containing them.
+    multisets : bool, default: False
+        If True, edges in which a node is repeated a different number of times are
+        not duplicates of each other.
+    key : callable, optional
+        Function returning the members of the edge of each record, e.g. when the
+        records also have an ID and attributes.  By default, the records are the
+        edges themselves.
+
+    Yields
+    ------
+    The records of the first edge with each set of members.
+
+    See Also
+    --------
+    ~xgi.classes.hypergraph.Hypergraph.remove_duplicate_edges
+
+    Examples
+    --------
+    >>> import xgi
+    >>> edges = [[1, 2], [2, 3], [2, 1], [1, 2, 3]]
+    >>> H = xgi.Hypergraph()
+    >>> H.add_edges_from(xgi.unique_edges(edges))
+    >>> H.edges.members()
+    [[1, 2], [2, 3], [1, 2, 3]]
+
+    With records that contain an ID and attributes:
+
+    >>> records = [([1, 2], "a", {}), ([2, 1], "b", {}), ([3, 4], "c", {})]
+    >>> H = xgi.Hypergraph()
+    >>> H.add_edges_from(xgi.unique_edges(records, key=lambda r: r[0]))
+    >>> list(H.edges)
+    ['a', 'c']
+
+    """
+    seen = set()
+    for edge in edges:
+        k = _edge_key(edge if key is None else key(edge), multisets)
+        if k not in seen:
+            seen.add(k)
+            yield edge
+
+
 def get_dual(edge_dict):
     """Given a dictionary with IDs as keys
     and lists as values, return the dual.